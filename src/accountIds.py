@@ -0,0 +1,79 @@
+"""
+Account ID Interning for Thoth
+
+Follower, resteem and community-member sets used to hold full account-name strings.
+This module maps account names to dense integer IDs for the lifetime of the process
+and represents account sets as sorted, unique NumPy uint32 arrays. Unions,
+intersections and cardinalities then run vectorized, and a 50k-follower set takes
+200 KB instead of several MB of Python strings. IDs are not persisted, so they must
+not be stored or compared across runs.
+"""
+
+import threading
+
+import numpy as np
+
+ID_DTYPE = np.uint32
+
+class AccountInterner:
+    """Maps account names to dense integer IDs within one process."""
+
+    def __init__(self):
+        """Initialize an empty interning table."""
+        self._ids = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def id_of(self, name):
+        """Return the ID of a single account name, assigning one if needed."""
+        return int(self.ids_of([name])[0])
+
+    def ids_of(self, names):
+        """
+        Return the IDs of the given account names as a sorted, unique uint32 array.
+
+        New names are assigned the next free IDs.
+        """
+        names = list(names)
+        if not names:
+            return np.empty(0, dtype=ID_DTYPE)
+        ids = self._ids
+        new_names = [name for name in set(names) if name not in ids]
+        if new_names:
+            self._assign(new_names)
+        return np.unique(np.fromiter((ids[name] for name in names), dtype=ID_DTYPE, count=len(names)))
+
+    def _assign(self, names):
+        with self._lock:
+            next_id = len(self._ids)
+            for name in names:
+                if name not in self._ids:
+                    self._ids[name] = next_id
+                    next_id += 1
+
+def union(*id_arrays):
+    """Return the union of sorted ID arrays as a sorted, unique array."""
+    arrays = [a for a in id_arrays if len(a)]
+    if not arrays:
+        return np.empty(0, dtype=ID_DTYPE)
+    if len(arrays) == 1:
+        return arrays[0]
+    return np.unique(np.concatenate(arrays))
+
+def intersection(a, b):
+    """Return the intersection of two sorted, unique ID arrays."""
+    return np.intersect1d(a, b, assume_unique=True)
+
+_default_interner = None
+_default_interner_lock = threading.Lock()
+
+def get_interner():
+    """Return the shared, process-wide AccountInterner."""
+    global _default_interner
+    if _default_interner is None:
+        with _default_interner_lock:
+            if _default_interner is None:
+                _default_interner = AccountInterner()
+    return _default_interner
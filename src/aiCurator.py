@@ -10,6 +10,9 @@ from pathlib import Path
 from modelManager import ModelManager
 from promptHelper import construct_messages
 from localization import Localization
+from llmCache import cache_key, get_llm_cache
+from llmTransport import get_llm_transport
+from llmStream import read_streamed_completion
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -36,6 +39,14 @@ MAX_RETRIES = int(config.get('LLM', 'MAX_RETRIES', fallback=3))
 INITIAL_BACKOFF_SECONDS = float(config.get('LLM', 'INITIAL_BACKOFF_SECONDS', fallback=2.0))
 JITTER_FACTOR = float(config.get('LLM', 'JITTER_FACTOR', fallback=0.2))
 
+# Stream completions and stop reading as soon as the verdict is known
+try:
+    LLM_STREAMING = config.getboolean('LLM', 'LLM_STREAMING', fallback=False)
+except ValueError:
+    LLM_STREAMING = False
+STOP_MARKER = "END_OF_CURATION_REPORT"
+REJECTION_VERDICT = "DO NOT CURATE"
+
 def ensurePromptFileExists(promptFilePath, templateFilePath, promptTypeName):
     """Checks if a prompt file exists, and copies from template if not."""
     if not Path(promptFilePath).exists():
@@ -59,7 +70,7 @@ def ensurePromptFileExists(promptFilePath, templateFilePath, promptTypeName):
 ensurePromptFileExists(systemPromptFile, systemPromptTemplateFile, "System")
 ensurePromptFileExists(userPromptFile, userPromptTemplateFile, "User")
 
-def aicurate(llmKey, llmModel, llmUrl, postBody, maxTokens=8192, model_manager=None, enable_switching=False, dry_run=False, author="", permlink=""):
+def aicurate(llmKey, llmModel, llmUrl, postBody, maxTokens=8192, model_manager=None, enable_switching=False, dry_run=False, author="", permlink="", use_cache=True, stream=None):
     """
     Curate a post using the AI API.
     
@@ -72,6 +83,10 @@ def aicurate(llmKey, llmModel, llmUrl, postBody, maxTokens=8192, model_manager=N
         model_manager: Optional ModelManager instance for handling multiple models
         author: Optional author name for debugging/logging
         permlink: Optional permlink for debugging/logging
+        use_cache: If True, reuse a cached response for the same model, prompts, language
+                   and post body (see llmCache.py) and cache new responses
+        stream: If True, stream the completion and stop reading as soon as the rejection
+                verdict or the stop marker appears (defaults to LLM_STREAMING)
         
     Returns:
         str: The AI curation response or error message
@@ -92,6 +107,8 @@ def aicurate(llmKey, llmModel, llmUrl, postBody, maxTokens=8192, model_manager=N
         logging.error(f"System prompt file not found: {systemPromptFile}")
         return "System Prompt File Error"
 
+    # The cache key uses the prompt without the date, so responses are reused across days
+    cacheSystemPrompt = systemPrompt
     systemPrompt += f"\n\n{loc.get('today_is', date=today.strftime('%Y-%m-%d'))}\n" # Correctly format and append today's date
 
     try:
@@ -111,6 +128,11 @@ def aicurate(llmKey, llmModel, llmUrl, postBody, maxTokens=8192, model_manager=N
         logging.error("aicurate: Received an empty or whitespace-only postBody. Cannot proceed.")
         return "Content Error - Empty Body"
 
+    response_cache = get_llm_cache() if use_cache else None
+    if stream is None:
+        stream = LLM_STREAMING
+    cacheBody = postBody
+
     # Context token management for ArliAI's 12K limit
     if llmUrl.startswith("https://api.arliai.com"):
         if maxTokens > 4096:
@@ -138,6 +160,15 @@ def aicurate(llmKey, llmModel, llmUrl, postBody, maxTokens=8192, model_manager=N
     # Try models in sequence if rate limiting occurs
     while True:
         current_model = model_manager.current_model
+
+        key = None
+        if response_cache is not None:
+            key = cache_key(current_model, cacheSystemPrompt, curationPrompt, output_language, cacheBody)
+            cachedResponse = response_cache.get(key)
+            if cachedResponse is not None:
+                post_id = f"@{author}/{permlink}" if author and permlink else "Unknown Post"
+                logging.info(f"[{post_id}] Using cached AI response from {current_model}.")
+                return cachedResponse
         
         payloadDict = {
             "model": current_model,
@@ -145,8 +176,8 @@ def aicurate(llmKey, llmModel, llmUrl, postBody, maxTokens=8192, model_manager=N
             "temperature": temperature,
             "top_p": top_p,
             "max_tokens": maxTokens,
-            "stream": False,
-            "stop": ["END_OF_CURATION_REPORT"]
+            "stream": stream,
+            "stop": [STOP_MARKER]
         }
 
         if is_arliai:
@@ -161,33 +192,49 @@ def aicurate(llmKey, llmModel, llmUrl, postBody, maxTokens=8192, model_manager=N
         for attempt in range(MAX_RETRIES + 1):
             try:
                 logging.debug(f"Attempt {attempt + 1}/{MAX_RETRIES + 1} to call AI API: {llmUrl} with model {current_model}")
-                response = requests.post(llmUrl, headers=headers, data=payload)
-                response.raise_for_status()  # Raises HTTPError for 4xx/5xx responses
-                
-                data = response.json()
-                if isinstance(data, list):
-                    data = data[0] if len(data) > 0 else {}
-                rawResponse = data.get('choices', [{}])[0].get('message', {}).get('content') or ''
-
-                # Post-process to remove any <think>...</think> blocks that the model might still include.
-                # The re.DOTALL flag ensures that the pattern matches even if the block spans multiple lines.
-                # .strip() removes any leading/trailing whitespace left after the removal.
-                cleanedResponse = re.sub(r'<think>.*?</think>', '', str(rawResponse), flags=re.DOTALL).strip()
-                cleanedResponse = re.sub(r'<thought>.*?</thought>', '', cleanedResponse, flags=re.DOTALL).strip()
-
                 post_id = f"@{author}/{permlink}" if author and permlink else "Unknown Post"
+                if stream:
+                    # Think blocks are stripped while reading, so only visible text can end the stream early.
+                    # An HTTP error status raises HTTPError before the first line.
+                    rawResponse, cleanedResponse, stopped_by = read_streamed_completion(
+                        get_llm_transport().stream_lines(llmUrl, headers=headers, data=payload),
+                        stop_markers=[STOP_MARKER],
+                        verdicts=[REJECTION_VERDICT]
+                    )
+                    if stopped_by == REJECTION_VERDICT:
+                        logging.info(f"[{post_id}] Rejection verdict received after {len(rawResponse)} characters; closed the stream early.")
+                else:
+                    response = get_llm_transport().post(llmUrl, headers=headers, data=payload)
+                    response.raise_for_status()  # Raises HTTPError for 4xx/5xx responses
+                    
+                    data = response.json()
+                    if isinstance(data, list):
+                        data = data[0] if len(data) > 0 else {}
+                    rawResponse = data.get('choices', [{}])[0].get('message', {}).get('content') or ''
+
+                    # Post-process to remove any <think>...</think> blocks that the model might still include.
+                    # The re.DOTALL flag ensures that the pattern matches even if the block spans multiple lines.
+                    # .strip() removes any leading/trailing whitespace left after the removal.
+                    cleanedResponse = re.sub(r'<think>.*?</think>', '', str(rawResponse), flags=re.DOTALL).strip()
+                    cleanedResponse = re.sub(r'<thought>.*?</thought>', '', cleanedResponse, flags=re.DOTALL).strip()
                 
                 if not cleanedResponse:
                     logging.info(f"[{post_id}] AI model returned a completely empty response. Interpreting as an implicit rejection.")
+                    if key:
+                        response_cache.put(key, current_model, "DO NOT CURATE")
                     return "DO NOT CURATE"
 
-                if len(cleanedResponse) < 100: # Or another threshold for "suspiciously short"
+                # Or another threshold for "suspiciously short"; a bare verdict (e.g. from an early-stopped stream) is expected
+                if len(cleanedResponse) < 100 and REJECTION_VERDICT not in cleanedResponse:
                     logging.warning(f"[{post_id}] Received suspiciously short AI response after cleaning: '{cleanedResponse}'.")
                     logging.warning(f"Original raw response: '{rawResponse}'")  # Add this line
                     logging.warning(f"Request payload that led to short response: {json.dumps(payloadDict, indent=2)}")
 
                 print(f"Response before cleaning:", rawResponse)
                 print(f"Response after cleaning:", cleanedResponse)
+                # Suspiciously short responses are usually glitches; don't make them permanent
+                if key and (len(cleanedResponse) >= 100 or REJECTION_VERDICT in cleanedResponse):
+                    response_cache.put(key, current_model, cleanedResponse)
                 return cleanedResponse
 
             except requests.exceptions.HTTPError as e:
@@ -222,7 +269,7 @@ def aicurate(llmKey, llmModel, llmUrl, postBody, maxTokens=8192, model_manager=N
                         f"Attempting to mark/switch to next available model."
                     )
                     if enable_switching:
-                        switched = model_manager.mark_rate_limited(dry_run=dry_run)
+                        switched = model_manager.mark_rate_limited(dry_run=dry_run, model=current_model)
                         if switched:
                             break  # Break inner loop to retry with new model
                         else:
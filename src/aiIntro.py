@@ -10,6 +10,7 @@ from pathlib import Path
 from modelManager import ModelManager
 from promptHelper import construct_messages
 from localization import Localization
+from llmTransport import get_llm_transport
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -146,7 +147,7 @@ def aiIntro(llmKey, llmModel, llmUrl, startTime, endTime, combinedComment, maxTo
         for attempt in range(max_retries):
             try:
                 logging.debug(f"Attempt {attempt + 1}/{max_retries} to call AI API for intro: {llmUrl} with model {current_model}")
-                response = requests.post(llmUrl, headers=headers, data=payload)
+                response = get_llm_transport().post(llmUrl, headers=headers, data=payload)
                 response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
                 data = response.json()
                 if isinstance(data, list):
@@ -0,0 +1,169 @@
+"""
+Author Prefetching for Thoth
+
+Screening resolves authors one at a time. This module sits between the block stream
+and the screening pipeline: it buffers the next candidate posts, resolves all of their
+authors with one batched `get_accounts` call plus one JSON-RPC batch of
+`get_follow_count` calls, and warms the AuthorSnapshotCache before screening reaches them.
+Optionally, the authors' Hive and Blurt activity is looked up in the same step.
+"""
+
+import logging
+import time
+
+from authorSnapshot import AuthorSnapshot
+from rpcBatch import RpcBatchClient, RpcError
+
+logger = logging.getLogger(__name__)
+
+# get_accounts accepts up to 1000 names per call
+MAX_ACCOUNTS_PER_CALL = 1000
+
+class AuthorPrefetcher:
+    """Warms the author snapshot cache for upcoming candidate posts in batches."""
+
+    def __init__(self, author_snapshots, nodes=None, lookahead=50, timeout=30, remote_activity=None,
+                 max_wait=2.0, max_blocks=20, clock=time.monotonic):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            author_snapshots: AuthorSnapshotCache to warm
+            nodes: Optional list of node URLs for batched get_follow_count requests
+            lookahead: Maximum number of candidate posts buffered and resolved together
+            timeout: HTTP timeout in seconds for the batched follow count request
+            remote_activity: Optional callable that prefetches the cross-chain activity of a list of authors
+            max_wait: Seconds after the first buffered operation at which the buffer is resolved
+                      even if it holds fewer than `lookahead` posts (0 disables the limit)
+            max_blocks: Number of blocks a buffer may span before it is resolved (0 disables the limit)
+            clock: Time source in seconds (for tests)
+        """
+        self.author_snapshots = author_snapshots
+        self.steem = author_snapshots.steem
+        self._rpc = RpcBatchClient(nodes, timeout=timeout)
+        self.nodes = self._rpc.nodes
+        self.lookahead = max(1, int(lookahead))
+        self.timeout = timeout
+        self.remote_activity = remote_activity
+        self.max_wait = max_wait
+        self.max_blocks = max_blocks
+        self.clock = clock
+
+        self.batches = 0
+        self.prefetched = 0
+
+    def wrap(self, operations):
+        """
+        Pass a stream of operations through unchanged, prefetching the authors of each
+        group of buffered top-level posts before any of them is yielded.
+
+        A group is resolved when it holds `lookahead` posts, when `max_wait` seconds have
+        passed since its first operation arrived, or when it spans `max_blocks` blocks.
+        While catching up, groups fill up quickly; at the head of the chain, the time and
+        block limits keep screening and checkpointing from waiting for a full group.
+        The limits are checked when the next operation arrives.
+        """
+        buffered = []
+        candidates = 0
+        started = None
+        for operation in operations:
+            is_candidate = operation.get('type') == 'comment' and operation.get('parent_author', None) == ''
+            if not buffered and not is_candidate:
+                yield operation  # nothing to prefetch and nothing to keep in order behind
+                continue
+            if not buffered:
+                started = self.clock()
+            buffered.append(operation)
+            if is_candidate:
+                candidates += 1
+            if candidates >= self.lookahead or self._buffer_expired(buffered, started):
+                self._prefetch_buffered(buffered)
+                yield from buffered
+                buffered = []
+                candidates = 0
+
+        if buffered:
+            self._prefetch_buffered(buffered)
+            yield from buffered
+
+    def _buffer_expired(self, buffered, started):
+        if self.max_wait > 0 and self.clock() - started >= self.max_wait:
+            return True
+        if self.max_blocks > 0:
+            first_block = buffered[0].get('block_num')
+            last_block = buffered[-1].get('block_num')
+            if first_block is not None and last_block is not None and last_block - first_block >= self.max_blocks:
+                return True
+        return False
+
+    def _prefetch_buffered(self, operations):
+        authors = [op['author'] for op in operations if op.get('type') == 'comment' and op.get('parent_author', None) == '']
+        try:
+            self.prefetch(authors)
+        except Exception as e:
+            # Prefetching is only an optimization; screening fetches missing authors itself.
+            logger.warning(f"Author prefetch failed for {len(authors)} authors: {e}")
+
+        if self.remote_activity is not None and authors:
+            try:
+                self.remote_activity(authors)
+            except Exception as e:
+                logger.warning(f"Cross-chain activity prefetch failed for {len(authors)} authors: {e}")
+
+    def prefetch(self, authors):
+        """
+        Resolve the given authors in bulk and add them to the snapshot cache.
+
+        Authors that already have a fresh snapshot are skipped.
+
+        Returns:
+            int: The number of snapshots added to the cache.
+        """
+        missing = []
+        for author in dict.fromkeys(authors):
+            if not self.author_snapshots.contains(author):
+                missing.append(author)
+        if not missing:
+            return 0
+
+        accounts = []
+        for i in range(0, len(missing), MAX_ACCOUNTS_PER_CALL):
+            accounts.extend(self.steem.get_accounts(missing[i:i + MAX_ACCOUNTS_PER_CALL]) or [])
+
+        names = [account['name'] for account in accounts]
+        follow_counts = self._get_follow_counts(names)
+
+        for account in accounts:
+            self.author_snapshots.put(AuthorSnapshot(
+                account['name'],
+                account,
+                follow_counts=follow_counts.get(account['name']),
+                steem_instance=self.steem
+            ))
+
+        self.batches += 1
+        self.prefetched += len(accounts)
+        logger.debug(f"Prefetched {len(accounts)} of {len(missing)} uncached authors (batch {self.batches})")
+        return len(accounts)
+
+    def _get_follow_counts(self, names):
+        """
+        Fetch follow counts for many accounts with one JSON-RPC batch request.
+
+        Returns:
+            dict: Account name -> follow count result. Accounts whose counts could not be
+            fetched are left out; their snapshots fetch the counts lazily instead.
+        """
+        if not names:
+            return {}
+
+        try:
+            results = self._rpc.call_batch([('condenser_api.get_follow_count', [name]) for name in names], raise_errors=False)
+        except Exception as e:
+            logger.warning(f"Batched get_follow_count request failed: {e}")
+            return {}
+
+        return {
+            name: result for name, result in zip(names, results)
+            if result and not isinstance(result, RpcError)
+        }
@@ -0,0 +1,187 @@
+"""
+Author Snapshots for Thoth
+
+Screening and scoring a single post used to fetch the same author record many times
+(inactivity check, wallet screening, power-down check and author scoring each called
+`get_account`). An AuthorSnapshot holds everything those checks need about an author:
+the account record, follow counts and vesting/delegation data. Snapshots are fetched
+once and shared through a TTL-bounded LRU cache for the rest of the run.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+def _parse_asset(value):
+    """Parse an asset string such as '123.456789 VESTS' into a float."""
+    try:
+        return float(str(value).split()[0])
+    except (IndexError, ValueError):
+        return 0.0
+
+class AuthorSnapshot:
+    """The account record, follow counts and vesting data of one author."""
+
+    def __init__(self, name, account, follow_counts=None, steem_instance=None):
+        """
+        Initialize the snapshot.
+
+        Args:
+            name: The Steem account name
+            account: The raw account record returned by get_account/get_accounts
+            follow_counts: Optional result of get_follow_count; fetched on first use if not given
+            steem_instance: Steem instance used to fetch the follow counts lazily
+        """
+        self.name = name
+        self.account = account
+        self.steem = steem_instance
+        self._follow_counts = follow_counts
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        return self.account[key]
+
+    def get(self, key, default=None):
+        return self.account.get(key, default)
+
+    @property
+    def follow_counts(self):
+        """The author's follow counts, fetched at most once per snapshot."""
+        with self._lock:
+            if self._follow_counts is None:
+                self._follow_counts = self.steem.get_follow_count(self.name)
+            return self._follow_counts
+
+    @property
+    def follower_count(self):
+        return self.follow_counts.get('follower_count', 0)
+
+    @property
+    def following_count(self):
+        return self.follow_counts.get('following_count', 0)
+
+    @property
+    def rep(self):
+        """Reputation score, computed exactly like steem.account.Account.rep."""
+        rep = int(self.account.get('reputation', 0))
+        if rep == 0:
+            return 25
+        score = (math.log10(abs(rep)) - 9) * 9 + 25
+        if rep < 0:
+            score = 50 - score
+        return round(score, 2)
+
+    @property
+    def vesting_shares(self):
+        return _parse_asset(self.account.get('vesting_shares', '0.0 '))
+
+    @property
+    def delegated_vesting_shares(self):
+        return _parse_asset(self.account.get('delegated_vesting_shares', '0.0 '))
+
+    @property
+    def received_vesting_shares(self):
+        return _parse_asset(self.account.get('received_vesting_shares', '0.0 '))
+
+    @property
+    def vesting_withdraw_rate(self):
+        return _parse_asset(self.account.get('vesting_withdraw_rate', '0.0 '))
+
+def fetch_snapshot(steem_instance, author, max_retries=3):
+    """
+    Fetch a fresh AuthorSnapshot with a single get_account call.
+
+    Returns:
+        AuthorSnapshot or None: None if the account does not exist or could not be fetched.
+    """
+    account = None
+    for attempt in range(max_retries):
+        try:
+            account = steem_instance.get_account(author)
+            break
+        except Exception as e:
+            if attempt < max_retries - 1:
+                time.sleep(2)
+                continue
+            logger.error(f"Error fetching account info for {author}: {e}")
+            return None
+
+    if not account:
+        logger.warning(f"Account '{author}' not found.")
+        return None
+
+    return AuthorSnapshot(author, account, steem_instance=steem_instance)
+
+class AuthorSnapshotCache:
+    """Thread-safe, TTL-bounded LRU cache of AuthorSnapshot objects."""
+
+    def __init__(self, steem_instance, ttl_seconds=600, max_entries=512):
+        """
+        Initialize the cache.
+
+        Args:
+            steem_instance: Steem instance used to fetch account records
+            ttl_seconds: Seconds a snapshot stays valid
+            max_entries: Maximum number of snapshots kept (least recently used are evicted)
+        """
+        self.steem = steem_instance
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, int(max_entries))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, author, max_retries=3):
+        """
+        Return the snapshot for an author, fetching it if it is not cached or has expired.
+
+        Returns:
+            AuthorSnapshot or None: None if the account does not exist or could not be fetched.
+        """
+        snapshot = self._lookup(author)
+        if snapshot is not None:
+            return snapshot
+
+        snapshot = fetch_snapshot(self.steem, author, max_retries=max_retries)
+        if snapshot is not None:
+            self.put(snapshot)
+        return snapshot
+
+    def put(self, snapshot):
+        """Add (or refresh) a snapshot in the cache."""
+        with self._lock:
+            self._entries[snapshot.name] = (time.monotonic() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(snapshot.name)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def contains(self, author):
+        """Return True if the cache holds an unexpired snapshot for the author."""
+        with self._lock:
+            entry = self._entries.get(author)
+            return entry is not None and time.monotonic() < entry[0]
+
+    def invalidate(self, author):
+        """Drop an author's snapshot so the next lookup refetches it."""
+        with self._lock:
+            self._entries.pop(author, None)
+
+    def _lookup(self, author):
+        with self._lock:
+            entry = self._entries.get(author)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, snapshot = entry
+            if time.monotonic() >= expires:
+                del self._entries[author]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(author)
+            self.hits += 1
+            return snapshot
@@ -2,12 +2,18 @@ from steem import Steem
 import math
 import configparser
 from datetime import datetime
-import requests
-import json
 import logging
 import time
+import sqlite3
+import threading
+
+import numpy as np
 
 import utils
+from crossChainActivity import CrossChainActivity
+from fileSets import file_sets
+from followerStore import FollowerStore
+from registryIgnoreList import RegistryIgnoreList
 from steemHelpers import initialize_steem_with_retry
 
 # Create a ConfigParser object
@@ -22,6 +28,18 @@ logging.getLogger('steem.steemd').setLevel(logging.CRITICAL)
 logging.getLogger('urllib3.connectionpool').setLevel(logging.CRITICAL)
 logger = logging.getLogger(__name__)
 
+# Persistent follower list store, created on first use
+_followerStore = None
+_followerStoreLock = threading.Lock()
+
+# Hive/Blurt activity lookups, created on first use
+_activityService = None
+_activityServiceLock = threading.Lock()
+
+# Ignore lists of registry accounts, loaded in bulk on first use
+_registryIgnoreLists = {}
+_registryIgnoreListsLock = threading.Lock()
+
 ### rep_log10 is straight from here - https://developers.steem.io/tutorials-python/account_reputation
 def rep_log10(rep):
     """Convert raw steemd rep into a UI-ready value centered at 25."""
@@ -44,6 +62,20 @@ def rep_log10(rep):
     out = (out * 9) + 25          # 9 points per magnitude. center at 25
     return round(out, 2)
 
+def _getRegistryIgnoreList(registryAccount):
+    ignoreList = _registryIgnoreLists.get(registryAccount)
+    if ignoreList is None:
+        with _registryIgnoreListsLock:
+            ignoreList = _registryIgnoreLists.get(registryAccount)
+            if ignoreList is None:
+                ignoreList = RegistryIgnoreList(
+                    registryAccount,
+                    cache_file=config.get('SCREENING', 'REGISTRY_CACHE_FILE', fallback='data/registry_ignore.json') or None,
+                    ttl_hours=config.getfloat('SCREENING', 'REGISTRY_CACHE_TTL_HOURS', fallback=6.0)
+                )
+                _registryIgnoreLists[registryAccount] = ignoreList
+    return ignoreList
+
 def isBlacklisted(account, steem_instance=None, registryAccount=None):
     # Use provided Steem instance or initialize from config
     s = steem_instance or initialize_steem_with_retry(node_api=config.get('STEEM', 'STEEM_API'))
@@ -53,6 +85,12 @@ def isBlacklisted(account, steem_instance=None, registryAccount=None):
     if not registryAccount:
         registryAccount = config.get('CONTENT', 'REGISTRY_ACCOUNT')
     
+    # The registry's whole ignore list is loaded once and checked locally
+    if config.getfloat('SCREENING', 'REGISTRY_CACHE_TTL_HOURS', fallback=6.0) > 0:
+        blacklisted = _getRegistryIgnoreList(registryAccount).contains(account, s)
+        if blacklisted is not None:
+            return blacklisted
+    
     max_retries = 3
     for attempt in range(max_retries):
         try:
@@ -70,17 +108,9 @@ def isBlacklisted(account, steem_instance=None, registryAccount=None):
     return False
 
 def isAuthorWhitelisted(account):
+    # The whitelist is loaded once and re-read only when the file changes
     whiteListFile = config.get('CONTENT', 'AUTHOR_WHITELIST_FILE')
-    try:
-        with open(whiteListFile, 'r') as wlf:
-            # Read lines, strip whitespace from each, and filter out empty lines
-            whiteList = {line.strip() for line in wlf if line.strip()}
-    except FileNotFoundError:
-        # Handle the case where the whitelist file doesn't exist
-        # You might want to log this or return False by default
-        return False
-    
-    return account in whiteList
+    return file_sets.contains(whiteListFile, account)
 
 def isAuthorScreened(comment, included_posts=None, steem_instance=None):
     s = steem_instance or initialize_steem_with_retry(node_api=config.get('STEEM', 'STEEM_API'))
@@ -376,8 +406,11 @@ def isActiveFollowerCountTooLow(accountName, steem_instance=None):
         return True # Fail safe: if we can't check, screen the author (i.e., count is "too low").
 
 def isInactive(accountInfo, steem_instance=None):
-    lastPost = accountInfo['last_post']
-    lastVote = accountInfo['last_vote_time']
+    return _daysSinceLastActivity(accountInfo) > config.getint('AUTHOR','MAX_INACTIVITY_DAYS')
+
+def _daysSinceLastActivity(account_data):
+    lastPost = account_data['last_post']
+    lastVote = account_data['last_vote_time']
 
     # Handle datetime objects vs strings - Steem API returns datetime objects
     if isinstance(lastPost, str):
@@ -392,11 +425,16 @@ def isInactive(accountInfo, steem_instance=None):
         
     mostRecentActivity = max(lastPostTime, lastVoteTime)
     today = datetime.now()
-    days = (today - mostRecentActivity).days
-    
-    return days > config.getint('AUTHOR','MAX_INACTIVITY_DAYS')
+    return (today - mostRecentActivity).days
+
+def inactiveDays(accountName, steem_instance=None, snapshot=None):
+    if snapshot is not None:
+        try:
+            return _daysSinceLastActivity(snapshot.account)
+        except Exception as e:
+            logger.error(f"Error checking inactivity for {accountName}: {e}")
+            return 0
 
-def inactiveDays(accountName, steem_instance=None):
     s = steem_instance or initialize_steem_with_retry(node_api=config.get('STEEM', 'STEEM_API'))
     if not s:
         return 0
@@ -404,23 +442,7 @@ def inactiveDays(accountName, steem_instance=None):
     for attempt in range(max_retries):
         try:
             account_data = s.get_account(accountName)
-            lastPost = account_data['last_post']
-            lastVote = account_data['last_vote_time']
-
-            # Handle datetime objects vs strings - Steem API returns datetime objects
-            if isinstance(lastPost, str):
-                lastPostTime = datetime.strptime(lastPost, '%Y-%m-%dT%H:%M:%S')
-            else:
-                lastPostTime = lastPost
-                
-            if isinstance(lastVote, str):
-                lastVoteTime = datetime.strptime(lastVote, '%Y-%m-%dT%H:%M:%S')
-            else:
-                lastVoteTime = lastVote
-                
-            mostRecentActivity = max(lastPostTime, lastVoteTime)
-            today = datetime.now()
-            return (today - mostRecentActivity).days
+            return _daysSinceLastActivity(account_data)
         except Exception as e:
             if attempt < max_retries - 1:
                 time.sleep(2)
@@ -428,9 +450,30 @@ def inactiveDays(accountName, steem_instance=None):
             logger.error(f"Error checking inactivity for {accountName}: {e}")
             return 0
 
+def _getFollowerStore():
+   global _followerStore
+   if _followerStore is None:
+       with _followerStoreLock:
+           if _followerStore is None:
+               _followerStore = FollowerStore(ttl_hours=config.getfloat('SCREENING', 'FOLLOWER_CACHE_TTL_HOURS', fallback=24.0))
+   return _followerStore
+
+def cleanupFollowerStore(retain_days=30):
+   """Delete follower lists that were not refreshed for retain_days from data/followers.db."""
+   if config.getfloat('SCREENING', 'FOLLOWER_CACHE_TTL_HOURS', fallback=24.0) <= 0:
+       return
+   try:
+       _getFollowerStore().cleanup_old_records(retain_days)
+   except sqlite3.Error as e:
+       logger.warning(f"Could not clean up the follower store: {e}")
+
 def getAllFollowers(account, account_type='blog', steem_instance=None):
    """
    Retrieve all followers for a specific account.
+
+   Follower lists are kept in a persistent store (data/followers.db). A stored list is
+   reused until FOLLOWER_CACHE_TTL_HOURS expires, and after that for as long as the
+   account's follower count is unchanged.
    
    Args:
        account (str): The account name to get followers for
@@ -442,7 +485,32 @@ def getAllFollowers(account, account_type='blog', steem_instance=None):
    s = steem_instance or initialize_steem_with_retry(node_api=config.get('STEEM', 'STEEM_API'))
    if not s:
        return []
-       
+
+   if config.getfloat('SCREENING', 'FOLLOWER_CACHE_TTL_HOURS', fallback=24.0) <= 0:
+       return _fetchAllFollowers(account, account_type, s)
+
+   def fetch_count():
+       # The follower count only covers 'blog' follows, so it can't validate other list types.
+       if account_type != 'blog':
+           return None
+       try:
+           return s.get_follow_count(account)['follower_count']
+       except Exception as e:
+           logger.warning(f"Error fetching follower count for {account}: {e}")
+           return None
+
+   try:
+       return _getFollowerStore().get_followers(
+           account, account_type,
+           fetch_all=lambda: _fetchAllFollowers(account, account_type, s),
+           fetch_count=fetch_count
+       )
+   except sqlite3.Error as e:
+       logger.warning(f"Follower store unavailable ({e}); fetching followers of {account} directly.")
+       return _fetchAllFollowers(account, account_type, s)
+
+def _fetchAllFollowers(account, account_type, s):
+   """Download the complete follower list of an account in 1000-entry pages."""
    all_followers = []
    batch_size = 1000
    last_account = ''
@@ -500,24 +568,13 @@ def getMedianFollowerRep(author, steem_instance=None):
    followersData = getAllFollowers(author, steem_instance=steem_instance)
    
    # Extract reputation values from the data (already normalized by the Steem API)
-   reputations = [float(follower['reputation']) for follower in followersData]
-   
-   # Sort the reputations
-   reputations.sort()
+   reputations = np.fromiter((float(follower['reputation']) for follower in followersData), dtype=np.float64, count=len(followersData))
    
-   # Find the middle value
-   n = len(reputations)
-   if n == 0:
+   if reputations.size == 0:
        return None  # Return None for empty lists
    
-   # If odd number of elements, return the middle one
-   if n % 2 == 1:
-       return reputations[n // 2]
-   # If even number of elements, return the average of the two middle values
-   else:
-       middle1 = reputations[(n // 2) - 1]
-       middle2 = reputations[n // 2]
-       return (middle1 + middle2) / 2
+   # Middle value, or the average of the two middle values for an even count
+   return float(np.median(reputations))
 
 def isHiveActivityTooRecent(account):
     inactivity = remoteInactiveDays(account, 'hive')
@@ -562,9 +619,30 @@ def remoteInactiveDays(account, chain):
     
     return daysPassed
 
+def _getActivityService():
+    global _activityService
+    if _activityService is None:
+        with _activityServiceLock:
+            if _activityService is None:
+                _activityService = CrossChainActivity(
+                    timeout=config.getfloat('SCREENING', 'REMOTE_ACTIVITY_TIMEOUT', fallback=10),
+                    ttl_hours=config.getfloat('SCREENING', 'REMOTE_ACTIVITY_TTL_HOURS', fallback=6.0)
+                )
+    return _activityService
+
+def prefetchRemoteActivity(accounts):
+    """
+    Look up the Hive and Blurt activity of many accounts at once (batched requests,
+    both chains concurrently), so later checks for these accounts are cache hits.
+    """
+    _getActivityService().prefetch(accounts)
+
 def getLastRemoteActivityDate(account, chain):
     """
     Query a remote API (Hive or Blurt) for an account and return the last activity date.
+
+    Lookups go through the shared CrossChainActivity service: results are cached for
+    REMOTE_ACTIVITY_TTL_HOURS, and an uncached account is looked up on both chains at once.
     
     Args:
         account (str): The account name to query
@@ -573,56 +651,4 @@ def getLastRemoteActivityDate(account, chain):
     Returns:
         str: The last activity date as a formatted date string, or None if the API call fails
     """
-    if chain.lower() == 'hive':
-        url = "https://api.hive.blog"
-    elif chain.lower() == 'blurt':
-        url = "https://rpc.blurt.blog"
-    else:
-        logger.error(f"Unsupported chain requested: {chain}")
-        return None
-        
-    payload = {
-        "jsonrpc": "2.0", 
-        "method": "condenser_api.get_accounts", 
-        "params": [[account]], 
-        "id": 1
-    }
-    
-    try:
-        response = requests.post(url, json=payload)
-        response.raise_for_status()  # Raise an exception for HTTP errors
-        
-        data = response.json()
-        
-        # Check if we got a valid response with results
-        if "result" in data and data["result"] and len(data["result"]) > 0:
-            account_data = data["result"][0]
-            
-            # Extract the last_post and last_vote_time fields
-            lastPostTime = account_data.get("last_post")
-            lastVoteTime = account_data.get("last_vote_time")
-            
-            # Convert string dates to datetime objects
-            lastPostTime = datetime.fromisoformat(lastPostTime.replace("Z", "+00:00")) if lastPostTime else None
-            lastVoteTime = datetime.fromisoformat(lastVoteTime.replace("Z", "+00:00")) if lastVoteTime else None
-            
-            # Find the most recent date
-            if lastPostTime and lastVoteTime:
-                lastActivityTime = max(lastPostTime, lastVoteTime)
-            elif lastPostTime:
-                lastActivityTime = lastPostTime
-            elif lastVoteTime:
-                lastActivityTime = lastVoteTime
-            else:
-                return None
-                
-            return lastActivityTime.strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            return None
-            
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error querying {chain} API: {e}")
-        return None
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
-        logger.error(f"Error processing {chain} response: {e}")
-        return None
\ No newline at end of file
+    return _getActivityService().get_last_activity(account, chain)
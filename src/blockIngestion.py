@@ -0,0 +1,154 @@
+"""
+Batched Block Ingestion for Thoth
+
+This module replaces the per-operation `Blockchain.stream` walk with a block-range
+ingestion stage. Windows of consecutive blocks are fetched with a single JSON-RPC
+batch request (one `get_ops_in_block` call per block), several windows are kept in
+flight at once, and only top-level `comment` operations are handed to the screening
+stage.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from rpcBatch import RpcBatchClient
+
+logger = logging.getLogger(__name__)
+
+class BlockIngestor:
+    """Fetches block ranges in bulk and yields top-level post operations in block order."""
+
+    def __init__(self, steem_instance, nodes=None, batch_size=50, prefetch_depth=4, timeout=30, poll_interval=3.0, retry_delay=1.0):
+        """
+        Initialize the block ingestor.
+
+        Args:
+            steem_instance: Steem blockchain instance (used for chain properties and as a fallback)
+            nodes: Optional list of node URLs for batched JSON-RPC requests
+            batch_size: Number of blocks fetched per batched request (the window)
+            prefetch_depth: Number of windows kept in flight ahead of the consumer
+            timeout: HTTP timeout in seconds for each batched request
+            poll_interval: Seconds to wait for new irreversible blocks once caught up
+            retry_delay: Base delay in seconds between retries of a failed window (grows linearly)
+        """
+        self.steem = steem_instance
+        self._rpc = RpcBatchClient(nodes, timeout=timeout)
+        self.nodes = self._rpc.nodes
+        self.batch_size = max(1, int(batch_size))
+        self.prefetch_depth = max(1, int(prefetch_depth))
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+
+        # Highest block whose operations have been fully handed to the consumer
+        self.last_scanned_block = None
+        self.blocks_scanned = 0
+
+    def stream_posts(self, start_block):
+        """
+        Yield top-level comment operations starting at start_block.
+
+        The yielded dictionaries have the same shape as the operations produced by
+        `Blockchain.stream(filter_by=['comment'])` (op fields plus 'type', 'timestamp',
+        'block_num', 'trx_id' and '_id'), so they can be used by the screening code unchanged.
+
+        Closing the generator cancels the windows that have not started and returns
+        without waiting for the ones in flight.
+        """
+        next_block = start_block
+        started = time.monotonic()
+
+        executor = ThreadPoolExecutor(max_workers=self.prefetch_depth)
+        pending = deque()
+        try:
+            while True:
+                # Keep up to prefetch_depth windows in flight, but never past the irreversible head
+                if len(pending) < self.prefetch_depth:
+                    head = self._last_irreversible_block()
+                    while len(pending) < self.prefetch_depth and next_block <= head:
+                        last = min(next_block + self.batch_size - 1, head)
+                        pending.append(executor.submit(self._fetch_window, next_block, last))
+                        next_block = last + 1
+
+                if not pending:
+                    # Caught up with the irreversible head; wait for new blocks.
+                    time.sleep(self.poll_interval)
+                    continue
+
+                window = pending.popleft().result()
+                for block_num, block_ops in window:
+                    for event in block_ops:
+                        post = self._to_post_operation(event, block_num)
+                        if post is not None:
+                            yield post
+                    self.last_scanned_block = block_num
+                    self.blocks_scanned += 1
+
+                elapsed = time.monotonic() - started
+                if elapsed > 0:
+                    logger.debug(f"Ingested {self.blocks_scanned} blocks ({self.blocks_scanned / elapsed:.1f} blocks/s), last block {self.last_scanned_block}")
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _to_post_operation(self, event, block_num):
+        """Convert a raw get_ops_in_block entry into a stream-style operation, or None if it is not a top-level post."""
+        try:
+            op_type, op = event['op']
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if op_type != 'comment' or op.get('parent_author', None) != '':
+            return None
+
+        post = op.copy()
+        post.update({
+            '_id': hashlib.sha1(json.dumps(event, sort_keys=True).encode('utf-8')).hexdigest(),
+            'type': op_type,
+            'timestamp': datetime.strptime(event['timestamp'], '%Y-%m-%dT%H:%M:%S'),
+            'block_num': event.get('block', block_num),
+            'trx_id': event.get('trx_id'),
+        })
+        return post
+
+    def _last_irreversible_block(self):
+        """Return the last irreversible block number reported by the node."""
+        return self.steem.get_dynamic_global_properties()['last_irreversible_block_num']
+
+    def _fetch_window(self, first_block, last_block, max_retries=3):
+        """
+        Fetch operations for an inclusive block range.
+
+        Returns:
+            list: A list of (block_num, ops) tuples in block order.
+        """
+        block_nums = list(range(first_block, last_block + 1))
+
+        for attempt in range(max_retries):
+            node = self._rpc.node
+            try:
+                results = self._post_batch(block_nums)
+                return list(zip(block_nums, results))
+            except Exception as e:
+                logger.warning(f"Batched fetch of blocks {first_block}-{last_block} failed (Attempt {attempt + 1}/{max_retries}): {e}")
+                self._next_node(node)
+                time.sleep(self.retry_delay * (attempt + 1))
+
+        # The node may not accept batched requests; fall back to one call per block.
+        logger.warning(f"Falling back to per-block requests for blocks {first_block}-{last_block}.")
+        return [(block_num, self.steem.get_ops_in_block(block_num, False)) for block_num in block_nums]
+
+    def _post_batch(self, block_nums):
+        """Send one JSON-RPC batch request with a get_ops_in_block call per block and return the results in order."""
+        results = self._rpc.call_batch([('condenser_api.get_ops_in_block', [block_num, False]) for block_num in block_nums])
+        return [result or [] for result in results]
+
+    def _next_node(self, failed_node=None):
+        """Rotate to the next configured node after a failure (called from the fetch workers)."""
+        self._rpc.next_node(failed_node)
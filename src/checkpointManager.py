@@ -0,0 +1,155 @@
+"""
+Checkpoint Manager for Thoth
+
+Coalesces writes of the last processed block. Instead of rewriting the block file for
+every streamed operation, the checkpoint is flushed on a time or block-count interval
+and on shutdown, using write-to-temp + rename so a crash never leaves a truncated file.
+Optional resume metadata (run id, stream type, sampled start block) is kept in a JSON
+sidecar so an interrupted run can resume exactly where it stopped.
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+class CheckpointManager:
+    """Tracks the last processed block and persists it with interval-based, atomic flushes."""
+
+    def __init__(self, block_file, flush_interval_seconds=30.0, flush_interval_blocks=1000, metadata_file=None):
+        """
+        Initialize the checkpoint manager and load any existing checkpoint.
+
+        Args:
+            block_file: Path of the plain-text block file (e.g. config/last_block.txt)
+            flush_interval_seconds: Maximum seconds between flushes while blocks are advancing
+            flush_interval_blocks: Maximum number of blocks to advance between flushes
+            metadata_file: Optional path of the JSON resume metadata (defaults to <block_file>.json)
+        """
+        self.block_file = block_file
+        self.metadata_file = metadata_file or f"{os.path.splitext(block_file)[0]}.json"
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_interval_blocks = flush_interval_blocks
+
+        self.last_block = self._load_block()
+        self.previous_run = self._load_metadata()
+        self.metadata = {}
+
+        self._flushed_block = self.last_block
+        self._last_flush_time = time.monotonic()
+        self._dirty = False
+
+        # Make sure progress is not lost on an unhandled exception or Ctrl-C.
+        atexit.register(self.flush)
+
+    def _load_block(self):
+        if not os.path.exists(self.block_file):
+            return 0
+        try:
+            with open(self.block_file, 'r') as f:
+                return int(f.read().strip())
+        except (ValueError, OSError) as e:
+            logger.warning(f"Could not read checkpoint file '{self.block_file}': {e}. Starting without one.")
+            return 0
+
+    def _load_metadata(self):
+        if not os.path.exists(self.metadata_file):
+            return None
+        try:
+            with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (ValueError, OSError) as e:
+            logger.warning(f"Could not read checkpoint metadata '{self.metadata_file}': {e}")
+            return None
+
+    def interrupted_run(self, stream_type):
+        """
+        Return the metadata of the previous run if it stopped before completing with the same stream type.
+
+        Returns:
+            dict or None: The previous run's metadata, including 'last_block', or None if there is nothing to resume.
+        """
+        previous = self.previous_run
+        if not previous or previous.get('status') != 'running':
+            return None
+        if previous.get('stream_type') != stream_type or not previous.get('last_block'):
+            return None
+        return previous
+
+    def begin_run(self, stream_type, start_block, run_id=None, resume_block=None):
+        """
+        Record the resume metadata for a new (or resumed) run and flush it immediately.
+
+        Args:
+            stream_type: The STREAM_TYPE of the run
+            start_block: The block the run originally started (or was sampled) from
+            run_id: Optional id of an interrupted run being resumed; a new id is generated otherwise
+            resume_block: Optional block to continue from when resuming an interrupted run
+
+        Returns:
+            str: The run id
+        """
+        self.metadata = {
+            'run_id': run_id or uuid.uuid4().hex[:12],
+            'stream_type': stream_type,
+            'start_block': int(start_block),
+            'status': 'running',
+        }
+        self.last_block = int(resume_block or start_block)
+        self._dirty = True
+        self.flush()
+        return self.metadata['run_id']
+
+    def update(self, block_num):
+        """Record block_num as the next block to process, flushing if an interval has elapsed."""
+        self.last_block = int(block_num)
+        self._dirty = True
+
+        if (self.last_block - self._flushed_block >= self.flush_interval_blocks or
+                time.monotonic() - self._last_flush_time >= self.flush_interval_seconds):
+            self.flush()
+
+    def flush(self):
+        """Atomically write the current checkpoint (and metadata, if a run was started) to disk."""
+        if not self._dirty:
+            return
+        try:
+            self._atomic_write(self.block_file, str(self.last_block))
+            if self.metadata:
+                self.metadata['last_block'] = self.last_block
+                self.metadata['updated_at'] = datetime.now(timezone.utc).isoformat()
+                self._atomic_write(self.metadata_file, json.dumps(self.metadata, indent=2))
+            self._flushed_block = self.last_block
+            self._last_flush_time = time.monotonic()
+            self._dirty = False
+        except OSError as e:
+            logger.error(f"Failed to write checkpoint {self.last_block} to '{self.block_file}': {e}")
+
+    def close(self, completed=True):
+        """Flush the final checkpoint, marking the run as completed so it is not resumed."""
+        if self.metadata and completed:
+            self.metadata['status'] = 'completed'
+        self._dirty = True
+        self.flush()
+
+    @staticmethod
+    def _atomic_write(path, content):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_', suffix=os.path.basename(path))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -4,6 +4,8 @@ import urllib.request
 import urllib.error
 from steem import Steem
 
+from postView import PostView
+
 logger = logging.getLogger(__name__)
 
 # SDS API endpoint for community queries
@@ -47,21 +49,11 @@ def get_community_category(post):
             return category
         
         # Fallback: Check the first tag in json_metadata if category field is not set
-        if post.get('json_metadata'):
-            if isinstance(post['json_metadata'], dict):
-                tags = post['json_metadata'].get('tags', [])
-            elif isinstance(post['json_metadata'], str):
-                try:
-                    metadata = json.loads(post['json_metadata'])
-                    tags = metadata.get('tags', [])
-                except json.JSONDecodeError:
-                    tags = []
-            else:
-                tags = []
-            
-            # Check if the first tag starts with 'hive-'
-            if tags and tags[0].startswith('hive-'):
-                return tags[0]
+        tags = PostView.of(post).tags
+        
+        # Check if the first tag starts with 'hive-'
+        if tags and tags[0].startswith('hive-'):
+            return tags[0]
         
         return None
     except Exception as e:
@@ -131,21 +123,11 @@ def get_community_tags(post):
             community_tags.append(category)
         
         # Also check json_metadata for any additional community tags
-        if post.get('json_metadata'):
-            if isinstance(post['json_metadata'], dict):
-                tags = post['json_metadata'].get('tags', [])
-            elif isinstance(post['json_metadata'], str):
-                try:
-                    metadata = json.loads(post['json_metadata'])
-                    tags = metadata.get('tags', [])
-                except json.JSONDecodeError:
-                    tags = []
-            else:
-                tags = []
-            
-            # Filter for community tags (those starting with 'hive-')
-            additional_community_tags = [tag for tag in tags if tag.startswith('hive-') and tag != category]
-            community_tags.extend(additional_community_tags)
+        tags = PostView.of(post).tags
+        
+        # Filter for community tags (those starting with 'hive-')
+        additional_community_tags = [tag for tag in tags if tag.startswith('hive-') and tag != category]
+        community_tags.extend(additional_community_tags)
         
         return community_tags
     except Exception as e:
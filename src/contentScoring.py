@@ -11,14 +11,17 @@ import urllib.request
 import urllib.error
 from datetime import datetime, timedelta
 import logging
+import threading
+import time
+from collections import OrderedDict
 
 from steem import Steem
-from steem.account import Account
-from steem.account import AccountDoesNotExistsException
 
-from utils import get_rng, remove_formatting
+from authorSnapshot import AuthorSnapshotCache
+from utils import get_rng
 from authorValidation import followersPerMonth, adjustedFollowersPerMonth, getMedianFollowerRep, remoteInactiveDays, getAllFollowers
-from contentValidation import word_count
+from postView import PostView
+from hyperLogLog import ReachSketch, DEFAULT_EXACT_LIMIT
 from steemHelpers import get_resteem_count
 from communityValidation import get_all_community_members
 
@@ -27,17 +30,21 @@ logger = logging.getLogger(__name__)
 class ContentScorer:
     """Main scoring engine for content quality assessment."""
     
-    def __init__(self, steem_instance, config):
+    def __init__(self, steem_instance, config, author_snapshots=None, stats_tracker=None):
         """
         Initialize the content scorer.
         
         Args:
             steem_instance: Steem blockchain instance
             config: Configuration validator with loaded settings
+            author_snapshots: Optional AuthorSnapshotCache shared with the rule-based screening
+            stats_tracker: Optional StatsTracker that records the latency of each score component
         """
         self.steem = steem_instance
         self.config = config
+        self.stats_tracker = stats_tracker
         self.rng = get_rng()
+        self.author_snapshots = author_snapshots or AuthorSnapshotCache(steem_instance)
         
         # Load scoring weights from configuration
         self.weights = self._load_scoring_weights()
@@ -46,9 +53,17 @@ class ContentScorer:
         # Cache for expensive calculations
         self.median_rep_cache = {}
         
-        # Feed reach cache to avoid duplicate calculations
-        self._feed_reach_cache = None
-        self._feed_reach_post_key = None
+        # Feed reach cache (keyed by author/permlink) to avoid duplicate calculations.
+        # Keyed per post so that concurrent screening workers never read each other's results.
+        self._feed_reach_cache = {}
+
+        # Follower sketches of resteeming accounts, reused across posts. They are built from
+        # per-process account IDs, so they are kept in memory only and expire with the
+        # follower lists they were built from (FOLLOWER_CACHE_TTL_HOURS).
+        self.feed_reach_exact_limit = self.config.get_int('ENGAGEMENT', 'FEED_REACH_EXACT_LIMIT', DEFAULT_EXACT_LIMIT)
+        self._follower_sketch_ttl = self.config.get_float('SCREENING', 'FOLLOWER_CACHE_TTL_HOURS', 24.0) * 3600
+        self._follower_sketches = OrderedDict()
+        self._follower_sketch_lock = threading.Lock()
         
     def _load_scoring_weights(self):
         """Load scoring weights from configuration."""
@@ -137,16 +152,7 @@ class ContentScorer:
 
     def _extract_tags(self, post):
         """Safely extract tags from post metadata."""
-        try:
-            if post.get('json_metadata'):
-                if isinstance(post['json_metadata'], dict):
-                    return post['json_metadata'].get('tags', [])
-                elif isinstance(post['json_metadata'], str):
-                    metadata = json.loads(post['json_metadata'])
-                    return metadata.get('tags', [])
-        except Exception:
-            pass
-        return []
+        return PostView.of(post).tags
 
     def score_content(self, post_data, content_data=None):
         """
@@ -160,20 +166,16 @@ class ContentScorer:
             Dictionary containing total score, component scores, and quality tier
         """
         try:
-            # Invalidate feed reach cache for new post
-            self._feed_reach_cache = None
-            self._feed_reach_post_key = None
-            
             # Get detailed post information
             if content_data:
-                post = content_data
+                post = PostView.of(content_data)
             else:
-                post = self.steem.get_content(post_data['author'], post_data['permlink'])
+                post = PostView(self.steem.get_content(post_data['author'], post_data['permlink']))
             
             # Calculate component scores
-            author_score = self._score_author(post['author'])
-            content_score = self._score_content(post)
-            engagement_score = self._score_engagement(post)
+            author_score = self._timed('score.author', self._score_author, post['author'])
+            content_score = self._timed('score.content', self._score_content, post)
+            engagement_score = self._timed('score.engagement', self._score_engagement, post)
             
             # Calculate weighted total score
             total_score = (
@@ -213,17 +215,26 @@ class ContentScorer:
                 'details': {'error': str(e)}
             }
     
+    def _timed(self, stage, func, *args):
+        """Call func(*args) and record its duration as a stage in the stats tracker."""
+        if not self.stats_tracker:
+            return func(*args)
+        with self.stats_tracker.timed(stage):
+            return func(*args)
+
     def _score_author(self, author):
         """Score author quality based on reputation, followers, and activity."""
         try:
-            account = Account(author, steemd_instance=self.steem)
+            account = self.author_snapshots.get(author)
+            if account is None:
+                logger.warning(f"Author account {author} does not exist")
+                return 0.0
             
             # Basic author metrics
             reputation = account.rep
             # Optimization: Use get_follow_count instead of fetching the list (which is very slow for large accounts)
-            follow_counts = self.steem.get_follow_count(author)
-            followers = follow_counts['follower_count']
-            following = follow_counts['following_count']
+            followers = account.follower_count
+            following = account.following_count
             
             # Calculate influence ratio with Laplace smoothing (small account boost)
             smoothed_followers = followers + 50
@@ -326,9 +337,6 @@ class ContentScorer:
             
             return max(0.0, min(author_score, 100.0))
             
-        except AccountDoesNotExistsException:
-            logger.warning(f"Author account {author} does not exist")
-            return 0.0
         except Exception as e:
             logger.error(f"Error scoring author {author}: {e}")
             return 0.0
@@ -338,8 +346,9 @@ class ContentScorer:
         try:
             # Content length score
             # Use word count instead of character count
-            clean_body = remove_formatting(post['body'])
-            content_word_count = word_count(clean_body)
+            post = PostView.of(post)
+            clean_body = post.clean_body
+            content_word_count = post.word_count
             title_length = len(post['title'])
             
             # Length scoring with optimal ranges
@@ -443,10 +452,28 @@ class ContentScorer:
             logger.error(f"Error getting followers for {author}: {e}")
             return set()
 
+    def _get_follower_sketch(self, account):
+        """Get a (cached) reach sketch of an account's followers."""
+        with self._follower_sketch_lock:
+            entry = self._follower_sketches.get(account)
+            if entry is not None and time.monotonic() < entry[0]:
+                self._follower_sketches.move_to_end(account)
+                return entry[1]
+
+        sketch = ReachSketch(exact_limit=self.feed_reach_exact_limit)
+        sketch.update(self._get_author_followers(account))
+
+        with self._follower_sketch_lock:
+            self._follower_sketches[account] = (time.monotonic() + self._follower_sketch_ttl, sketch)
+            self._follower_sketches.move_to_end(account)
+            while len(self._follower_sketches) > 512:
+                self._follower_sketches.popitem(last=False)
+        return sketch
+
     def _get_resteem_followers(self, author, permlink):
-        """Get followers of accounts that resteemed this post using SDS API."""
+        """Get followers of accounts that resteemed this post using SDS API, as a reach sketch."""
         try:
-            resteem_followers = set()
+            resteem_followers = ReachSketch(exact_limit=self.feed_reach_exact_limit)
             
             # Use SDS API to get all resteemers directly
             # API endpoint: https://sds.steemworld.org/post_resteems_api/getResteems/author/permlink/limit/offset
@@ -469,16 +496,15 @@ class ContentScorer:
                 
                 # Get followers for each resteemer
                 for resteemer in resteemers:
-                    followers = self._get_author_followers(resteemer)
-                    resteem_followers.update(followers)
+                    resteem_followers.update(self._get_follower_sketch(resteemer))
             
             return resteem_followers
         except urllib.error.URLError as e:
             logger.warning(f"Failed to fetch resteems for {author}/{permlink}: {e}")
-            return set()
+            return ReachSketch(exact_limit=self.feed_reach_exact_limit)
         except Exception as e:
             logger.error(f"Error getting resteem followers for {author}/{permlink}: {e}")
-            return set()
+            return ReachSketch(exact_limit=self.feed_reach_exact_limit)
 
     def _calculate_feed_reach(self, post):
         """Calculate feed reach as unique accounts that could see the post."""
@@ -488,26 +514,29 @@ class ContentScorer:
             post_key = f"{author}/{permlink}"
             
             # Check if we have a cached result for this post
-            if self._feed_reach_cache is not None and self._feed_reach_post_key == post_key:
-                return self._feed_reach_cache
+            if post_key in self._feed_reach_cache:
+                return self._feed_reach_cache[post_key]
             
-            # Calculate feed reach
+            # Calculate feed reach. Counts are exact for small audiences and estimated
+            # with HyperLogLog sketches once they exceed FEED_REACH_EXACT_LIMIT accounts.
+            reach = ReachSketch(exact_limit=self.feed_reach_exact_limit)
+
             # 1. Get author followers
-            author_followers = self._get_author_followers(author)
+            reach.update(self._get_author_followers(author))
             
             # 2. Get resteem followers for all resteeming accounts
-            resteem_followers = self._get_resteem_followers(author, permlink)
+            reach.update(self._get_resteem_followers(author, permlink))
             
             # 3. Get community members if posted in a community
-            community_members = get_all_community_members(post, self.steem)
+            reach.update(get_all_community_members(post, self.steem))
             
-            # 4. Count unique accounts in the combined list
-            all_reach_accounts = author_followers | resteem_followers | community_members
+            # 4. Count unique accounts in the combined audience
+            feed_reach = reach.count()
             
             # Cache the result
-            feed_reach = len(all_reach_accounts)
-            self._feed_reach_cache = feed_reach
-            self._feed_reach_post_key = post_key
+            if len(self._feed_reach_cache) >= 256:
+                self._feed_reach_cache.clear()
+            self._feed_reach_cache[post_key] = feed_reach
             
             return feed_reach
         except Exception as e:
@@ -1,11 +1,11 @@
 import configparser
-import json
 from steem import Steem
 from datetime import datetime
 import re
 import requests
 import time
 import logging
+from postView import PostView
 from steemHelpers import initialize_steem_with_retry
 
 # Create a ConfigParser object
@@ -54,23 +54,15 @@ def isEdit(comment, steem_instance=None, latest_content=None):
 
 def hasBlacklistedTag(comment):
     excludedTags=getTagBlacklist()
-    try:
-        if comment.get('json_metadata', None):
-            metadataString=comment['json_metadata']
-            metadataJson=json.loads(metadataString)
-            if isinstance(metadataJson, dict) and metadataJson.get('tags', None) is not None:
-                tags=metadataJson['tags']
-                for tag in tags:
-                    if tag in excludedTags:
-                        return True
-
-        if comment.get('category', None) in excludedTags:
+    post = PostView.of(comment)
+    for tag in post.tags:
+        if tag in excludedTags:
             return True
 
-        return False
-    except (json.JSONDecodeError, AttributeError) as e:
-        print(f"Error parsing metadata for {comment.get('author', 'unknown')}/{comment.get('permlink', 'unknown')}: {e}")
-        return False
+    if post.get('category', None) in excludedTags:
+        return True
+
+    return False
     
 def getTagBlacklist():
     tags = config.get('CONTENT', 'EXCLUDE_TAGS')
@@ -88,10 +80,7 @@ def count_hashtag_words(comment):
         int: The number of words starting with '#'.
     """
     
-    post_metadata = json.loads(comment['json_metadata'])
-    tags = post_metadata['tags']
-
-    hashtag_count = len(tags) if isinstance(tags, list) else 0
+    hashtag_count = len(PostView.of(comment).tags)
             
     return hashtag_count
 
@@ -104,23 +93,15 @@ def hasRequiredTag(comment):
     if ( not requiredTags ):
         return True
     
-    try:
-        if comment.get('json_metadata', None):
-            metadataString=comment['json_metadata']
-            metadataJson=json.loads(metadataString)
-            if isinstance(metadataJson, dict) and metadataJson.get('tags', None) is not None:
-                tags=metadataJson['tags']
-                for tag in tags:
-                    if tag in requiredTags:
-                        return True
-
-        if comment.get('category', None) in requiredTags:
+    post = PostView.of(comment)
+    for tag in post.tags:
+        if tag in requiredTags:
             return True
 
-        return False
-    except (json.JSONDecodeError, AttributeError) as e:
-        print(f"Error parsing metadata for {comment.get('author', 'unknown')}/{comment.get('permlink', 'unknown')}: {e}")
-        return False
+    if post.get('category', None) in requiredTags:
+        return True
+
+    return False
 
 def getIncludeTagList():
     tagsString = config.get('CONTENT', 'INCLUDE_TAGS', fallback='')
@@ -137,25 +118,13 @@ def getTags(comment):
     Returns:
         list: A list of unique tags.
     """
-    tags = set()  # Use a set to automatically handle duplicates
+    post = PostView.of(comment)
+    tags = set(post.tags)  # Use a set to automatically handle duplicates
 
-    try:
-        if comment.get('json_metadata', None):
-            metadata_string = comment['json_metadata']
-            try:
-                metadata_json = json.loads(metadata_string)
-                if isinstance(metadata_json, dict) and metadata_json.get('tags', None) is not None:
-                    tags.update(metadata_json['tags'])  # Add tags to the set
-            except json.JSONDecodeError:
-                print(f"Error decoding JSON metadata: {metadata_string}")
-
-        if comment.get('category', None):
-            tags.add(comment['category'])  # Add category to the set
-
-        return sorted(list(tags))  # Convert the set to a sorted list for the return value
-    except Exception as e:
-        print(f"Error extracting tags for {comment.get('author', 'unknown')}/{comment.get('permlink', 'unknown')}: {e}")
-        return []
+    if post.get('category', None):
+        tags.add(post['category'])  # Add category to the set
+
+    return sorted(list(tags))  # Convert the set to a sorted list for the return value
 
 # Global cache for the DMCA list
 _dmca_cache = set()
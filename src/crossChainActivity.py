@@ -0,0 +1,214 @@
+"""
+Cross-Chain Activity Lookups for Thoth
+
+Authors are rejected (and scored) by how recently they were active on Hive and Blurt.
+Each of those checks used to send its own un-pooled `get_accounts` request. This module
+keeps one keep-alive HTTP session per chain, resolves many authors per
+`condenser_api.get_accounts` request, queries both chains concurrently and remembers
+the results in memory and in a small SQLite table (data/remote_activity.db) for a
+configurable time.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+CHAIN_NODES = {
+    'hive': 'https://api.hive.blog',
+    'blurt': 'https://rpc.blurt.blog',
+}
+
+def last_activity_from_account(account_data):
+    """
+    Return the later of an account's last post and last vote time as
+    "%Y-%m-%d %H:%M:%S", or None if neither is set.
+    """
+    lastPostTime = account_data.get("last_post")
+    lastVoteTime = account_data.get("last_vote_time")
+
+    times = [
+        datetime.fromisoformat(value.replace("Z", "+00:00"))
+        for value in (lastPostTime, lastVoteTime) if value
+    ]
+    if not times:
+        return None
+    return max(times).strftime("%Y-%m-%d %H:%M:%S")
+
+class CrossChainActivity:
+    """Batched, cached last-activity lookups on other chains."""
+
+    def __init__(self, nodes=None, timeout=10, ttl_hours=6.0, db_path="data/remote_activity.db", batch_size=100):
+        """
+        Initialize the sessions and the activity cache.
+
+        Args:
+            nodes: Optional mapping of chain name -> API node URL (defaults to CHAIN_NODES)
+            timeout: HTTP timeout in seconds per request
+            ttl_hours: Hours a looked-up activity date is reused (0 = no caching)
+            db_path: SQLite database for the persistent cache, or None for memory only
+            batch_size: Maximum number of accounts per get_accounts request
+        """
+        self.nodes = dict(nodes or CHAIN_NODES)
+        self.timeout = timeout
+        self.ttl_seconds = ttl_hours * 3600
+        self.db_path = db_path if self.ttl_seconds > 0 else None
+        self.batch_size = batch_size
+        self._sessions = {chain: requests.Session() for chain in self.nodes}
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=len(self.nodes), thread_name_prefix='cross-chain')
+
+        self.requests = 0
+
+        if self.db_path:
+            try:
+                self._init_db()
+            except sqlite3.Error as e:
+                logger.warning(f"Remote activity cache unavailable ({e}); keeping results in memory only.")
+                self.db_path = None
+
+    def _init_db(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS remote_activity (
+                    chain TEXT NOT NULL,
+                    account TEXT NOT NULL,
+                    last_activity TEXT,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (chain, account)
+                )
+            ''')
+            conn.execute('DELETE FROM remote_activity WHERE fetched_at < ?', (time.time() - self.ttl_seconds,))
+            conn.commit()
+
+    def get_last_activity(self, account, chain):
+        """
+        Return the last activity date of an account on a chain.
+
+        If the account is not cached, it is looked up on all chains at once, so the
+        check for the next chain is answered from the cache.
+
+        Returns:
+            str: The last activity as "%Y-%m-%d %H:%M:%S", or None if the account does
+            not exist there or the lookup failed.
+        """
+        chain = chain.lower()
+        if chain not in self.nodes:
+            logger.error(f"Unsupported chain requested: {chain}")
+            return None
+
+        if self.ttl_seconds <= 0:
+            results = self._get_accounts(chain, [account])
+            return last_activity_from_account(results[0]) if results else None
+
+        found, last_activity = self._cached(chain, account)
+        if found:
+            return last_activity
+        self.prefetch([account])
+        return self._cached(chain, account)[1]
+
+    def prefetch(self, accounts):
+        """
+        Look up all uncached accounts on every chain, one batched request per chain
+        and batch_size accounts, with the chains queried concurrently.
+        """
+        if self.ttl_seconds <= 0:
+            return
+        accounts = list(dict.fromkeys(accounts))
+        futures = []
+        for chain in self.nodes:
+            missing = [account for account in accounts if not self._cached(chain, account)[0]]
+            if missing:
+                futures.append(self._executor.submit(self._fetch_chain, chain, missing))
+        for future in futures:
+            future.result()
+
+    def _fetch_chain(self, chain, accounts):
+        for i in range(0, len(accounts), self.batch_size):
+            batch = accounts[i:i + self.batch_size]
+            results = self._get_accounts(chain, batch)
+            if results is None:
+                continue
+            # Accounts missing from the response don't exist on that chain
+            activity = {name: None for name in batch}
+            for account_data in results:
+                try:
+                    activity[account_data['name']] = last_activity_from_account(account_data)
+                except (KeyError, ValueError) as e:
+                    logger.error(f"Error processing {chain} response: {e}")
+            self._store(chain, activity)
+
+    def _get_accounts(self, chain, names):
+        """Returns the get_accounts result for names, or None if the request failed."""
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "condenser_api.get_accounts",
+            "params": [names],
+            "id": 1
+        }
+        self.requests += 1
+        try:
+            response = self._sessions[chain].post(self.nodes[chain], json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error querying {chain} API: {e}")
+            return None
+        except ValueError as e:
+            logger.error(f"Error processing {chain} response: {e}")
+            return None
+
+        if not isinstance(data, dict) or not isinstance(data.get('result'), list):
+            logger.error(f"Error processing {chain} response: {data.get('error') if isinstance(data, dict) else data}")
+            return None
+        return data['result']
+
+    def _cached(self, chain, account):
+        """Returns (found, last_activity) from the memory or disk cache."""
+        key = (chain, account)
+        now = time.time()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[1] < self.ttl_seconds:
+            return True, entry[0]
+
+        if self.db_path:
+            try:
+                with sqlite3.connect(self.db_path) as conn:
+                    row = conn.execute(
+                        'SELECT last_activity, fetched_at FROM remote_activity WHERE chain = ? AND account = ?',
+                        key
+                    ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not read remote activity cache: {e}")
+                row = None
+            if row is not None and now - row[1] < self.ttl_seconds:
+                with self._lock:
+                    self._cache[key] = (row[0], row[1])
+                return True, row[0]
+        return False, None
+
+    def _store(self, chain, activity):
+        now = time.time()
+        with self._lock:
+            for account, last_activity in activity.items():
+                self._cache[(chain, account)] = (last_activity, now)
+        if not self.db_path:
+            return
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO remote_activity (chain, account, last_activity, fetched_at) VALUES (?, ?, ?, ?)',
+                    [(chain, account, last_activity, now) for account, last_activity in activity.items()]
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write remote activity cache: {e}")
@@ -0,0 +1,192 @@
+"""
+Parallel LLM Curation for Thoth
+
+`aiCurator.aicurate` takes tens of seconds per post, and the stream loop used to wait for
+every call before screening the next candidate. CurationPool runs the LLM calls of
+accepted posts on a worker pool, with a concurrency limit per model, while the stream
+keeps screening. Results are handed back strictly in submission order, so the list of
+curated posts is built in the same order as with serial curation.
+
+The pool also keeps the historical AI acceptance rate (persisted, by default in
+data/curation_stats.json). The stream loop uses `expected_accepted()` to stop pulling
+new candidates once the curations in flight are expected to fill the remaining slots;
+if they fall short when they resolve, scanning continues.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+def parse_model_concurrency(value):
+    """Parse 'gemini-2.5-pro:1, gemini-2.5-flash:4' into {'gemini-2.5-pro': 1, 'gemini-2.5-flash': 4}."""
+    limits = {}
+    for item in (value or '').split(','):
+        if ':' not in item:
+            continue
+        model, limit = item.rsplit(':', 1)
+        try:
+            limits[model.strip()] = max(1, int(limit))
+        except ValueError:
+            logger.warning(f"Ignoring invalid LLM_MODEL_CONCURRENCY entry: {item.strip()}")
+    return limits
+
+class CurationPool:
+    """Runs LLM curations concurrently and resolves them in submission order."""
+
+    def __init__(self, concurrency=2, model_concurrency=None, current_model=None, max_pending=None,
+                 stats_file="data/curation_stats.json", max_samples=1000):
+        """
+        Initialize the pool and load the persisted acceptance statistics.
+
+        Args:
+            concurrency: Concurrent LLM calls per model (1 = one call at a time)
+            model_concurrency: Optional mapping of model name -> concurrent calls, overriding
+                               `concurrency` for that model
+            current_model: Callable returning the model the next call will use (e.g. the
+                           current_model of a ModelManager); None = one shared limit
+            max_pending: Maximum number of unresolved curations (defaults to twice the
+                         largest concurrency)
+            stats_file: JSON file the acceptance statistics are persisted in, or None
+            max_samples: Evaluations after which the statistics are halved, so the rate
+                         follows changes in the prompt or the model
+        """
+        self.concurrency = max(1, int(concurrency))
+        self.model_concurrency = dict(model_concurrency or {})
+        self.current_model = current_model or (lambda: None)
+        workers = max([self.concurrency] + list(self.model_concurrency.values()))
+        self.max_pending = max(1, int(max_pending)) if max_pending else 2 * workers
+        self.stats_file = stats_file
+        self.max_samples = max_samples
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='curation')
+        self._semaphores = {}
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._stats = {'evaluations': 0, 'accepted': 0}
+        self._load()
+
+    def submit(self, job, func, *args, **kwargs):
+        """
+        Queue one curation.
+
+        Args:
+            job: Caller data returned together with the result (e.g. the post)
+            func: The curation call, e.g. aiCurator.aicurate
+            *args, **kwargs: Arguments of func
+        """
+        future = self._executor.submit(self._run_limited, func, args, kwargs)
+        self._pending.append((job, future))
+
+    @property
+    def pending(self):
+        """Number of submitted curations that have not been resolved yet."""
+        return len(self._pending)
+
+    @property
+    def full(self):
+        """True if max_pending curations are unresolved."""
+        return len(self._pending) >= self.max_pending
+
+    def ready(self):
+        """
+        Resolve the completed curations at the head of the queue without waiting.
+
+        Yields:
+            (job, future) tuples in submission order; future.result() does not block
+        """
+        while self._pending and self._pending[0][1].done():
+            yield self._pending.popleft()
+
+    def next_result(self):
+        """
+        Wait for the oldest unresolved curation.
+
+        Returns:
+            (job, future) tuple, or None if nothing is pending
+        """
+        if not self._pending:
+            return None
+        job, future = self._pending.popleft()
+        try:
+            future.result()
+        except Exception:
+            # Surfaced to the caller through future.result()
+            pass
+        return job, future
+
+    def cancel(self):
+        """Drop all unresolved curations; calls that already started still finish."""
+        while self._pending:
+            self._pending.popleft()[1].cancel()
+
+    def close(self):
+        """Cancel the unresolved curations, stop the workers and save the statistics."""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.save()
+
+    def acceptance_rate(self):
+        """Historical share of curations the AI accepted (Laplace smoothed)."""
+        with self._lock:
+            return (self._stats['accepted'] + 1) / (self._stats['evaluations'] + 2)
+
+    def expected_accepted(self):
+        """Expected number of accepted posts among the unresolved curations."""
+        return self.pending * self.acceptance_rate()
+
+    def record_outcome(self, accepted):
+        """Record whether the AI accepted a resolved curation."""
+        with self._lock:
+            self._stats['evaluations'] += 1
+            self._stats['accepted'] += 1 if accepted else 0
+            if self._stats['evaluations'] >= self.max_samples:
+                for key in self._stats:
+                    self._stats[key] /= 2
+
+    def statistics(self):
+        """Return a copy of the acceptance statistics."""
+        with self._lock:
+            return dict(self._stats)
+
+    def save(self):
+        """Persist the acceptance statistics (written to a temporary file, then renamed)."""
+        if not self.stats_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.stats_file)), exist_ok=True)
+            tmp_file = f"{self.stats_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.statistics(), f, indent=2)
+            os.replace(tmp_file, self.stats_file)
+        except OSError as e:
+            logger.warning(f"Could not save curation statistics to {self.stats_file}: {e}")
+
+    def _run_limited(self, func, args, kwargs):
+        with self._semaphore(self.current_model()):
+            return func(*args, **kwargs)
+
+    def _semaphore(self, model):
+        with self._lock:
+            semaphore = self._semaphores.get(model)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.model_concurrency.get(model, self.concurrency))
+                self._semaphores[model] = semaphore
+            return semaphore
+
+    def _load(self):
+        if not self.stats_file or not os.path.exists(self.stats_file):
+            return
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._stats = {
+                'evaluations': float(data['evaluations']),
+                'accepted': float(data['accepted'])
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable curation statistics in {self.stats_file}: {e}")
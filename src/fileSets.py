@@ -0,0 +1,95 @@
+"""
+File-Backed Account Sets for Thoth
+
+Lists such as the author whitelist and the screened/uncounted delegatee files are
+plain text files with one entry per line. FileSetRegistry loads each file once,
+keeps it as a frozenset and only re-reads it when its modification time (or size)
+changes, so screening a post no longer opens and parses these files. A process-wide
+registry is shared by authorValidation and walletValidation.
+"""
+
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+def strip_entry(line):
+    """Default normalization: surrounding whitespace removed."""
+    return line.strip()
+
+def normalize_account(line):
+    """Account-name normalization: whitespace and '@' removed, lower case."""
+    return line.strip().lower().replace('@', '')
+
+class FileSetRegistry:
+    """Loads line-based files as sets and reloads them when they change on disk."""
+
+    def __init__(self, check_interval=5.0):
+        """
+        Args:
+            check_interval: Minimum seconds between two mtime checks of the same file
+        """
+        self.check_interval = check_interval
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, path, normalize=strip_entry):
+        """
+        Returns the entries of a file as a frozenset.
+
+        Empty lines are skipped. A missing file is treated as an empty set (and logged once).
+
+        Args:
+            path: Path of the file
+            normalize: Callable applied to each line before it is stored
+        """
+        key = (path, normalize)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry['checked_at'] < self.check_interval:
+            return entry['values']
+
+        with self._lock:
+            entry = self._entries.get(key)
+            signature = self._signature(path)
+            if entry is None or entry['signature'] != signature:
+                if signature is None and (entry is None or entry['signature'] is not None):
+                    logger.warning(f"List file not found at '{path}'. Using an empty list.")
+                entry = {'signature': signature, 'values': self._read(path, normalize)}
+                self._entries[key] = entry
+            entry['checked_at'] = now
+            return entry['values']
+
+    def contains(self, path, value, normalize=strip_entry):
+        """Returns True if value is one of the file's (normalized) entries."""
+        return value in self.get(path, normalize)
+
+    def invalidate(self, path=None):
+        """Forces the given file (or all files) to be read again on the next access."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == path]:
+                    del self._entries[key]
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _read(path, normalize):
+        try:
+            with open(path, 'r') as f:
+                return frozenset(value for value in (normalize(line) for line in f) if value)
+        except FileNotFoundError:
+            return frozenset()
+
+# Registry shared by all screening modules
+file_sets = FileSetRegistry()
@@ -0,0 +1,150 @@
+import sqlite3
+import os
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+class FollowerStore:
+    def __init__(self, db_path="data/followers.db", ttl_hours=24.0, memory_entries=64):
+        """
+        Initializes the local SQLite store for complete follower lists.
+        Creates the necessary directory and table if they do not exist.
+
+        Args:
+            db_path: Path of the SQLite database
+            ttl_hours: Hours a stored list is trusted without checking the follower count
+            memory_entries: Number of recently used lists also kept in memory
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_hours * 3600
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Ensure the directory exists
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS follower_lists (
+                    account TEXT NOT NULL,
+                    account_type TEXT NOT NULL,
+                    follower_count INTEGER,
+                    fetched_at REAL NOT NULL,
+                    followers TEXT NOT NULL,
+                    PRIMARY KEY (account, account_type)
+                )
+            ''')
+            conn.commit()
+
+    def get_followers(self, account, account_type, fetch_all, fetch_count=None):
+        """
+        Returns the follower list of an account, downloading it only when needed.
+
+        A stored list younger than the TTL is returned as is. An older list is kept if
+        fetch_count reports the same follower count as when it was stored; otherwise the
+        list is downloaded again with fetch_all.
+
+        Args:
+            account: The account name
+            account_type: The follow type (e.g. 'blog')
+            fetch_all: Callable returning the complete follower list from the API
+            fetch_count: Optional callable returning the current follower count, or None if unknown
+
+        Returns:
+            list: The follower entries as returned by get_followers
+        """
+        key = (account, account_type)
+        entry = self._load(key)
+        now = time.time()
+        current_count = fetch_count() if fetch_count and entry is None else None
+
+        if entry is not None:
+            follower_count, fetched_at, followers = entry
+            if now - fetched_at < self.ttl_seconds:
+                return followers
+
+            current_count = fetch_count() if fetch_count else None
+            if current_count is not None and current_count == follower_count:
+                # Nothing changed since the list was stored; extend its lifetime.
+                self._save(key, follower_count, now, followers, touch_only=True)
+                return followers
+
+        followers = fetch_all()
+        if followers:
+            self._save(key, current_count, now, followers)
+        return followers
+
+    def invalidate(self, account, account_type='blog'):
+        """Removes an account's stored follower list."""
+        key = (account, account_type)
+        with self._lock:
+            self._memory.pop(key, None)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('DELETE FROM follower_lists WHERE account = ? AND account_type = ?', key)
+            conn.commit()
+
+    def cleanup_old_records(self, retain_days=30):
+        """
+        Deletes follower lists that were not refreshed for retain_days to keep the database small.
+        """
+        cutoff = time.time() - retain_days * 86400
+        with self._lock:
+            for key in [key for key, entry in self._memory.items() if entry[1] < cutoff]:
+                del self._memory[key]
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('DELETE FROM follower_lists WHERE fetched_at < ?', (cutoff,))
+            conn.commit()
+
+    def _load(self, key):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                'SELECT follower_count, fetched_at, followers FROM follower_lists WHERE account = ? AND account_type = ?',
+                key
+            ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            entry = (row[0], row[1], json.loads(row[2]))
+        except ValueError as e:
+            logger.warning(f"Discarding unreadable follower list for {key[0]}: {e}")
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def _save(self, key, follower_count, fetched_at, followers, touch_only=False):
+        self._remember(key, (follower_count, fetched_at, followers))
+        with sqlite3.connect(self.db_path) as conn:
+            if touch_only:
+                conn.execute(
+                    'UPDATE follower_lists SET fetched_at = ? WHERE account = ? AND account_type = ?',
+                    (fetched_at, key[0], key[1])
+                )
+            else:
+                conn.execute(
+                    'INSERT OR REPLACE INTO follower_lists (account, account_type, follower_count, fetched_at, followers) VALUES (?, ?, ?, ?, ?)',
+                    (key[0], key[1], follower_count, fetched_at, json.dumps(followers, separators=(',', ':')))
+                )
+            conn.commit()
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
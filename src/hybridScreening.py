@@ -7,20 +7,37 @@ over content scores for specific hard constraints.
 """
 
 import logging
+import time
+from authorSnapshot import AuthorSnapshot, AuthorSnapshotCache
 from contentScoring import ContentScorer
 from authorValidation import isBlacklisted, isAuthorWhitelisted, isHiveActivityTooRecent, isBlurtActivityTooRecent, isAuthorPostLimitReached, inactiveDays, isRepTooLow, rep_log10
-from contentValidation import isTooShortHard, isEdit, hasBlacklistedTag, hasRequiredTag, word_count, is_dmca
+from contentValidation import isTooShortHard, isEdit, hasBlacklistedTag, hasRequiredTag, is_dmca
 from walletValidation import walletScreened
-from utils import detect_language, remove_formatting
+from utils import detect_language
 from configValidator import ConfigValidator
+from postView import PostView
 from curationHistory import CurationHistory
+from ruleScheduler import RuleScheduler
 
 logger = logging.getLogger(__name__)
 
+# Rule groups in their default order (cheap, frequently rejecting rules first). The groups
+# run in this sequence with the whitelist check between them; only the order of the rules
+# within a group is adapted at runtime.
+PRE_WHITELIST_RULES = 'pre_whitelist'
+POST_WHITELIST_RULES = 'post_whitelist'
+RULE_GROUPS = {
+    PRE_WHITELIST_RULES: ['word_count', 'language', 'edit', 'blacklisted_tags', 'required_tags',
+                          'author_post_limit', 'dmca', 'post_history', 'author_daily_limit',
+                          'author_weekly_limit', 'blacklist'],
+    POST_WHITELIST_RULES: ['reputation', 'steem_inactivity', 'hive_inactivity', 'blurt_inactivity',
+                           'wallet', 'feed_reach'],
+}
+
 class HybridScreening:
     """Hybrid screening system that applies rule-based constraints before content scoring."""
     
-    def __init__(self, steem_instance, config, stats_tracker=None):
+    def __init__(self, steem_instance, config, stats_tracker=None, rpc_batcher=None):
         """
         Initialize the hybrid screening system.
         
@@ -28,14 +45,30 @@ class HybridScreening:
             steem_instance: Steem blockchain instance
             config: Configuration validator with loaded settings
             stats_tracker: Optional StatsTracker instance
+            rpc_batcher: Optional RpcBatcher; the post and its author's records are then
+                         fetched with one batched request per post
         """
         self.steem = steem_instance
         self.config = config
         self.stats_tracker = stats_tracker
-        self.content_scorer = ContentScorer(steem_instance, config)
+        self.rpc_batcher = rpc_batcher
+        # Author records are fetched once and shared by the rule checks and the author score
+        self.author_snapshots = AuthorSnapshotCache(
+            steem_instance,
+            ttl_seconds=config.get_int('SCREENING', 'AUTHOR_CACHE_TTL_SECONDS', 600),
+            max_entries=config.get_int('SCREENING', 'AUTHOR_CACHE_SIZE', 512)
+        )
+        self.content_scorer = ContentScorer(steem_instance, config, author_snapshots=self.author_snapshots,
+                                            stats_tracker=stats_tracker)
         self.curation_history = CurationHistory()
+        # Independent rules are reordered by observed rejection rate per unit of cost
+        self.rule_scheduler = RuleScheduler(
+            RULE_GROUPS,
+            stats_file=config.get('SCREENING', 'RULE_STATS_FILE', 'data/rule_stats.json') or None,
+            adaptive=config.get_boolean('SCREENING', 'ADAPTIVE_RULE_ORDER', True)
+        )
         
-    def screen_content(self, post_data, latest_content=None, included_posts=None):
+    def screen_content(self, post_data, latest_content=None, included_posts=None, track_stats=True):
         """
         Screen content using hybrid approach: rule-based first, then score-based.
         
@@ -43,41 +76,38 @@ class HybridScreening:
             post_data: Dictionary containing post information from blockchain
             latest_content: Optional latest content data to avoid re-fetching
             included_posts: Optional list of already included posts for post limit checking
+            track_stats: If False, the caller records the result later with track_result()
+                         (used by the concurrent pipeline to keep statistics in block order)
             
         Returns:
             Dictionary containing screening result with status and details
         """
-        try:
-            if self.stats_tracker:
-                self.stats_tracker.track_evaluation()
+        result = self._screen(post_data, latest_content, included_posts)
+        if track_stats:
+            self.track_result(result)
+        return result
 
-            # Get detailed post information if not provided
-            if latest_content is None:
-                post = self.steem.get_content(post_data['author'], post_data['permlink'])
+    def _screen(self, post_data, latest_content=None, included_posts=None):
+        """Run the rule-based and score-based screening and build the result dictionary."""
+        try:
+            # Get detailed post information if not provided. Both versions are wrapped in
+            # PostViews so metadata, tags and the clean body are derived only once.
+            if latest_content is None and self.rpc_batcher is not None:
+                post = self._fetch_post_batched(post_data)
+            elif latest_content is None:
+                post = PostView(self.steem.get_content(post_data['author'], post_data['permlink']))
             else:
-                post = latest_content
+                post = PostView.of(latest_content)
+            post_data = PostView.of(post_data)
             
             # Apply rule-based screening (hard constraints)
             rule_result = self._apply_rule_based_screening(post_data, post, included_posts)
             
             if not rule_result['passed']:
-                if self.stats_tracker:
-                    self.stats_tracker.track_rejection(rule_result['rule_type'])
-
-                return {
-                    'status': 'rejected',
-                    'reason': rule_result['reason'],
-                    'rule_type': rule_result['rule_type'],
-                    'score_result': None,
-                    'quality_tier': None,
-                    'ai_intensity': None
-                }
+                return self._rejected_result(rule_result)
             
             # If a rule forces acceptance (e.g., whitelist), bypass scoring.
             if rule_result['rule_type'] == 'whitelist':
-                if self.stats_tracker:
-                    # Track as accepted, with a placeholder tier
-                    self.stats_tracker.track_acceptance(100.0, 'whitelisted')
                 return {
                     'status': 'accepted',
                     'reason': rule_result['reason'],
@@ -94,13 +124,8 @@ class HybridScreening:
             ai_intensity = self.content_scorer.get_ai_analysis_intensity(score_result)
             should_curate = self.content_scorer.should_curate(score_result)
             
-            if self.stats_tracker:
-                if should_curate:
-                    self.stats_tracker.track_acceptance(score_result['total_score'], quality_tier)
-                else:
-                    # This is a score-based rejection
-                    self.stats_tracker.track_rejection('score_rejected', score=score_result['total_score'])
-                    logger.info(f"Score-based rejection: {post_data['author']}/{post_data['permlink']} failed curation threshold (Score: {score_result['total_score']}, Tier: {quality_tier})")
+            if not should_curate:
+                logger.info(f"Score-based rejection: {post_data['author']}/{post_data['permlink']} failed curation threshold (Score: {score_result['total_score']}, Tier: {quality_tier})")
 
             return {
                 'status': 'accepted' if should_curate else 'score_rejected',
@@ -114,20 +139,112 @@ class HybridScreening:
             
         except Exception as e:
             logger.error(f"Error in hybrid screening for {post_data['author']}/{post_data['permlink']}: {e}")
-            return {
-                'status': 'error',
-                'reason': f'screening_error: {str(e)}',
-                'rule_type': 'hybrid',
-                'score_result': None,
-                'quality_tier': None,
-                'ai_intensity': None
-            }
+            return self.error_result(e)
+
+    def _fetch_post_batched(self, post_data):
+        """
+        Fetch a post and, unless its author is cached, the author's account and follow counts
+        in the same JSON-RPC batch (which the batcher may share with other workers' posts).
+        """
+        author = post_data['author']
+        calls = [('condenser_api.get_content', [author, post_data['permlink']])]
+        fetch_author = not self.author_snapshots.contains(author)
+        if fetch_author:
+            calls.append(('condenser_api.get_accounts', [[author]]))
+            calls.append(('condenser_api.get_follow_count', [author]))
+        futures = self.rpc_batcher.submit_many(calls)
+
+        try:
+            post = PostView(futures[0].result())
+        except Exception as e:
+            logger.warning(f"Batched get_content failed for {author}/{post_data['permlink']}, fetching it directly: {e}")
+            post = PostView(self.steem.get_content(author, post_data['permlink']))
+
+        if fetch_author:
+            # A missing snapshot is not an error: the checks fetch the author on demand
+            try:
+                accounts = futures[1].result()
+            except Exception as e:
+                logger.debug(f"Batched get_accounts failed for {author}: {e}")
+                accounts = None
+            try:
+                follow_counts = futures[2].result()
+            except Exception as e:
+                logger.debug(f"Batched get_follow_count failed for {author}: {e}")
+                follow_counts = None
+            if accounts:
+                self.author_snapshots.put(AuthorSnapshot(author, accounts[0], follow_counts=follow_counts,
+                                                         steem_instance=self.steem))
+        return post
+
+    def _rejected_result(self, rule_result):
+        """Build the screening result for a rule-based rejection."""
+        return {
+            'status': 'rejected',
+            'reason': rule_result['reason'],
+            'rule_type': rule_result['rule_type'],
+            'score_result': None,
+            'quality_tier': None,
+            'ai_intensity': None
+        }
+
+    def error_result(self, error):
+        """Build the screening result for a post that could not be screened."""
+        return {
+            'status': 'error',
+            'reason': f'screening_error: {str(error)}',
+            'rule_type': 'hybrid',
+            'score_result': None,
+            'quality_tier': None,
+            'ai_intensity': None
+        }
+
+    def track_result(self, screening_result):
+        """Record a screening result in the statistics tracker."""
+        if not self.stats_tracker:
+            return
+
+        self.stats_tracker.track_evaluation()
+        status = screening_result['status']
+        if status == 'rejected':
+            self.stats_tracker.track_rejection(screening_result['rule_type'])
+        elif status == 'score_rejected':
+            # This is a score-based rejection
+            self.stats_tracker.track_rejection('score_rejected', score=screening_result['total_score'])
+        elif status == 'accepted':
+            if screening_result['rule_type'] == 'whitelist':
+                # Track as accepted, with a placeholder tier
+                self.stats_tracker.track_acceptance(100.0, 'whitelisted')
+            else:
+                self.stats_tracker.track_acceptance(screening_result['total_score'], screening_result['quality_tier'])
+
+    def enforce_post_limit(self, post_data, screening_result, included_posts):
+        """
+        Re-apply the per-author post limit against the current list of included posts.
+
+        Posts screened concurrently only see the included posts that existed when their
+        screening started. Re-checking when results are merged back in block order keeps
+        MAX_INCLUDED_POSTS_PER_AUTHOR exactly as strict as serial screening.
+        """
+        if screening_result['status'] in ('rejected', 'error'):
+            return screening_result
+
+        if isAuthorPostLimitReached(post_data, included_posts):
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} author has reached maximum included posts limit")
+            return self._rejected_result({
+                'reason': 'max_posts_per_author_reached: author has reached the maximum number of included posts',
+                'rule_type': 'author_post_limit'
+            })
+        return screening_result
     
     def _apply_rule_based_screening(self, post_data, post, included_posts=None):
         """
         Apply rule-based screening with hard constraints that override scores.
-        The order of checks is optimized to fail fast on cheap checks first, based on
-        observed rejection statistics.
+
+        Rules run in two groups around the whitelist check: absolute rejections (including
+        the blacklist) before it, and the checks whitelisted authors bypass after it. Within
+        a group the rules are independent, so the RuleScheduler orders them by observed
+        rejection rate per unit of cost to fail fast.
         
         Args:
             post_data: Dictionary containing post information from blockchain
@@ -139,30 +256,93 @@ class HybridScreening:
         """
         author = post_data['author']
         permlink = post_data['permlink']
-        body = post['body']
-        title = post['title']
-        
-        clean_body = remove_formatting(body)
+        post = PostView.of(post)
+        post_data = PostView.of(post_data)
+
+        # --- FUNDAMENTAL CHECKS (Whitelist is a "pass", so these run first) ---
+        rejection = self._run_rule_group(PRE_WHITELIST_RULES, post_data, post, included_posts)
+        if rejection:
+            return rejection
+
+        # Whitelisted authors bypass all other checks (hard checks above already passed)
+        if isAuthorWhitelisted(author):
+            logger.info(f"Rule-based acceptance: {author}/{permlink} is whitelisted and passed all prior hard checks")
+            return {
+                'passed': True,
+                'reason': f'whitelisted_author: {author}',
+                'rule_type': 'whitelist'
+            }
 
-        # --- FAST, LOCAL CHECKS (ordered by rejection rate) ---
+        # --- SLOW, NETWORK-INTENSIVE CHECKS (for non-whitelisted authors) ---
+        rejection = self._run_rule_group(POST_WHITELIST_RULES, post_data, post, included_posts)
+        if rejection:
+            return rejection
 
-        # Rule 1: Word count must exceed the hard minimum (fastest check, highest rejection rate)
-        if isTooShortHard(clean_body):
+        # If all rule-based checks pass, content can proceed to scoring
+        return {
+            'passed': True,
+            'reason': 'passed_all_rule_checks',
+            'rule_type': 'rules_passed'
+        }
+
+    def should_curate(self, screening_result):
+        """Determine if content should be curated based on screening result."""
+        if screening_result['status'] == 'accepted':
+            return True
+        return False
+    
+    def get_ai_analysis_intensity(self, screening_result):
+        """Get AI analysis intensity from screening result."""
+        return screening_result.get('ai_intensity', 'none')
+    
+    def get_quality_tier(self, screening_result):
+        """Get quality tier from screening result."""
+        return screening_result.get('quality_tier', 'reject')
+    
+    def get_total_score(self, screening_result):
+        """Get total score from screening result."""
+        return screening_result.get('total_score', 0.0)
+
+    def _run_rule_group(self, group, post_data, post, included_posts):
+        """Run the rules of a group in scheduled order and return the first rejection, if any."""
+        for rule in self.rule_scheduler.order(group):
+            start = time.perf_counter()
+            rejection = getattr(self, f'_rule_{rule}')(post_data, post, included_posts)
+            elapsed = time.perf_counter() - start
+            self.rule_scheduler.record(rule, elapsed, rejection is not None)
+            if self.stats_tracker:
+                self.stats_tracker.track_timing(f'rule.{rule}', elapsed)
+            if rejection:
+                return rejection
+        return None
+
+    # Each rule returns None if the post passes, or the rejection dictionary.
+
+    def _rule_word_count(self, post_data, post, included_posts):
+        # Word count must exceed the hard minimum
+        if isTooShortHard(post.word_count):
             min_words_hard = self.config.get_int('CONTENT', 'MIN_WORDS_HARD', 0)
-            actual_word_count = word_count(clean_body)
-            logger.info(f"Rule-based rejection: {author}/{permlink} below hard minimum word count ({actual_word_count} < {min_words_hard})")
+            actual_word_count = post.word_count
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} below hard minimum word count ({actual_word_count} < {min_words_hard})")
             return {
                 'passed': False,
                 'reason': f'below_minimum_words: {actual_word_count} < {min_words_hard}',
                 'rule_type': 'word_count'
             }
+        return None
 
-        # Rule 2: Language must be in the allowed list (local check, high rejection rate)
+    def _rule_language(self, post_data, post, included_posts):
+        # Language must be in the allowed list
+        author = post_data['author']
+        permlink = post_data['permlink']
         try:
             target_languages = [lang.strip() for lang in self.config.get('CONTENT', 'LANGUAGE').split(',') if lang.strip()]
             if target_languages:  # Only perform check if languages are configured
-                body_language = detect_language(clean_body)
-                title_language = detect_language(title)
+                detect_start = time.perf_counter()
+                body_language = detect_language(post.clean_body)
+                title_language = detect_language(post['title'])
+                if self.stats_tracker:
+                    self.stats_tracker.track_timing('language_detection', time.perf_counter() - detect_start)
 
                 if body_language not in target_languages or title_language not in target_languages:
                     logger.info(f"Rule-based rejection: {author}/{permlink} language not in target list (body: {body_language}, title: {title_language}, allowed: {target_languages})")
@@ -175,56 +355,67 @@ class HybridScreening:
             logger.warning(f"Language detection failed for {author}/{permlink}: {e}")
             # If language detection fails, we could either reject or allow
             # For now, we'll allow it to proceed to scoring
-            pass
+        return None
 
-        # Rule 3: Check for edits (fast check, moderate rejection rate)
+    def _rule_edit(self, post_data, post, included_posts):
+        # Edited posts are rejected
         if isEdit(post_data, steem_instance=self.steem, latest_content=post):
-            logger.info(f"Rule-based rejection: {author}/{permlink} appears to be an edited post")
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} appears to be an edited post")
             return {
                 'passed': False,
                 'reason': 'edited_post: post appears to have been edited',
                 'rule_type': 'edit_check'
             }
+        return None
 
-        # Rule 4: Blacklisted tags must be rejected (fast check)
+    def _rule_blacklisted_tags(self, post_data, post, included_posts):
+        # Blacklisted tags must be rejected
         if hasBlacklistedTag(post) or hasBlacklistedTag(post_data):
-            logger.info(f"Rule-based rejection: {author}/{permlink} contains blacklisted tags")
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} contains blacklisted tags")
             return {
                 'passed': False,
                 'reason': 'blacklisted_tags: post contains excluded tags',
                 'rule_type': 'tag_filter'
             }
+        return None
 
-        # Rule 5: Check for required tags (fast check)
+    def _rule_required_tags(self, post_data, post, included_posts):
+        # Required tags must be present
         if not hasRequiredTag(post):
-            logger.info(f"Rule-based rejection: {author}/{permlink} missing required tags")
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} missing required tags")
             return {
                 'passed': False,
                 'reason': 'missing_required_tags: post does not contain required tags',
                 'rule_type': 'tag_filter'
             }
+        return None
 
-        # Rule 6: Check if author has reached the maximum number of included posts (very fast in-memory check)
+    def _rule_author_post_limit(self, post_data, post, included_posts):
+        # Author must not have reached the maximum number of included posts (in-memory check)
         if isAuthorPostLimitReached(post_data, included_posts):
-            logger.info(f"Rule-based rejection: {author}/{permlink} author has reached maximum included posts limit")
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} author has reached maximum included posts limit")
             return {
                 'passed': False,
                 'reason': 'max_posts_per_author_reached: author has reached the maximum number of included posts',
                 'rule_type': 'author_post_limit'
             }
+        return None
 
-        # Rule 7: DMCA Check (fast in-memory/cached check)
+    def _rule_dmca(self, post_data, post, included_posts):
+        # Posts on the Condenser DMCA list are rejected (cached check)
         if is_dmca(post_data):
-            logger.info(f"Rule-based rejection: {author}/{permlink} is on the Condenser DMCA list")
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} is on the Condenser DMCA list")
             return {
                 'passed': False,
                 'reason': 'dmca_blocked: post is on the Condenser DMCA list',
                 'rule_type': 'dmca'
             }
+        return None
 
-        # --- HISTORY CHECKS (Local Database) ---
-
-        # Rule: Post curation frequency limit (30 days)
+    def _rule_post_history(self, post_data, post, included_posts):
+        # Post curation frequency limit (30 days, local database)
+        author = post_data['author']
+        permlink = post_data['permlink']
         if self.curation_history.has_post_been_curated(author, permlink, days=30):
             logger.info(f"Rule-based rejection: {author}/{permlink} was already curated in the last 30 days")
             return {
@@ -232,137 +423,124 @@ class HybridScreening:
                 'reason': 'post_already_curated: post was curated within the last 30 days',
                 'rule_type': 'history_post_limit'
             }
+        return None
 
-        # Rule: Author daily curation limit
+    def _rule_author_daily_limit(self, post_data, post, included_posts):
+        # Author daily curation limit (local database)
         max_author_per_day = self.config.get_int('HISTORY', 'MAX_AUTHOR_PER_DAY', 1)
         if max_author_per_day > 0:
-            daily_count = self.curation_history.get_author_curation_count(author, days=1)
+            daily_count = self.curation_history.get_author_curation_count(post_data['author'], days=1)
             if daily_count >= max_author_per_day:
-                logger.info(f"Rule-based rejection: {author}/{permlink} exceeded daily curation limit ({daily_count} >= {max_author_per_day})")
+                logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} exceeded daily curation limit ({daily_count} >= {max_author_per_day})")
                 return {
                     'passed': False,
                     'reason': f'daily_author_limit: author has been curated {daily_count} times in the last 24 hours (max {max_author_per_day})',
                     'rule_type': 'history_author_limit'
                 }
+        return None
 
-        # Rule: Author weekly curation limit
+    def _rule_author_weekly_limit(self, post_data, post, included_posts):
+        # Author weekly curation limit (local database)
         max_author_per_week = self.config.get_int('HISTORY', 'MAX_AUTHOR_PER_WEEK', 2)
         if max_author_per_week > 0:
-            weekly_count = self.curation_history.get_author_curation_count(author, days=7)
+            weekly_count = self.curation_history.get_author_curation_count(post_data['author'], days=7)
             if weekly_count >= max_author_per_week:
-                logger.info(f"Rule-based rejection: {author}/{permlink} exceeded weekly curation limit ({weekly_count} >= {max_author_per_week})")
+                logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} exceeded weekly curation limit ({weekly_count} >= {max_author_per_week})")
                 return {
                     'passed': False,
                     'reason': f'weekly_author_limit: author has been curated {weekly_count} times in the last 7 days (max {max_author_per_week})',
                     'rule_type': 'history_author_limit'
                 }
+        return None
 
-        # --- FUNDAMENTAL AUTHOR STATUS CHECKS (Whitelist is a "pass", so check blacklist first) ---
-
-        # Rule 7: Blacklisted authors must be excluded (absolute rule, first network call)
+    def _rule_blacklist(self, post_data, post, included_posts):
+        # Blacklisted authors must be excluded (absolute rule, must run before the whitelist)
+        author = post_data['author']
         if isBlacklisted(author, steem_instance=self.steem):
-            logger.info(f"Rule-based rejection: {author}/{permlink} is blacklisted")
+            logger.info(f"Rule-based rejection: {author}/{post_data['permlink']} is blacklisted")
             return {
                 'passed': False,
                 'reason': f'blacklisted_author: {author}',
                 'rule_type': 'blacklist'
             }
+        return None
 
-        # Rule 8: Whitelisted authors bypass all other checks (word count already checked)
-        if isAuthorWhitelisted(author):
-            logger.info(f"Rule-based acceptance: {author}/{permlink} is whitelisted and passed all prior hard checks")
-            return {
-                'passed': True,
-                'reason': f'whitelisted_author: {author}',
-                'rule_type': 'whitelist'
-            }
-
-        # --- SLOW, NETWORK-INTENSIVE CHECKS (for non-whitelisted authors) ---
-        
-        # Rule 9: Author reputation must meet the hard minimum (fast check, but placed here to allow whitelist bypass)
+    def _rule_reputation(self, post_data, post, included_posts):
+        # Author reputation must meet the hard minimum (after the whitelist to allow bypass)
         if isRepTooLow(post['author_reputation']):
             min_rep = self.config.get_int('AUTHOR', 'MIN_REPUTATION', 0)
             actual_rep = rep_log10(post['author_reputation'])
-            logger.info(f"Rule-based rejection: {author}/{permlink} author reputation below minimum ({actual_rep:.2f} < {min_rep})")
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} author reputation below minimum ({actual_rep:.2f} < {min_rep})")
             return {
                 'passed': False,
                 'reason': f'below_minimum_reputation: {actual_rep:.2f} < {min_rep}',
                 'rule_type': 'reputation'
             }
+        return None
 
-        # Rule 10: Steem inactivity must not exceed the hard limit (network call)
+    def _rule_steem_inactivity(self, post_data, post, included_posts):
+        # Steem inactivity must not exceed the hard limit (network call)
+        author = post_data['author']
         max_inactivity_days = self.config.get_int('AUTHOR', 'MAX_INACTIVITY_DAYS', 0)
         if max_inactivity_days > 0:
-            steem_inactive_days = inactiveDays(author, steem_instance=self.steem)
+            steem_inactive_days = inactiveDays(author, steem_instance=self.steem, snapshot=self.author_snapshots.get(author))
             if steem_inactive_days > max_inactivity_days:
-                logger.info(f"Rule-based rejection: {author}/{permlink} has been inactive on Steem for {steem_inactive_days} days (Hard Max: {max_inactivity_days})")
+                logger.info(f"Rule-based rejection: {author}/{post_data['permlink']} has been inactive on Steem for {steem_inactive_days} days (Hard Max: {max_inactivity_days})")
                 return {
                     'passed': False,
                     'reason': f'steem_inactivity: author inactive for {steem_inactive_days} days',
                     'rule_type': 'steem_inactivity'
                 }
+        return None
 
-        # Rule 11: Hive inactivity must be higher than specified days (network call)
-        if isHiveActivityTooRecent(author):
+    def _rule_hive_inactivity(self, post_data, post, included_posts):
+        # Hive inactivity must be higher than specified days (network call)
+        if isHiveActivityTooRecent(post_data['author']):
             hive_inactivity_days = self.config.get_int('AUTHOR', 'MIN_HIVE_INACTIVITY_HARD', 7)
-            logger.info(f"Rule-based rejection: {author}/{permlink} has recent Hive activity (below {hive_inactivity_days} days)")
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} has recent Hive activity (below {hive_inactivity_days} days)")
             return {
                 'passed': False,
                 'reason': f'recent_hive_activity: author has been active on Hive recently',
                 'rule_type': 'hive_inactivity'
             }
+        return None
 
-        # Rule 11b: Blurt inactivity must be higher than specified days (network call)
-        if isBlurtActivityTooRecent(author):
+    def _rule_blurt_inactivity(self, post_data, post, included_posts):
+        # Blurt inactivity must be higher than specified days (network call)
+        if isBlurtActivityTooRecent(post_data['author']):
             blurt_inactivity_days = self.config.get_int('AUTHOR', 'MIN_BLURT_INACTIVITY_HARD', 7)
-            logger.info(f"Rule-based rejection: {author}/{permlink} has recent Blurt activity (below {blurt_inactivity_days} days)")
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} has recent Blurt activity (below {blurt_inactivity_days} days)")
             return {
                 'passed': False,
                 'reason': f'recent_blurt_activity: author has been active on Blurt recently',
                 'rule_type': 'blurt_inactivity'
             }
+        return None
 
-        # Rule 12: Wallet screening (slowest check, do last)
-        if walletScreened(author, steem_instance=self.steem):
-            logger.info(f"Rule-based rejection: {author}/{permlink} wallet flagged by screening")
+    def _rule_wallet(self, post_data, post, included_posts):
+        # Wallet screening (network call)
+        author = post_data['author']
+        # The snapshot cache has already retried the account fetch. Without an account record
+        # the wallet cannot be verified, the same outcome walletScreened gives a failed fetch.
+        snapshot = self.author_snapshots.get(author)
+        if snapshot is None or walletScreened(author, steem_instance=self.steem, snapshot=snapshot):
+            logger.info(f"Rule-based rejection: {author}/{post_data['permlink']} wallet flagged by screening")
             return {
                 'passed': False,
                 'reason': 'wallet_screened: author wallet flagged by screening',
                 'rule_type': 'wallet_screened'
             }
+        return None
 
-        # Rule 13: Feed reach screening (optional, network-intensive)
+    def _rule_feed_reach(self, post_data, post, included_posts):
+        # Feed reach screening (optional, network-intensive)
         if not self.content_scorer.is_feed_reach_sufficient(post):
             min_feed_reach = self.config.get_int('ENGAGEMENT', 'FEED_REACH_MIN', 10)
             actual_feed_reach = self.content_scorer._calculate_feed_reach(post)
-            logger.info(f"Rule-based rejection: {author}/{permlink} feed reach too low ({actual_feed_reach} < {min_feed_reach})")
+            logger.info(f"Rule-based rejection: {post_data['author']}/{post_data['permlink']} feed reach too low ({actual_feed_reach} < {min_feed_reach})")
             return {
                 'passed': False,
                 'reason': f'feed_reach_too_low: {actual_feed_reach} < {min_feed_reach}',
                 'rule_type': 'feed_reach_screening'
             }
-
-        # If all rule-based checks pass, content can proceed to scoring
-        return {
-            'passed': True,
-            'reason': 'passed_all_rule_checks',
-            'rule_type': 'rules_passed'
-        }
-    
-    def should_curate(self, screening_result):
-        """Determine if content should be curated based on screening result."""
-        if screening_result['status'] == 'accepted':
-            return True
-        return False
-    
-    def get_ai_analysis_intensity(self, screening_result):
-        """Get AI analysis intensity from screening result."""
-        return screening_result.get('ai_intensity', 'none')
-    
-    def get_quality_tier(self, screening_result):
-        """Get quality tier from screening result."""
-        return screening_result.get('quality_tier', 'reject')
-    
-    def get_total_score(self, screening_result):
-        """Get total score from screening result."""
-        return screening_result.get('total_score', 0.0)
\ No newline at end of file
+        return None
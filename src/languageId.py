@@ -0,0 +1,135 @@
+"""
+Language Identification for Thoth
+
+The language filter runs on almost every screened post, and it used to pass the whole
+cleaned body to langdetect, which is slow on long posts and returns different answers
+for the same text from run to run (it samples randomly). This module classifies a
+bounded sample of the text (its beginning plus a slice from the middle) with a
+langdetect factory that has a fixed seed, and caches results by content hash, so
+identical text is only classified once and always gets the same answer.
+"""
+
+import configparser
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
+from langdetect.lang_detect_exception import LangDetectException
+
+logger = logging.getLogger(__name__)
+
+# Create a ConfigParser object
+config = configparser.ConfigParser()
+
+# Read the config.ini file
+config.read('config/config.ini')
+
+UNDETECTED = "Unable to detect language"
+
+class LanguageIdentifier:
+    """Deterministic, sampled and cached language detection."""
+
+    def __init__(self, sample_chars=2000, cache_size=4096, seed=0, detector=None):
+        """
+        Initialize the identifier.
+
+        Args:
+            sample_chars: Maximum number of characters classified per text (0 = whole text).
+                          Half is taken from the start and half from the middle of longer texts.
+            cache_size: Number of results kept, keyed by a hash of the sample
+            seed: Seed of the langdetect detector, which makes results reproducible
+            detector: Optional callable text -> language code (defaults to seeded langdetect)
+        """
+        self.sample_chars = sample_chars
+        self.cache_size = cache_size
+        self.seed = seed
+        self._detector = detector
+        self._factory = None
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.cache_hits = 0
+        self.total_seconds = 0.0
+
+    def sample(self, text):
+        """Return the part of text that is classified."""
+        limit = self.sample_chars
+        if limit <= 0 or len(text) <= limit:
+            return text
+        half = limit // 2
+        head = text[:half]
+        middle_start = (len(text) - half) // 2
+        # Start the middle slice at a word boundary so it doesn't begin with a word fragment
+        boundary = text.find(' ', middle_start, middle_start + 50)
+        if boundary != -1:
+            middle_start = boundary + 1
+        return head + ' ' + text[middle_start:middle_start + half]
+
+    def detect(self, text):
+        """Return the language code of text, or "Unable to detect language"."""
+        start = time.perf_counter()
+        sample = self.sample(text or '')
+        key = hashlib.blake2b(sample.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+        with self._lock:
+            language = self._cache.get(key)
+            if language is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+
+        if language is None:
+            language = self._classify(sample)
+            with self._lock:
+                self._cache[key] = language
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.calls += 1
+            self.total_seconds += elapsed
+        return language
+
+    def _classify(self, sample):
+        if self._detector is not None:
+            return self._detector(sample)
+        try:
+            detector = self._get_factory().create()
+            detector.append(sample)
+            return detector.detect()
+        except LangDetectException:
+            return UNDETECTED
+
+    def _get_factory(self):
+        # A private factory keeps the seed out of langdetect's global state
+        if self._factory is None:
+            with self._lock:
+                if self._factory is None:
+                    factory = DetectorFactory()
+                    factory.load_profile(PROFILES_DIRECTORY)
+                    factory.set_seed(self.seed)
+                    self._factory = factory
+        return self._factory
+
+_default_identifier = None
+_default_identifier_lock = threading.Lock()
+
+def get_language_identifier():
+    """Return the shared LanguageIdentifier, configured from [CONTENT] in config.ini."""
+    global _default_identifier
+    if _default_identifier is None:
+        with _default_identifier_lock:
+            if _default_identifier is None:
+                _default_identifier = LanguageIdentifier(
+                    sample_chars=config.getint('CONTENT', 'LANGUAGE_SAMPLE_CHARS', fallback=2000),
+                    cache_size=config.getint('CONTENT', 'LANGUAGE_CACHE_SIZE', fallback=4096)
+                )
+    return _default_identifier
+
+def detect_language(text):
+    """Detect the language of text with the shared LanguageIdentifier."""
+    return get_language_identifier().detect(text)
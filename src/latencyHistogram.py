@@ -0,0 +1,116 @@
+"""
+Latency Histograms for Thoth
+
+Keeping every duration of a long run in a list grows without bound (an RPC method can be
+called hundreds of thousands of times in a 3-hour run). LatencyHistogram counts
+durations in fixed, logarithmically spaced buckets instead: memory is constant, and
+percentiles are accurate to the bucket width (about 12% with 20 buckets per decade).
+Count, sum, minimum and maximum are kept exactly.
+"""
+
+import math
+
+# Bucket layout shared by all histograms: 20 buckets per decade from 1 µs to ~2.8 hours
+MIN_MS = 0.001
+MAX_MS = 1e7
+BUCKETS_PER_DECADE = 20
+_BUCKET_COUNT = int(math.log10(MAX_MS / MIN_MS) * BUCKETS_PER_DECADE)
+
+class LatencyHistogram:
+    """A streaming histogram of durations in milliseconds with fixed log-spaced buckets."""
+
+    def __init__(self):
+        # Index 0 collects durations below MIN_MS, the last index those above MAX_MS
+        self.buckets = [0] * (_BUCKET_COUNT + 2)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def bucket_index(ms):
+        """Return the index of the bucket a duration in milliseconds falls into."""
+        if ms < MIN_MS:
+            return 0
+        index = int(math.log10(ms / MIN_MS) * BUCKETS_PER_DECADE) + 1
+        return min(index, _BUCKET_COUNT + 1)
+
+    @staticmethod
+    def bucket_bounds(index):
+        """Return the (lower, upper) bound in milliseconds of a bucket."""
+        if index == 0:
+            return 0.0, MIN_MS
+        lower = MIN_MS * 10 ** ((index - 1) / BUCKETS_PER_DECADE)
+        if index > _BUCKET_COUNT:
+            return lower, math.inf
+        return lower, MIN_MS * 10 ** (index / BUCKETS_PER_DECADE)
+
+    def record(self, ms):
+        """Add one duration in milliseconds."""
+        self.buckets[self.bucket_index(ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.min = ms if self.min is None else min(self.min, ms)
+        self.max = ms if self.max is None else max(self.max, ms)
+
+    def merge(self, other):
+        """Add all durations recorded in another histogram."""
+        for index, count in enumerate(other.buckets):
+            self.buckets[index] += count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self):
+        """Mean duration in milliseconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q):
+        """
+        Estimate a quantile from the buckets.
+
+        Args:
+            q (float): Quantile between 0 and 1 (e.g. 0.95 for p95)
+
+        Returns:
+            float: Geometric midpoint of the bucket holding the quantile, clamped to the
+                   observed minimum and maximum (0.0 if nothing was recorded)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                if index == 0:
+                    return self.min
+                if index == len(self.buckets) - 1:
+                    return self.max
+                lower, upper = self.bucket_bounds(index)
+                return min(max(math.sqrt(lower * upper), self.min), self.max)
+        return self.max
+
+    def to_dict(self):
+        """Return the summary statistics and the non-empty buckets as a JSON-serializable dict."""
+        # Upper bound of each bucket (ms) -> count; the overflow bucket is reported as "inf"
+        buckets = {}
+        for index, count in enumerate(self.buckets):
+            if count:
+                upper = self.bucket_bounds(index)[1]
+                buckets['inf' if upper == math.inf else f"{upper:.6g}"] = count
+        return {
+            'count': self.count,
+            'total_ms': round(self.total, 3),
+            'mean_ms': round(self.mean, 3),
+            'min_ms': round(self.min or 0.0, 3),
+            'max_ms': round(self.max or 0.0, 3),
+            'p50_ms': round(self.quantile(0.50), 3),
+            'p95_ms': round(self.quantile(0.95), 3),
+            'p99_ms': round(self.quantile(0.99), 3),
+            'buckets': buckets
+        }
@@ -0,0 +1,183 @@
+"""
+LLM Response Cache for Thoth
+
+Re-runs over the same block range, HISTORY-mode overlaps and re-screened posts used to
+send unchanged post bodies to the LLM again, paying the full latency and quota. This
+module stores curation responses in a small SQLite database (data/llm_cache.db), keyed
+by a hash of everything that determines the response: the model, the system and user
+prompts (after language substitution), the output language and the normalized post body.
+
+Entries expire after a configurable number of days, and the least recently used entries
+are evicted once the cache holds more than a configured number of responses.
+"""
+
+import configparser
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+# Create a ConfigParser object
+config = configparser.ConfigParser()
+
+# Read the config.ini file
+config.read('config/config.ini')
+
+def normalize_body(body):
+    """Normalize a post body so whitespace and Unicode representation changes don't miss the cache."""
+    return ' '.join(unicodedata.normalize('NFC', body or '').split())
+
+def text_hash(text):
+    """Return the SHA-256 hex digest of a text."""
+    return hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+
+def cache_key(model, system_prompt, user_prompt, language, body):
+    """
+    Build the cache key of one curation request.
+
+    Args:
+        model: Model the request is sent to
+        system_prompt: System prompt (without the date line)
+        user_prompt: User prompt template after language substitution
+        language: Output language
+        body: Post body (normalized before hashing)
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    parts = [model, text_hash(system_prompt), text_hash(user_prompt), language, text_hash(normalize_body(body))]
+    return text_hash('\n'.join(parts))
+
+class LlmResponseCache:
+    """Persistent cache of LLM responses with TTL and size-based (LRU) eviction."""
+
+    def __init__(self, db_path="data/llm_cache.db", ttl_days=30.0, max_entries=5000):
+        """
+        Initialize the cache and remove expired entries.
+
+        Args:
+            db_path: SQLite database file
+            ttl_days: Days a response is reused (0 = never expires)
+            max_entries: Maximum number of cached responses (0 = unlimited)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        try:
+            self._init_db()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache unavailable ({e}); responses will not be cached.")
+            self.db_path = None
+
+    def _init_db(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    cache_key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses (last_used)')
+            if self.ttl_seconds > 0:
+                conn.execute('DELETE FROM llm_responses WHERE created_at < ?', (time.time() - self.ttl_seconds,))
+            conn.commit()
+
+    def get(self, key):
+        """
+        Return the cached response for a key, or None if it is missing or expired.
+        """
+        if not self.db_path:
+            return None
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute('SELECT response, created_at FROM llm_responses WHERE cache_key = ?', (key,)).fetchone()
+                if row is not None and self.ttl_seconds > 0 and now - row[1] >= self.ttl_seconds:
+                    conn.execute('DELETE FROM llm_responses WHERE cache_key = ?', (key,))
+                    row = None
+                elif row is not None:
+                    conn.execute('UPDATE llm_responses SET last_used = ? WHERE cache_key = ?', (now, key))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read LLM response cache: {e}")
+            row = None
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return row[0]
+
+    def put(self, key, model, response):
+        """Store a response and evict the least recently used entries above max_entries."""
+        if not self.db_path:
+            return
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO llm_responses (cache_key, model, response, created_at, last_used) VALUES (?, ?, ?, ?, ?)',
+                    (key, model, response, now, now)
+                )
+                if self.max_entries > 0:
+                    count = conn.execute('SELECT COUNT(*) FROM llm_responses').fetchone()[0]
+                    if count > self.max_entries:
+                        conn.execute(
+                            'DELETE FROM llm_responses WHERE cache_key IN '
+                            '(SELECT cache_key FROM llm_responses ORDER BY last_used ASC LIMIT ?)',
+                            (count - self.max_entries,)
+                        )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write LLM response cache: {e}")
+
+    def __len__(self):
+        if not self.db_path:
+            return 0
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                return conn.execute('SELECT COUNT(*) FROM llm_responses').fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+_llm_cache = None
+_llm_cache_lock = threading.Lock()
+
+def get_llm_cache():
+    """
+    Return the process-wide LlmResponseCache configured from [LLM] in config.ini, or None
+    if LLM_CACHE is disabled.
+    """
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                try:
+                    enabled = config.getboolean('LLM', 'LLM_CACHE', fallback=True)
+                    ttl_days = config.getfloat('LLM', 'LLM_CACHE_TTL_DAYS', fallback=30.0)
+                    max_entries = config.getint('LLM', 'LLM_CACHE_MAX_ENTRIES', fallback=5000)
+                except ValueError:
+                    enabled, ttl_days, max_entries = True, 30.0, 5000
+                if not enabled:
+                    _llm_cache = False
+                else:
+                    _llm_cache = LlmResponseCache(
+                        config.get('LLM', 'LLM_CACHE_FILE', fallback='data/llm_cache.db'),
+                        ttl_days=ttl_days,
+                        max_entries=max_entries
+                    )
+    return _llm_cache if _llm_cache is not False else None
@@ -0,0 +1,174 @@
+"""
+Streaming LLM Completions for Thoth
+
+With `"stream": False`, aicurate waits for the whole completion (up to 8192 tokens)
+before it can see that the model rejected the post. With streaming, the API sends the
+completion as server-sent events (SSE), one `data: {...}` line per chunk of tokens.
+This module reads those chunks as they arrive, removes `<think>`/`<thought>` blocks
+incrementally (so reasoning text never triggers a verdict), and stops reading as soon
+as a rejection verdict or the stop marker appears in the visible text. Closing the
+stream closes the connection, which ends the generation on the server side.
+"""
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+THINK_TAGS = (('<think>', '</think>'), ('<thought>', '</thought>'))
+
+def _partial_suffix(text, tags):
+    """Length of the longest suffix of text that is a proper prefix of one of the tags."""
+    longest = 0
+    for tag in tags:
+        for length in range(min(len(tag) - 1, len(text)), longest, -1):
+            if text.endswith(tag[:length]):
+                longest = length
+                break
+    return longest
+
+class ThinkStripper:
+    """Removes <think>...</think> and <thought>...</thought> blocks from text fed in pieces."""
+
+    def __init__(self, tags=THINK_TAGS):
+        self.tags = tags
+        self._buffer = ''
+        self._closing_tag = None
+
+    def feed(self, text):
+        """
+        Add the next piece of text.
+
+        Returns:
+            str: The text that is now known to be outside of any think block. Text that
+                 could be the start of a tag is held back until the next piece arrives.
+        """
+        self._buffer += text
+        visible = []
+        while self._buffer:
+            if self._closing_tag is None:
+                found = [(self._buffer.find(opening), opening, closing) for opening, closing in self.tags]
+                found = [match for match in found if match[0] >= 0]
+                if not found:
+                    keep = _partial_suffix(self._buffer, [opening for opening, _ in self.tags])
+                    visible.append(self._buffer[:len(self._buffer) - keep])
+                    self._buffer = self._buffer[len(self._buffer) - keep:]
+                    break
+                index, opening, closing = min(found)
+                visible.append(self._buffer[:index])
+                self._buffer = self._buffer[index + len(opening):]
+                self._closing_tag = closing
+            else:
+                index = self._buffer.find(self._closing_tag)
+                if index < 0:
+                    keep = _partial_suffix(self._buffer, [self._closing_tag])
+                    self._buffer = self._buffer[len(self._buffer) - keep:]
+                    break
+                self._buffer = self._buffer[index + len(self._closing_tag):]
+                self._closing_tag = None
+        return ''.join(visible)
+
+    def flush(self):
+        """Return the held-back text at the end of the stream (an unclosed think block is dropped)."""
+        text = '' if self._closing_tag is not None else self._buffer
+        self._buffer = ''
+        return text
+
+def iter_sse_data(lines):
+    """
+    Yield the data payloads of a server-sent event stream.
+
+    Args:
+        lines: Iterable of decoded lines of the response body
+
+    Yields:
+        str: The data of each event (multi-line data joined with newlines), until the
+             OpenAI-style `[DONE]` event
+    """
+    data = []
+    for line in lines:
+        if line is None:
+            continue
+        line = line.rstrip('\r')
+        if not line:
+            if data:
+                payload = '\n'.join(data)
+                data = []
+                if payload.strip() == '[DONE]':
+                    return
+                yield payload
+            continue
+        if line.startswith(':'):
+            continue  # comment / keep-alive
+        field, _, value = line.partition(':')
+        if field == 'data':
+            data.append(value[1:] if value.startswith(' ') else value)
+    if data:
+        payload = '\n'.join(data)
+        if payload.strip() != '[DONE]':
+            yield payload
+
+def chunk_text(payload):
+    """
+    Return the completion text of one streamed chat completion chunk.
+
+    Raises:
+        json.JSONDecodeError: If the chunk is not JSON
+        ValueError: If the chunk reports an error
+    """
+    chunk = json.loads(payload)
+    if isinstance(chunk, list):
+        chunk = chunk[0] if chunk else {}
+    if 'error' in chunk:
+        raise ValueError(f"LLM stream error: {chunk['error']}")
+    choices = chunk.get('choices') or [{}]
+    delta = choices[0].get('delta') or choices[0].get('message') or {}
+    return delta.get('content') or ''
+
+def read_streamed_completion(lines, stop_markers=(), verdicts=()):
+    """
+    Read a streamed chat completion until it ends, a verdict appears or a stop marker appears.
+
+    Args:
+        lines: Iterable of response lines (a generator is closed when reading stops, which
+               closes the connection)
+        stop_markers: Strings that end the completion; the text is cut before the marker
+        verdicts: Strings that decide the outcome (e.g. "DO NOT CURATE"); the text is
+                  kept up to and including the verdict
+
+    Returns:
+        tuple: (raw text including think blocks, visible text, the marker or verdict that
+               stopped reading or None if the stream ended by itself)
+    """
+    stripper = ThinkStripper()
+    raw = []
+    visible = ''
+    markers = list(stop_markers) + list(verdicts)
+    longest_marker = max((len(marker) for marker in markers), default=0)
+    try:
+        for payload in iter_sse_data(lines):
+            text = chunk_text(payload)
+            if not text:
+                continue
+            raw.append(text)
+            new_text = stripper.feed(text)
+            if not new_text:
+                continue
+            # Only the new text and the few characters before it can contain a new marker
+            search_from = max(0, len(visible) - longest_marker)
+            visible += new_text
+            found = [(visible.find(marker, search_from), marker) for marker in markers]
+            found = [match for match in found if match[0] >= 0]
+            if found:
+                index, marker = min(found)
+                end = index if marker in stop_markers else index + len(marker)
+                return ''.join(raw), visible[:end].strip(), marker
+        visible += stripper.flush()
+        for marker in stop_markers:
+            if marker in visible:
+                visible = visible[:visible.index(marker)]
+        return ''.join(raw), visible.strip(), None
+    finally:
+        close = getattr(lines, 'close', None)
+        if close:
+            close()
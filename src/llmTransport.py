@@ -0,0 +1,241 @@
+"""
+Shared HTTP Transport for LLM Calls
+
+aiCurator and aiIntro used to call `requests.post` for every request: each call opened a
+new connection (with a new TLS handshake) and had no timeout, so a hung connection could
+block the run indefinitely. LlmTransport keeps one pooled keep-alive session for all LLM
+calls, applies connect and read timeouts, and records the time to the first byte of the
+response (TTFB) and the total request time.
+
+HTTP/2 is optional: with LLM_HTTP2 enabled and the `httpx` package (with its `h2` extra)
+installed, requests are sent over an HTTP/2 client. Responses are returned as
+`requests.Response` objects and errors are raised as `requests` exceptions either way,
+so callers handle both transports the same way.
+"""
+
+import configparser
+import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from latencyHistogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Create a ConfigParser object
+config = configparser.ConfigParser()
+
+# Read the config.ini file
+config.read('config/config.ini')
+
+class LlmTransport:
+    """Pooled, timed HTTP POSTs to LLM endpoints."""
+
+    def __init__(self, connect_timeout=10.0, read_timeout=300.0, http2=False, pool_size=10):
+        """
+        Initialize the transport.
+
+        Args:
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for the server between bytes of the response
+                          (including the wait for the first byte)
+            http2: Use HTTP/2 through httpx if it is installed
+            pool_size: Maximum number of kept-alive connections per host
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.stats_tracker = None
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._http2_client = self._create_http2_client(pool_size) if http2 else None
+        self._timings = {'ttfb': LatencyHistogram(), 'total': LatencyHistogram()}
+        self._lock = threading.Lock()
+
+    @property
+    def http2(self):
+        """True if requests are sent over HTTP/2."""
+        return self._http2_client is not None
+
+    def post(self, url, headers=None, data=None):
+        """
+        Send a POST request and read the whole response.
+
+        Args:
+            url: Endpoint URL
+            headers: Request headers
+            data: Request body (str or bytes)
+
+        Returns:
+            requests.Response: The response; call raise_for_status() to check the status
+
+        Raises:
+            requests.exceptions.Timeout: If connecting or reading timed out
+            requests.exceptions.RequestException: For other transport errors
+        """
+        if self._http2_client is not None:
+            return self._post_http2(url, headers, data)
+
+        start = time.perf_counter()
+        response = self._session.post(
+            url, headers=headers, data=data,
+            timeout=(self.connect_timeout, self.read_timeout),
+            stream=True
+        )
+        ttfb = time.perf_counter() - start
+        try:
+            response.content  # reads the body within the read timeout
+        finally:
+            response.close()  # returns the connection to the pool
+        self._record(ttfb, time.perf_counter() - start)
+        return response
+
+    def stream_lines(self, url, headers=None, data=None):
+        """
+        Send a POST request and yield the lines of the response body as they arrive.
+
+        Closing the generator before the end closes the connection, which is how a
+        streamed completion is cancelled. TTFB is the time until the response headers
+        arrived, the total time ends when the generator finishes or is closed.
+
+        Args:
+            url: Endpoint URL
+            headers: Request headers
+            data: Request body (str or bytes)
+
+        Yields:
+            str: Decoded lines of the response body (UTF-8, without line endings)
+
+        Raises:
+            requests.exceptions.HTTPError: If the response status is 4xx/5xx (the
+                                           error body is read first)
+            requests.exceptions.Timeout: If connecting or reading timed out
+            requests.exceptions.RequestException: For other transport errors
+        """
+        if self._http2_client is not None:
+            yield from self._stream_lines_http2(url, headers, data)
+            return
+
+        start = time.perf_counter()
+        response = self._session.post(
+            url, headers=headers, data=data,
+            timeout=(self.connect_timeout, self.read_timeout),
+            stream=True
+        )
+        ttfb = time.perf_counter() - start
+        try:
+            if response.status_code >= 400:
+                response.content
+                response.raise_for_status()
+            # Server-sent events are always UTF-8; requests would assume ISO-8859-1 for text/*
+            response.encoding = 'utf-8'
+            for line in response.iter_lines(chunk_size=1024, decode_unicode=True):
+                yield line
+        finally:
+            response.close()
+            self._record(ttfb, time.perf_counter() - start)
+
+    def metrics(self):
+        """
+        Return the request timings.
+
+        Returns:
+            dict: 'ttfb' and 'total' latency histogram summaries in milliseconds
+        """
+        with self._lock:
+            return {name: histogram.to_dict() for name, histogram in self._timings.items()}
+
+    def close(self):
+        """Close the pooled connections."""
+        self._session.close()
+        if self._http2_client is not None:
+            self._http2_client.close()
+
+    def _create_http2_client(self, pool_size):
+        try:
+            import httpx
+            return httpx.Client(
+                http2=True,
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            )
+        except ImportError as e:
+            logger.warning(f"LLM_HTTP2 needs the httpx package with HTTP/2 support (pip install 'httpx[http2]'): {e}. Using HTTP/1.1.")
+            return None
+
+    def _post_http2(self, url, headers, data):
+        import httpx
+        start = time.perf_counter()
+        try:
+            with self._http2_client.stream('POST', url, headers=headers, content=data) as http2_response:
+                ttfb = time.perf_counter() - start
+                body = http2_response.read()
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        self._record(ttfb, time.perf_counter() - start)
+        return self._as_requests_response(http2_response, body, url, headers)
+
+    def _stream_lines_http2(self, url, headers, data):
+        import httpx
+        start = time.perf_counter()
+        ttfb = None
+        try:
+            with self._http2_client.stream('POST', url, headers=headers, content=data) as http2_response:
+                ttfb = time.perf_counter() - start
+                if http2_response.status_code >= 400:
+                    body = http2_response.read()
+                    self._as_requests_response(http2_response, body, url, headers).raise_for_status()
+                for line in http2_response.iter_lines():
+                    yield line
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        finally:
+            if ttfb is not None:
+                self._record(ttfb, time.perf_counter() - start)
+
+    def _as_requests_response(self, http2_response, body, url, headers):
+        """Convert a read httpx response into a requests.Response."""
+        response = requests.Response()
+        response.status_code = http2_response.status_code
+        response.reason = http2_response.reason_phrase
+        response.headers = CaseInsensitiveDict(http2_response.headers)
+        response.encoding = http2_response.encoding
+        response.url = url
+        response.request = requests.Request('POST', url, headers=headers).prepare()
+        response._content = body
+        return response
+
+    def _record(self, ttfb, total):
+        with self._lock:
+            self._timings['ttfb'].record(ttfb * 1000.0)
+            self._timings['total'].record(total * 1000.0)
+        if self.stats_tracker:
+            self.stats_tracker.track_timing('llm.ttfb', ttfb)
+            self.stats_tracker.track_timing('llm.request', total)
+
+_llm_transport = None
+_llm_transport_lock = threading.Lock()
+
+def get_llm_transport():
+    """Return the process-wide LlmTransport, configured from [LLM] in config.ini."""
+    global _llm_transport
+    if _llm_transport is None:
+        with _llm_transport_lock:
+            if _llm_transport is None:
+                try:
+                    connect_timeout = config.getfloat('LLM', 'LLM_CONNECT_TIMEOUT', fallback=10.0)
+                    read_timeout = config.getfloat('LLM', 'LLM_READ_TIMEOUT', fallback=300.0)
+                    http2 = config.getboolean('LLM', 'LLM_HTTP2', fallback=False)
+                except ValueError:
+                    connect_timeout, read_timeout, http2 = 10.0, 300.0, False
+                _llm_transport = LlmTransport(connect_timeout=connect_timeout, read_timeout=read_timeout, http2=http2)
+    return _llm_transport
@@ -8,15 +8,26 @@ import sys
 import logging
 
 import aiIntro
+from authorPrefetch import AuthorPrefetcher
+from authorValidation import cleanupFollowerStore, prefetchRemoteActivity
 import utils  # From the thoth package
 import aiCurator # From the thoth package
 import postHelper # From the thoth package
 import delegationInfo
+from blockIngestion import BlockIngestor
+from checkpointManager import CheckpointManager
 from configValidator import ConfigValidator
+from curationPool import CurationPool, parse_model_concurrency
 from hybridScreening import HybridScreening
+from llmCache import get_llm_cache
+from llmTransport import get_llm_transport
 from modelManager import ModelManager
+from rateLimiter import get_rate_limiter
+from postView import PostView
+from rpcBatch import RpcBatchClient, RpcBatcher
+from screeningPipeline import ScreeningPipeline
 from statsTracker import StatsTracker
-from steemHelpers import initialize_steem_with_retry
+from steemHelpers import initialize_steem_with_retry, instrument_rpc, parse_node_list
 import version
 
 from steem.blockchain import Blockchain
@@ -101,6 +112,14 @@ try:
 except Exception:
     skip_onchain_history = config.get('HISTORY', 'SKIP_ONCHAIN_HISTORY', fallback='False').lower() in ('1', 'true', 'yes', 'on')
 
+# Concurrent LLM curation while the stream keeps screening
+try:
+    curation_concurrency = config.getint('LLM', 'CURATION_CONCURRENCY', fallback=2)
+except ValueError:
+    curation_concurrency = 2
+curation_model_concurrency = parse_model_concurrency(config.get('LLM', 'LLM_MODEL_CONCURRENCY', fallback=''))
+curation_stats_file = config.get('LLM', 'CURATION_STATS_FILE', fallback='data/curation_stats.json').strip()
+
 print(f"Model switching enabled: {enable_model_switching}. Model Dry run: {model_switching_dry_run}. Skip AI: {skip_ai_curation}. Steem Dry run: {steem_dry_run}. Skip on-chain history: {skip_onchain_history}")
 
 ### Validate the config to avoid failures at posting time.
@@ -124,11 +143,69 @@ try:
 except Exception:
     stream_time_weight = 1.0
 
+# Batched block-range ingestion (replaces the per-operation Blockchain.stream walk)
+try:
+    batched_ingestion = config.getboolean('STEEM', 'BATCHED_INGESTION', fallback=True)
+except Exception:
+    batched_ingestion = config.get('STEEM', 'BATCHED_INGESTION', fallback='True').lower() in ('1', 'true', 'yes', 'on')
+
+try:
+    ingest_batch_size = config.getint('STEEM', 'INGEST_BATCH_SIZE', fallback=50)
+    ingest_prefetch_depth = config.getint('STEEM', 'INGEST_PREFETCH_DEPTH', fallback=4)
+except ValueError:
+    ingest_batch_size = 50
+    ingest_prefetch_depth = 4
+
+# Coalesced checkpointing of the last processed block
+try:
+    checkpoint_interval_seconds = config.getfloat('STEEM', 'CHECKPOINT_INTERVAL_SECONDS', fallback=30.0)
+    checkpoint_interval_blocks = config.getint('STEEM', 'CHECKPOINT_INTERVAL_BLOCKS', fallback=1000)
+except ValueError:
+    checkpoint_interval_seconds = 30.0
+    checkpoint_interval_blocks = 1000
+
+# Concurrent screening of candidate posts
+try:
+    screening_worker_count = config.getint('SCREENING', 'WORKER_COUNT', fallback=1)
+    screening_queue_depth = config.getint('SCREENING', 'QUEUE_DEPTH', fallback=32)
+except ValueError:
+    screening_worker_count = 1
+    screening_queue_depth = 32
+
+try:
+    prefetch_authors = config.getboolean('SCREENING', 'PREFETCH_AUTHORS', fallback=True)
+except Exception:
+    prefetch_authors = config.get('SCREENING', 'PREFETCH_AUTHORS', fallback='True').lower() in ('1', 'true', 'yes', 'on')
+
+try:
+    prefetch_lookahead = config.getint('SCREENING', 'PREFETCH_LOOKAHEAD', fallback=50)
+    prefetch_max_wait = config.getfloat('SCREENING', 'PREFETCH_MAX_WAIT_SECONDS', fallback=2.0)
+    prefetch_max_blocks = config.getint('SCREENING', 'PREFETCH_MAX_BLOCKS', fallback=20)
+except ValueError:
+    prefetch_lookahead = 50
+    prefetch_max_wait = 2.0
+    prefetch_max_blocks = 20
+
+# Coalesce the per-post reads of concurrent screening workers into JSON-RPC batches
+try:
+    rpc_batching = config.getboolean('SCREENING', 'RPC_BATCHING', fallback=True)
+    rpc_batch_window_ms = config.getfloat('SCREENING', 'RPC_BATCH_WINDOW_MS', fallback=10.0)
+    rpc_batch_max_calls = config.getint('SCREENING', 'RPC_BATCH_MAX_CALLS', fallback=50)
+except ValueError:
+    rpc_batching = True
+    rpc_batch_window_ms = 10.0
+    rpc_batch_max_calls = 50
+
+# Machine-readable copy of the run statistics (including latency histograms); empty = disabled
+stats_json_file = config.get('SCREENING', 'STATS_JSON_FILE', fallback='data/run_stats.json').strip()
+
 maxSize=config.getint('BLOG', 'NUMBER_OF_REVIEWED_POSTS')
 
 commentList = []
 aiResponseList = []
 scoreList = []  # Track scores for each curated post
+# Curated posts plus the posts whose AI curation is still in flight (for the per-author post limit)
+reservedPosts = []
 
 earliest_timestamp = None
 latest_timestamp = None
@@ -160,27 +237,73 @@ else:
 
 # File to store the last processed block
 BLOCK_FILE = 'config/last_block.txt'
-if os.path.exists(BLOCK_FILE):
-    with open(BLOCK_FILE, 'r') as f:
-        lastBlock = int(f.read().strip())
+checkpoint = CheckpointManager(
+    BLOCK_FILE,
+    flush_interval_seconds=checkpoint_interval_seconds,
+    flush_interval_blocks=checkpoint_interval_blocks
+)
+lastBlock = checkpoint.last_block
+if lastBlock:
     print(f"Resuming from local file block memory: {lastBlock}")
 else:
-    lastBlock = 0
     print("No previous local history found, will use default start block.")
 
 # Initialize the statistics tracker
 stats_tracker = StatsTracker()
+instrument_rpc(steemdInstance, stats_tracker)
+# Report the time RPC calls wait for the shared rate limiter as 'rate_limit_wait.<bucket>'
+get_rate_limiter().stats_tracker = stats_tracker
+# Time to first byte and total time of every LLM request as 'llm.ttfb' and 'llm.request'
+get_llm_transport().stats_tracker = stats_tracker
+
+# Batch the post and author reads of each screened post (and of concurrent workers) into one request
+rpc_batcher = None
+if rpc_batching:
+    rpc_batcher = RpcBatcher(
+        RpcBatchClient(parse_node_list(steemApi)),
+        window_seconds=rpc_batch_window_ms / 1000.0,
+        max_batch_size=rpc_batch_max_calls
+    )
 
 # Initialize the Hybrid Screening system for quality-based curation
-hybrid_screening = HybridScreening(steemdInstance, validator, stats_tracker=stats_tracker)
+hybrid_screening = HybridScreening(steemdInstance, validator, stats_tracker=stats_tracker, rpc_batcher=rpc_batcher)
 print("Hybrid screening system initialized.")
 
+# Screen candidate posts concurrently while keeping results in block order
+screening_pipeline = ScreeningPipeline(hybrid_screening, worker_count=screening_worker_count, queue_depth=screening_queue_depth)
+if screening_pipeline.worker_count > 1:
+    print(f"Concurrent screening enabled ({screening_pipeline.worker_count} workers, queue depth {screening_pipeline.queue_depth}).")
+
+# Resolve upcoming authors in bulk before screening reaches them
+author_prefetcher = AuthorPrefetcher(
+    hybrid_screening.author_snapshots,
+    nodes=parse_node_list(steemApi),
+    lookahead=prefetch_lookahead,
+    remote_activity=prefetchRemoteActivity,
+    max_wait=prefetch_max_wait,
+    max_blocks=prefetch_max_blocks
+)
+if prefetch_authors:
+    print(f"Author prefetching enabled (lookahead: {prefetch_lookahead} posts, at most {prefetch_max_wait}s or {prefetch_max_blocks} blocks).")
+
 # Clean up old records from curation history database
 hybrid_screening.curation_history.cleanup_old_records()
 
+# Drop follower lists that were not refreshed for a month
+cleanupFollowerStore()
+
 blockchain = Blockchain(steemd_instance=steemdInstance)
 print(f"Using blockchain with nodes: {steemdInstance.steemd.nodes}")
 
+block_ingestor = BlockIngestor(
+    steemdInstance,
+    nodes=parse_node_list(steemApi),
+    batch_size=ingest_batch_size,
+    prefetch_depth=ingest_prefetch_depth
+)
+if batched_ingestion:
+    print(f"Batched block ingestion enabled (window: {ingest_batch_size} blocks, prefetch depth: {ingest_prefetch_depth}).")
+
 defaultStartBlockStr = config.get('STEEM', 'DEFAULT_START_BLOCK').split()[0]
 defaultStartBlock = int(defaultStartBlockStr)
 
@@ -233,136 +356,208 @@ elif ( streamType == 'HISTORY'):
 else:
     print (f"Invalid CONFIG -> STREAM_TYPE setting: {streamType}")
     exit()
-    
-print(f"Starting from block {streamFromBlock}")
+
+# If the previous run with this stream type was interrupted, continue exactly where it stopped
+# instead of sampling a new start block.
+interrupted_run = checkpoint.interrupted_run(streamType)
+if interrupted_run:
+    streamFromBlock = interrupted_run['last_block']
+    print(f"Previous {streamType} run {interrupted_run.get('run_id')} (sampled start block {interrupted_run.get('start_block')}) did not complete. Resuming it.")
+    run_id = checkpoint.begin_run(
+        streamType,
+        interrupted_run.get('start_block', streamFromBlock),
+        run_id=interrupted_run.get('run_id'),
+        resume_block=streamFromBlock
+    )
+else:
+    run_id = checkpoint.begin_run(streamType, streamFromBlock)
+
+print(f"Starting from block {streamFromBlock} (run id: {run_id})")
 
 # Ensure the 'data' directory exists
 os.makedirs('data', exist_ok=True)
 
+# AI curations run in the background; their results are resolved in the order the posts were accepted
+curation_pool = CurationPool(
+    concurrency=curation_concurrency,
+    model_concurrency=curation_model_concurrency,
+    current_model=lambda: model_manager.current_model,
+    # Mock responses would distort the historical acceptance rate
+    stats_file=None if skip_ai_curation else (curation_stats_file or None)
+)
+print(f"AI curation concurrency: {curation_pool.concurrency} per model (up to {curation_pool.max_pending} pending).")
+
+def resolve_curation(job, future):
+    """Record the AI response of one curation and add the post to the curated lists if accepted."""
+    global postCount
+    comment = job['comment']
+    latestPostVersion = job['post']
+    screening_result = job['screening_result']
+    block = job['block']
+    try:
+        aiResponse = future.result()
+    except Exception as e:
+        logging.error(f"AI Curation for @{comment['author']}/{comment['permlink']} raised {type(e).__name__}: {e}")
+        aiResponse = "Unexpected Error"
+
+    with open('data/output.html', 'a', encoding='utf-8') as f:
+        print(f"URL: https://steemit.com/@{comment['author']}/{comment['permlink']}")
+        print(f"Title: {latestPostVersion['title']}")
+        if screening_result['score_result']:
+            print(f"Score: {screening_result['total_score']} ({screening_result['quality_tier']})")
+        print(f"Body (first 200 chars): {job['body'][:200]}...\n\nAI Response: {aiResponse}\n", file=f)
+    logging.info(f"[{block}/{postCount}] Finished AI Curation for @{comment['author']}/{comment['permlink']}.")
+    logging.info(f"AI Response:\n{aiResponse}\n")
+
+    accepted = False
+    MIN_AI_RESPONSE_LENGTH = 100 # Define a reasonable minimum length
+    if (re.search("DO NOT CURATE", aiResponse) or (aiResponse == "Content Error - Empty Body" )):
+        logging.info(f"{block}/{postCount}: @{comment['author']}/{comment['permlink']}: disqualified by AI.")
+        curation_pool.record_outcome(False)
+    elif aiResponse.startswith("API Error") or \
+         aiResponse == "JSON Error" or \
+         aiResponse == "Response Error" or \
+         aiResponse == "Unexpected Error":
+        # aiCurator has already attempted retries for relevant API errors.
+        # Log the failure and continue with the next post.
+        logging.error(f"{block}/{postCount}: AI Curation for @{comment['author']}/{comment['permlink']} failed. AI System Response: '{aiResponse}'. Skipping this post.")
+    elif len(aiResponse) < MIN_AI_RESPONSE_LENGTH:
+        logging.warning(f"{block}/{postCount}: @{comment['author']}/{comment['permlink']}: disqualified by AI (response too short: '{aiResponse}').")
+        curation_pool.record_outcome(False)
+    elif postCount >= maxSize:
+        logging.info(f"{block}/{postCount}: @{comment['author']}/{comment['permlink']}: accepted by AI, but {maxSize} posts are already curated.")
+    else:
+        accepted = True
+        curation_pool.record_outcome(True)
+        commentList.append(latestPostVersion)
+        aiResponseList.append(aiResponse)
+        # Track scores for each curated post (only if scoring was performed)
+        if screening_result['score_result']:
+            scoreList.append(screening_result['score_result'])
+        else:
+            # Create a minimal score entry for rejected posts
+            scoreList.append({
+                'total_score': 0.0,
+                'quality_tier': 'rejected',
+                'components': {'author': 0.0, 'content': 0.0, 'engagement': 0.0}
+            })
+        postCount = postCount + 1
+        logging.info(f"Content curated successfully! ({postCount}/{maxSize})")
+    if not accepted:
+        reservedPosts[:] = [post for post in reservedPosts if post is not latestPostVersion]
+
+def curate_mock(author):
+    return f"[SKIP_AI_CURATION ENABLED] Mock AI curation summary for post by @{author}. This placeholder text ensures the minimum response length requirement is met without calling the LLM API. {'=' * 50}"
+
+def curate_timed(*args, **kwargs):
+    with stats_tracker.timed('llm.curate'):
+        return aiCurator.aicurate(*args, **kwargs)
+
 # Empty and initialize the output file
 with open('data/output.html', 'w', encoding='utf-8') as f:
     print(f"Starting from block {streamFromBlock}\n\n", file=f)
 
 while retry_count <= max_retries:
     try:
-        stream = blockchain.stream(start_block=streamFromBlock, filter_by=['comment'])
+        if batched_ingestion:
+            # Yields top-level comment operations only, fetched in batched block windows
+            stream = block_ingestor.stream_posts(streamFromBlock)
+        else:
+            stream = blockchain.stream(start_block=streamFromBlock, filter_by=['comment'])
+        if prefetch_authors:
+            stream = author_prefetcher.wrap(stream)
 
-        for operation in stream:
+        for operation, screening_result in screening_pipeline.run(stream, reservedPosts):
             streamFromBlock = operation['block_num'] + 1
             
-            # Save the current block number to file
-            with open(BLOCK_FILE, 'w') as f:
-                f.write(str(streamFromBlock))
+            # Record the current block number (flushed to file on an interval)
+            checkpoint.update(streamFromBlock)
 
             retry_count = 0
+            for job, future in curation_pool.ready():
+                resolve_curation(job, future)
             if (postCount >= maxSize):
                 break    
-            if 'type' in operation and operation['type'] == 'comment':
+            if screening_result is not None: # top-level posts only
                 comment = operation
 
-                if 'parent_author' in comment and comment['parent_author'] == '': # top-level posts only
-                    current_timestamp = comment['timestamp']
-                    # The timestamp from the stream is a datetime object.
-                    if earliest_timestamp is None or current_timestamp < earliest_timestamp:
-                        earliest_timestamp = current_timestamp
-                    
-                    if latest_timestamp is None or current_timestamp > latest_timestamp:
-                        latest_timestamp = current_timestamp
-
-                    # Use hybrid screening system (rule-based first, then score-based)
-                    try:
-                        screening_result = hybrid_screening.screen_content(comment, included_posts=commentList)
-                        status = screening_result['status']
-                        reason = screening_result['reason']
-                        
-                        logging.info(f"Comment by {comment['author']}/{comment['permlink']}: {comment['title']}")
-                        logging.info(f"Screening Status: {status} ({reason})")
-                        
-                        if screening_result['score_result']:
-                            total_score = screening_result['total_score']
-                            quality_tier = screening_result['quality_tier']
-                            ai_intensity = screening_result['ai_intensity']
-                            logging.info(f"Score: {total_score} ({quality_tier}) - AI Intensity: {ai_intensity}")
-                            logging.info(f"Components: Author={screening_result['score_result']['components']['author']}, Content={screening_result['score_result']['components']['content']}, Engagement={screening_result['score_result']['components']['engagement']}")
-                        else:
-                            logging.info("No score available (rejected by rule-based screening)")
-                    except Exception as e:
-                        print(f"Error in hybrid screening for {comment['author']}/{comment['permlink']}: {e}")
-                        continue
-                    
-                    # Determine if content should be curated based on hybrid screening
-                    should_curate = hybrid_screening.should_curate(screening_result)
-                    ai_intensity = hybrid_screening.get_ai_analysis_intensity(screening_result)
-                    
-                    if should_curate and ai_intensity != 'none':
-                        ### Retrieve the latest version of the post
-                        latestPostVersion=steemdInstance.get_content(comment['author'],comment['permlink'])
-                        tmpBody = utils.remove_formatting(latestPostVersion['body'])
-                        logging.info(f"Content accepted for curation with {ai_intensity} AI analysis.")
-
-                        ### Get the AI Evaluation with score context
-                        logging.info(f"[{streamFromBlock}/{postCount}] Starting AI Curation evaluation for @{operation['author']}/{operation['permlink']}...")
-                        if skip_ai_curation:
-                            logging.info(f"Skipping AI Curation API call for @{operation['author']}/{operation['permlink']} (SKIP_AI_CURATION is enabled).")
-                            aiResponse = f"[SKIP_AI_CURATION ENABLED] Mock AI curation summary for post by @{operation['author']}. This placeholder text ensures the minimum response length requirement is met without calling the LLM API. {'=' * 50}"
-                        else:
-                            aiResponse = aiCurator.aicurate(
-                                llmKey, llmModel, llmUrl, tmpBody,
-                                model_manager=model_manager,
-                                enable_switching=enable_model_switching,
-                                dry_run=model_switching_dry_run,
-                                author=operation['author'],
-                                permlink=operation['permlink']
-                            )
-                        with open('data/output.html', 'a', encoding='utf-8') as f:
-                            print(f"URL: https://steemit.com/@{comment['author']}/{comment['permlink']}")
-                            print(f"Title: {latestPostVersion['title']}")
-                            if screening_result['score_result']:
-                                print(f"Score: {screening_result['total_score']} ({screening_result['quality_tier']})")
-                            print(f"Body (first 200 chars): {tmpBody[:200]}...\n\nAI Response: {aiResponse}\n", file=f)
-                        logging.info(f"[{streamFromBlock}/{postCount}] Finished AI Curation for @{operation['author']}/{operation['permlink']}.")
-                        logging.info(f"AI Response:\n{aiResponse}\n")
-
-                        MIN_AI_RESPONSE_LENGTH = 100 # Define a reasonable minimum length
-                        if (re.search("DO NOT CURATE", aiResponse) or (aiResponse == "Content Error - Empty Body" )):
-                            logging.info(f"{streamFromBlock}/{postCount}: @{operation['author']}/{operation['permlink']}: disqualified by AI.")
-                        elif aiResponse.startswith("API Error") or \
-                             aiResponse == "JSON Error" or \
-                             aiResponse == "Response Error" or \
-                             aiResponse == "Unexpected Error":
-                            # aiCurator has already attempted retries for relevant API errors.
-                            # Log the failure and continue with the next post.
-                            logging.error(f"{streamFromBlock}/{postCount}: AI Curation for @{operation['author']}/{operation['permlink']} failed. AI System Response: '{aiResponse}'. Skipping this post.")
-                        elif len(aiResponse) < MIN_AI_RESPONSE_LENGTH:
-                            logging.warning(f"{streamFromBlock}/{postCount}: @{operation['author']}/{operation['permlink']}: disqualified by AI (response too short: '{aiResponse}').")
-                        else:
-                            commentList.append(latestPostVersion)
-                            aiResponseList.append(aiResponse)
-                            # Track scores for each curated post (only if scoring was performed)
-                            if screening_result['score_result']:
-                                scoreList.append(screening_result['score_result'])
-                            else:
-                                # Create a minimal score entry for rejected posts
-                                scoreList.append({
-                                    'total_score': 0.0,
-                                    'quality_tier': 'rejected',
-                                    'components': {'author': 0.0, 'content': 0.0, 'engagement': 0.0}
-                                })
-                            postCount = postCount + 1
-                            logging.info(f"Content curated successfully! ({postCount}/{maxSize})")
+                current_timestamp = comment['timestamp']
+                # The timestamp from the stream is a datetime object.
+                if earliest_timestamp is None or current_timestamp < earliest_timestamp:
+                    earliest_timestamp = current_timestamp
+                
+                if latest_timestamp is None or current_timestamp > latest_timestamp:
+                    latest_timestamp = current_timestamp
+
+                # Hybrid screening (rule-based first, then score-based) was run by the screening pipeline
+                if screening_result['status'] == 'error':
+                    print(f"Error in hybrid screening for {comment['author']}/{comment['permlink']}: {screening_result['reason']}")
+                    continue
+
+                status = screening_result['status']
+                reason = screening_result['reason']
+                
+                logging.info(f"Comment by {comment['author']}/{comment['permlink']}: {comment['title']}")
+                logging.info(f"Screening Status: {status} ({reason})")
+                
+                if screening_result['score_result']:
+                    total_score = screening_result['total_score']
+                    quality_tier = screening_result['quality_tier']
+                    ai_intensity = screening_result['ai_intensity']
+                    logging.info(f"Score: {total_score} ({quality_tier}) - AI Intensity: {ai_intensity}")
+                    logging.info(f"Components: Author={screening_result['score_result']['components']['author']}, Content={screening_result['score_result']['components']['content']}, Engagement={screening_result['score_result']['components']['engagement']}")
+                else:
+                    logging.info("No score available (rejected by rule-based screening)")
+                
+                # Determine if content should be curated based on hybrid screening
+                should_curate = hybrid_screening.should_curate(screening_result)
+                ai_intensity = hybrid_screening.get_ai_analysis_intensity(screening_result)
+                
+                if should_curate and ai_intensity != 'none':
+                    ### Retrieve the latest version of the post
+                    latestPostVersion=PostView(steemdInstance.get_content(comment['author'],comment['permlink']))
+                    tmpBody = latestPostVersion.clean_body
+                    logging.info(f"Content accepted for curation with {ai_intensity} AI analysis.")
+
+                    ### Get the AI Evaluation with score context (in the background)
+                    logging.info(f"[{streamFromBlock}/{postCount}] Starting AI Curation evaluation for @{operation['author']}/{operation['permlink']}...")
+                    job = {'comment': comment, 'post': latestPostVersion, 'body': tmpBody, 'screening_result': screening_result, 'block': streamFromBlock}
+                    reservedPosts.append(latestPostVersion)
+                    if skip_ai_curation:
+                        logging.info(f"Skipping AI Curation API call for @{operation['author']}/{operation['permlink']} (SKIP_AI_CURATION is enabled).")
+                        curation_pool.submit(job, curate_mock, operation['author'])
                     else:
-                        reason = screening_result['reason']
-                        logging.info(f"{streamFromBlock}/{postCount}: @{operation['author']}/{operation['permlink']}: excluded by hybrid screening ({reason})")
-                # else:
-                    # print(f"{postCount}: {operation['type']}")
+                        curation_pool.submit(
+                            job, curate_timed,
+                            llmKey, llmModel, llmUrl, tmpBody,
+                            model_manager=model_manager,
+                            enable_switching=enable_model_switching,
+                            dry_run=model_switching_dry_run,
+                            author=operation['author'],
+                            permlink=operation['permlink']
+                        )
+
+                    # Stop pulling candidates while the pending curations are expected to fill
+                    # the remaining slots (or the pool is full); resume if they fall short.
+                    while curation_pool.pending and (curation_pool.full or postCount + curation_pool.expected_accepted() >= maxSize):
+                        resolve_curation(*curation_pool.next_result())
+                    if postCount >= maxSize:
+                        # Stop here so no further posts are pulled from the screening pipeline
+                        break
+                else:
+                    reason = screening_result['reason']
+                    logging.info(f"{streamFromBlock}/{postCount}: @{operation['author']}/{operation['permlink']}: excluded by hybrid screening ({reason})")
         
         # If we get here without exceptions, break out of the retry loop
         break
         
     except Exception as e:
         retry_count += 1
+        checkpoint.flush()
         
         if "this method is limited by 10r/s per ip" in str(e).lower():
+            # The shared rate limiter should prevent this; it still happens if other clients
+            # share our IP or RPC_RATE_LIMIT is set above the node's limit.
             # Exponential backoff with jitter
             jitter = _rng.uniform(0.1, 0.5)
             wait_time = (retry_delay * (2 ** (retry_count-1))) + jitter
@@ -377,6 +572,22 @@ while retry_count <= max_retries:
                 raise
             time.sleep(retry_delay)
             
+# The stream ended before the pending curations were resolved
+while curation_pool.pending and postCount < maxSize:
+    resolve_curation(*curation_pool.next_result())
+curation_pool.close()
+llm_cache = get_llm_cache()
+if llm_cache is not None and (llm_cache.hits or llm_cache.misses):
+    print(f"LLM response cache: {llm_cache.hits} hits, {llm_cache.misses} misses ({len(llm_cache)} cached responses).")
+
+checkpoint.close(completed=True)
+hybrid_screening.rule_scheduler.save()
+if rpc_batcher:
+    rpc_batcher.close()
+    print(f"Batched RPC: {rpc_batcher.calls} reads sent in {rpc_batcher.batches} requests.")
+for bucket, waits in get_rate_limiter().metrics().items():
+    print(f"RPC rate limit {bucket}: {waits['count']} requests, {waits['total_ms'] / 1000:.1f}s total wait, p95 {waits['p95_ms']:.0f} ms")
+
 time.sleep(60)  # Give some time for rate limiting between AI Queries
 if earliest_timestamp and latest_timestamp:
     # The timestamps from the stream are already datetime objects.
@@ -387,15 +598,16 @@ if earliest_timestamp and latest_timestamp:
         aiIntroString = f"[SKIP_AI_CURATION ENABLED] Mock AI Intro summary. This placeholder text is generated because the AI API calls are bypassed in the configuration. {'=' * 50}"
     else:
         logging.info("Starting AI Intro generation...")
-        aiIntroString = aiIntro.aiIntro(
-            llmKey, llmModel, llmUrl,
-            earliest_timestamp, latest_timestamp,
-            "\n\n".join(aiResponseList), 16384,
-            model_manager=model_manager,
-            enable_switching=enable_model_switching,
-            dry_run=model_switching_dry_run,
-            score_data=scoreList
-        )
+        with stats_tracker.timed('llm.intro'):
+            aiIntroString = aiIntro.aiIntro(
+                llmKey, llmModel, llmUrl,
+                earliest_timestamp, latest_timestamp,
+                "\n\n".join(aiResponseList), 16384,
+                model_manager=model_manager,
+                enable_switching=enable_model_switching,
+                dry_run=model_switching_dry_run,
+                score_data=scoreList
+            )
         logging.info("Finished AI Intro generation.")
     # Retrieve delegations once and pass into postHelper to avoid duplicate RPC calls
     postingAccount_main = config.get('STEEM', 'POSTING_ACCOUNT')
@@ -444,6 +656,8 @@ if earliest_timestamp and latest_timestamp:
     # Generate and print statistics report
     stats_report = stats_tracker.generate_report()
     print(stats_report)
+    if stats_json_file:
+        stats_tracker.save_json(stats_json_file)
     with open('data/output.html', 'a', encoding='utf-8') as f:
         # Use <pre> for preformatted text in HTML
         print(f"\n<hr>\n<h2>Run Statistics</h2>\n<pre>{stats_report}</pre>", file=f)
@@ -471,5 +685,7 @@ else:
     # Also print stats here, in case some posts were evaluated but none were accepted.
     stats_report = stats_tracker.generate_report()
     print(stats_report)
+    if stats_json_file:
+        stats_tracker.save_json(stats_json_file)
     with open('data/output.html', 'a', encoding='utf-8') as f:
         print(f"\n<hr>\n<h2>Run Statistics</h2>\n<pre>{stats_report}</pre>", file=f)
\ No newline at end of file
@@ -3,6 +3,7 @@ Model Manager - Handles switching between multiple LLM models when rate limited.
 """
 
 import logging
+import threading
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -21,6 +22,7 @@ class ModelManager:
         self.models = [m.strip() for m in model_string.split(',') if m.strip()]
         self.current_index = 0
         self.rate_limited_models = []
+        self._lock = threading.Lock()
         
         if not self.models:
             raise ValueError("No models provided in model_string")
@@ -59,7 +61,7 @@ class ModelManager:
             )
             return False
 
-    def mark_rate_limited(self, dry_run=False):
+    def mark_rate_limited(self, dry_run=False, model=None):
         """
         Mark the current model as rate limited and optionally switch to the next model.
 
@@ -67,33 +69,41 @@ class ModelManager:
             dry_run (bool): If True, record that the model is rate limited but do not
                             actually switch to the next model. Useful for observation
                             or dry-run modes.
+            model (str): The model the caller was rate limited on. With concurrent
+                         curations, another caller may already have switched away from
+                         it; in that case the model is not switched a second time.
 
         Returns:
-            bool: True if an actual switch to the next model occurred, False otherwise.
+            bool: True if the caller should retry with a different model than `model`
+                  (an actual switch occurred, now or by another caller), False otherwise.
         """
-        # Avoid duplicate entries
-        if self.current_model not in self.rate_limited_models:
-            self.rate_limited_models.append(self.current_model)
+        with self._lock:
+            if model is not None and model != self.current_model:
+                return not dry_run
 
-        logging.warning(f"Marking model as rate limited: {self.current_model}. Dry run: {dry_run}")
+            # Avoid duplicate entries
+            if self.current_model not in self.rate_limited_models:
+                self.rate_limited_models.append(self.current_model)
 
-        if dry_run:
-            logging.info("Dry-run mode: not switching to next model.")
-            return False
+            logging.warning(f"Marking model as rate limited: {self.current_model}. Dry run: {dry_run}")
 
-        # Switch without re-appending (already marked above)
-        if self.current_index < len(self.models) - 1:
-            self.current_index += 1
-            logging.warning(
-                f"Switching to next model: {self.current_model} "
-                f"(Rate limited models: {self.rate_limited_models})"
-            )
-            return True
-        else:
-            logging.error(
-                f"No more models available. All models rate limited: {self.rate_limited_models}"
-            )
-            return False
+            if dry_run:
+                logging.info("Dry-run mode: not switching to next model.")
+                return False
+
+            # Switch without re-appending (already marked above)
+            if self.current_index < len(self.models) - 1:
+                self.current_index += 1
+                logging.warning(
+                    f"Switching to next model: {self.current_model} "
+                    f"(Rate limited models: {self.rate_limited_models})"
+                )
+                return True
+            else:
+                logging.error(
+                    f"No more models available. All models rate limited: {self.rate_limited_models}"
+                )
+                return False
     
     def has_next_model(self):
         """Check if there's a next model available."""
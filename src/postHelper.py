@@ -11,7 +11,7 @@ import threading
 import utils
 from localization import Localization
 import version
-from steemHelpers import initialize_steem_with_retry
+from steemHelpers import initialize_steem_with_retry, discard_steem_instance
 
 import replyHelper # From the thoth package
 
@@ -90,7 +90,7 @@ def vote_in_background(postingAccount, permlink, voteWeight=100, keys=None):
     time.sleep(initialWaitSeconds)
 
     while retries < max_retries:
-        # Re-initialize or get instance inside loop for retry resilience
+        # Get the instance inside the loop; the RPC pool routes retries away from failed nodes
         s_vote = initialize_steem_with_retry(node_api=steemApi, keys=keys)
         try:
             print(f"Attempting to vote for @{postingAccount}/{permlink}...")
@@ -98,6 +98,7 @@ def vote_in_background(postingAccount, permlink, voteWeight=100, keys=None):
             print(f"Successfully voted for @{postingAccount}/{permlink}")
             break  # Exit loop on successful vote
         except Exception as e:
+            discard_steem_instance(s_vote, e)  # reconnect on the next attempt unless the node rejected the vote
             print(f"Vote for @{postingAccount}/{permlink} failed: {e}. Retrying in {retry_delay_seconds} seconds...")
             time.sleep(retry_delay_seconds)
             retries += 1
@@ -294,9 +295,12 @@ def postCuration (commentList, aiResponseList, aiIntroString, model_manager=None
             import traceback
             print (f"Error during main curation post attempt: {E}")
             traceback.print_exc()
+            discarded = discard_steem_instance(s, E)
             print ("Sleeping 1 minute before retry...")
             time.sleep(60)
             retryCount += 1
+            if discarded and retryCount < 3:
+                s = initialize_steem_with_retry(node_api=steemApi, keys=[postingKey] if postingKey else None)
     if ( not postDone ):
         print (f"Post {title} failed.  Exiting.")
         return False
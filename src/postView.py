@@ -0,0 +1,63 @@
+"""
+Post View for Thoth
+
+A post passes through many validators and scorers that each needed the decoded
+`json_metadata`, the tag list or the formatting-free body. PostView is a dict (so
+every existing `post['body']`-style access keeps working) that computes these derived
+values on first use and caches them for the lifetime of the object.
+
+Derived values are not recomputed if the underlying fields are changed afterwards;
+create a new PostView for a new version of a post.
+"""
+
+import json
+import logging
+from functools import cached_property
+
+from markupStripper import remove_formatting
+
+logger = logging.getLogger(__name__)
+
+class PostView(dict):
+    """A post (or comment operation) with lazily parsed and cached derived fields."""
+
+    @classmethod
+    def of(cls, post):
+        """Return post itself if it already is a PostView, otherwise wrap it."""
+        if isinstance(post, cls):
+            return post
+        return cls(post)
+
+    @cached_property
+    def metadata(self):
+        """The decoded json_metadata, or an empty dict if it is missing or invalid."""
+        raw = self.get('json_metadata')
+        if not raw:
+            return {}
+        if isinstance(raw, dict):
+            return raw
+        try:
+            metadata = json.loads(raw)
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Error parsing metadata for {self.get('author', 'unknown')}/{self.get('permlink', 'unknown')}: {e}")
+            return {}
+        return metadata if isinstance(metadata, dict) else {}
+
+    @cached_property
+    def tags(self):
+        """The tags from json_metadata, in their original order (without the category)."""
+        tags = self.metadata.get('tags')
+        if isinstance(tags, (list, tuple)):
+            return [tag for tag in tags if isinstance(tag, str)]
+        return []
+
+    @cached_property
+    def clean_body(self):
+        """The body with markdown and HTML formatting removed."""
+        return remove_formatting(self.get('body') or '')
+
+    @cached_property
+    def word_count(self):
+        """Number of words in the formatting-free body."""
+        from contentValidation import word_count
+        return word_count(self.clean_body)
@@ -0,0 +1,184 @@
+"""
+Client-Side RPC Rate Limiting for Thoth
+
+Public Steem nodes reject clients that exceed about 10 requests per second per IP
+("this method is limited by 10r/s per ip"). Thoth used to notice only after the block
+stream had crashed, and then restarted it with exponential backoff, so it oscillated
+between bursts and long sleeps.
+
+RateLimiter holds token buckets: one per node (counting HTTP requests) and, optionally,
+one per RPC method (counting calls, so a JSON-RPC batch of N calls takes N tokens).
+Every Steem RPC caller acquires tokens before it sends a request, which spaces the
+requests at the allowed rate. Time spent waiting for tokens is recorded per bucket.
+"""
+
+import configparser
+import logging
+import threading
+import time
+from collections import Counter
+
+from latencyHistogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Create a ConfigParser object
+config = configparser.ConfigParser()
+
+# Read the config.ini file
+config.read('config/config.ini')
+
+class TokenBucket:
+    """A token bucket that refills at `rate` tokens per second up to `burst` tokens."""
+
+    def __init__(self, rate, burst=None, clock=time.monotonic):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (defaults to one second worth of tokens)
+            clock: Time source (for tests)
+        """
+        self.rate = float(rate)
+        self.burst = float(burst) if burst else max(1.0, self.rate)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Take tokens, going into debt if the bucket is empty.
+
+        Returns:
+            float: Seconds the caller has to wait before its request may be sent
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+class RateLimiter:
+    """Per-node and per-method token buckets shared by all RPC callers."""
+
+    def __init__(self, node_rate=10.0, burst=None, method_rates=None, clock=time.monotonic, sleep=time.sleep):
+        """
+        Initialize the limiter.
+
+        Args:
+            node_rate: Requests per second per node (0 = no node limit)
+            burst: Requests a node bucket allows at once (defaults to one second worth)
+            method_rates: Optional mapping of method name -> calls per second per node
+            clock: Time source (for tests)
+            sleep: Sleep function (for tests)
+        """
+        self.node_rate = node_rate
+        self.burst = burst
+        self.method_rates = dict(method_rates or {})
+        self.stats_tracker = None
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets = {}
+        self._waits = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.node_rate > 0 or bool(self.method_rates)
+
+    def acquire(self, node, methods=()):
+        """
+        Wait until one request with the given calls may be sent to a node.
+
+        Args:
+            node: Node URL the request goes to
+            methods: Method names of the calls in the request (e.g. 'get_block' or
+                     'condenser_api.get_block'); one entry per call
+
+        Returns:
+            float: Seconds waited
+        """
+        reservations = []
+        if self.node_rate > 0:
+            reservations.append((node, self._bucket(node, self.node_rate).reserve(1)))
+        for method, count in Counter(_short_name(method) for method in methods).items():
+            rate = self.method_rates.get(method)
+            if rate:
+                key = f"{node} {method}"
+                reservations.append((key, self._bucket(key, rate).reserve(count)))
+        if not reservations:
+            return 0.0
+
+        key, wait = max(reservations, key=lambda reservation: reservation[1])
+        if wait > 0:
+            self._sleep(wait)
+        self._record_wait(key, wait)
+        return wait
+
+    def metrics(self):
+        """
+        Return the queue-wait statistics per bucket.
+
+        Returns:
+            dict: Bucket key -> latency histogram summary of the waits in milliseconds
+                  (a request is counted in the bucket that made it wait longest)
+        """
+        with self._lock:
+            return {key: histogram.to_dict() for key, histogram in sorted(self._waits.items())}
+
+    def _bucket(self, key, rate):
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                burst = self.burst if key == key.split(' ')[0] else None
+                bucket = TokenBucket(rate, burst, clock=self._clock)
+                self._buckets[key] = bucket
+            return bucket
+
+    def _record_wait(self, key, seconds):
+        with self._lock:
+            histogram = self._waits.get(key)
+            if histogram is None:
+                histogram = self._waits[key] = LatencyHistogram()
+            histogram.record(seconds * 1000.0)
+        if self.stats_tracker:
+            self.stats_tracker.track_timing(f'rate_limit_wait.{key}', seconds)
+
+def _short_name(method):
+    """'condenser_api.get_block' -> 'get_block'"""
+    return method.rsplit('.', 1)[-1]
+
+def parse_method_rates(value):
+    """Parse 'get_block:20, get_following:5' into {'get_block': 20.0, 'get_following': 5.0}."""
+    rates = {}
+    for item in (value or '').split(','):
+        if ':' not in item:
+            continue
+        method, rate = item.split(':', 1)
+        try:
+            rates[method.strip()] = float(rate)
+        except ValueError:
+            logger.warning(f"Ignoring invalid RPC_METHOD_RATE_LIMITS entry: {item.strip()}")
+    return rates
+
+_default_limiter = None
+_default_limiter_lock = threading.Lock()
+
+def get_rate_limiter():
+    """Return the process-wide RateLimiter, configured from [STEEM] in config.ini."""
+    global _default_limiter
+    if _default_limiter is None:
+        with _default_limiter_lock:
+            if _default_limiter is None:
+                try:
+                    node_rate = config.getfloat('STEEM', 'RPC_RATE_LIMIT', fallback=10.0)
+                    burst = config.getfloat('STEEM', 'RPC_RATE_BURST', fallback=0.0)
+                except ValueError:
+                    node_rate, burst = 10.0, 0.0
+                _default_limiter = RateLimiter(
+                    node_rate=node_rate,
+                    burst=burst or None,
+                    method_rates=parse_method_rates(config.get('STEEM', 'RPC_METHOD_RATE_LIMITS', fallback=''))
+                )
+    return _default_limiter
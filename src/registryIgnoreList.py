@@ -0,0 +1,148 @@
+import os
+import json
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+class RegistryIgnoreList:
+    def __init__(self, registry_account, cache_file="data/registry_ignore.json", ttl_hours=6.0, page_size=1000, retry_seconds=300):
+        """
+        Holds the complete ignore (mute) list of the registry account as a set.
+        The list is downloaded in pages once and then reused until the TTL expires,
+        optionally across runs through a JSON file on disk.
+
+        Args:
+            registry_account: Account whose ignore list marks blacklisted authors
+            cache_file: Path of the JSON disk cache, or None to keep the list in memory only
+            ttl_hours: Hours a downloaded list is trusted before it is fetched again
+            page_size: Number of entries requested per get_following call
+            retry_seconds: Seconds to wait before retrying a failed download
+        """
+        self.registry_account = registry_account
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_hours * 3600
+        self.page_size = page_size
+        self.retry_seconds = retry_seconds
+        self._ignored = None
+        self._fetched_at = 0
+        self._retry_at = 0
+        self._lock = threading.Lock()
+
+    def contains(self, account, steem_instance):
+        """
+        Returns True if the registry account ignores the given account.
+
+        Args:
+            account: The account name to check
+            steem_instance: Steem instance used if the list has to be (re)loaded
+
+        Returns:
+            bool, or None if the list could not be loaded
+        """
+        ignored = self.get(steem_instance)
+        if ignored is None:
+            return None
+        return account in ignored
+
+    def get(self, steem_instance):
+        """
+        Returns the set of ignored accounts, loading or refreshing it if needed.
+
+        When a refresh fails, the previous (stale) list is kept. None is returned only
+        if no list has been loaded at all.
+        """
+        if self._ignored is not None and time.time() - self._fetched_at < self.ttl_seconds:
+            return self._ignored
+
+        with self._lock:
+            now = time.time()
+            if self._ignored is not None and now - self._fetched_at < self.ttl_seconds:
+                return self._ignored
+
+            if self._ignored is None:
+                self._load_cache_file()
+                if self._ignored is not None and now - self._fetched_at < self.ttl_seconds:
+                    return self._ignored
+
+            # Don't hammer a failing node with full downloads on every lookup
+            if now < self._retry_at:
+                return self._ignored
+
+            ignored = self._fetch(steem_instance)
+            if ignored is not None:
+                self._ignored = ignored
+                self._fetched_at = now
+                self._save_cache_file()
+            else:
+                self._retry_at = now + self.retry_seconds
+                if self._ignored is not None:
+                    logger.warning(f"Could not refresh the ignore list of {self.registry_account}; using the stored list.")
+            return self._ignored
+
+    def invalidate(self):
+        """Forces the list to be downloaded again on the next lookup."""
+        with self._lock:
+            self._fetched_at = 0
+            self._retry_at = 0
+
+    def _fetch(self, s):
+        """Download the complete ignore list in pages; returns None on failure."""
+        ignored = set()
+        start = ''
+
+        while True:
+            page = None
+            max_retries = 3
+            for attempt in range(max_retries):
+                try:
+                    page = s.get_following(self.registry_account, start, 'ignore', self.page_size)
+                    break
+                except Exception as e:
+                    if attempt < max_retries - 1:
+                        time.sleep(2)
+                        continue
+                    logger.error(f"Error fetching the ignore list of {self.registry_account}: {e}")
+                    return None
+
+            # The start account is included in the next page
+            new_entries = [entry['following'] for entry in page if entry['following'] != start]
+            ignored.update(new_entries)
+
+            if len(page) < self.page_size or not new_entries:
+                break
+            start = page[-1]['following']
+
+        logger.info(f"Loaded {len(ignored)} ignored accounts of {self.registry_account}")
+        return ignored
+
+    def _load_cache_file(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+            if data.get('registry_account') != self.registry_account:
+                return
+            self._ignored = set(data['ignored'])
+            self._fetched_at = float(data['fetched_at'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable registry ignore cache {self.cache_file}: {e}")
+
+    def _save_cache_file(self):
+        if not self.cache_file:
+            return
+        data = {
+            'registry_account': self.registry_account,
+            'fetched_at': self._fetched_at,
+            'ignored': sorted(self._ignored)
+        }
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write registry ignore cache {self.cache_file}: {e}")
@@ -9,7 +9,7 @@ import threading
 import utils
 import steembase.exceptions # Required for specific exception handling
 import version
-from steemHelpers import initialize_steem_with_retry
+from steemHelpers import initialize_steem_with_retry, discard_steem_instance
 from localization import Localization
 
 # Create a ConfigParser object
@@ -106,6 +106,7 @@ def vote_in_background(postingAccount, permlink, voteWeight=100, keys=None):
                 time.sleep(retry_delay_seconds)
         except Exception as e:
             retries += 1
+            discard_steem_instance(s_instance, e)  # reconnect on the next attempt
             print(f"Vote for @{postingAccount}/{permlink} failed with an unexpected error: {e}. Retrying in {retry_delay_seconds} seconds (Attempt {retries}/{max_retries})...")
             time.sleep(retry_delay_seconds)
 
@@ -284,9 +285,12 @@ def postReply (comment_item, ai_response_item, item_index, thothAccount, thothPe
                 replyDone = True
         except Exception as E:
             print (E)
+            discarded = discard_steem_instance(s, E)
             print ("Sleeping 1 minute before retry...")
             time.sleep(60)
             retryCount += 1
+            if discarded and retryCount < 3:
+                s = initialize_steem_with_retry(node_api=steemApi, keys=[postingKey] if postingKey else None)
     if ( not replyDone ):
         print (f"Posting {log_display_title} failed after multiple retries. Exiting reply process.")
         return False
@@ -0,0 +1,228 @@
+"""
+Batched JSON-RPC Reads for Thoth
+
+Screening a post issues many small, independent reads (the post, the author's account,
+the author's follow counts, ...), each a full HTTP round trip against nodes that
+rate-limit per request. JSON-RPC 2.0 allows any number of calls in one POST, answered
+with one response entry per call id. This module provides two layers on top of that:
+
+- RpcBatchClient sends an explicit list of calls as one batch POST over a keep-alive
+  session and returns the results in call order.
+- RpcBatcher coalesces calls submitted by any thread within a short time window into
+  one batch and hands each caller its own result through a Future. Calls submitted
+  together with `submit_many` (e.g. all reads for one post) always travel in the same
+  batch.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+import requests
+
+from rateLimiter import get_rate_limiter
+from steemHelpers import DEFAULT_STEEM_NODE
+
+logger = logging.getLogger(__name__)
+
+class RpcError(Exception):
+    """An error entry in a JSON-RPC response, or a call that got no response entry."""
+
+class RpcBatchClient:
+    """Sends lists of JSON-RPC calls as single batch requests."""
+
+    def __init__(self, nodes=None, timeout=30, rate_limiter=None):
+        """
+        Initialize the client.
+
+        Args:
+            nodes: Optional list of node URLs (the first one is used until next_node is called)
+            timeout: HTTP timeout in seconds per batch request
+            rate_limiter: RateLimiter every batch request waits for (defaults to the
+                          process-wide one)
+        """
+        self.nodes = list(nodes) if nodes else [DEFAULT_STEEM_NODE]
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self._node_index = 0
+        self._node_lock = threading.Lock()
+        self._session = requests.Session()
+
+    @property
+    def node(self):
+        """The node URL batches are currently sent to."""
+        return self.nodes[self._node_index]
+
+    def next_node(self, failed_node=None):
+        """
+        Rotate to the next configured node after a failure.
+
+        Args:
+            failed_node: The node the failed request was sent to. If another thread has
+                         already rotated away from it, the current node is kept, so
+                         concurrent failures don't skip nodes.
+        """
+        if len(self.nodes) <= 1:
+            return
+        with self._node_lock:
+            if failed_node is not None and self.nodes[self._node_index] != failed_node:
+                return
+            self._node_index = (self._node_index + 1) % len(self.nodes)
+            node = self.nodes[self._node_index]
+        logger.info(f"Batched RPC switching to node {node}")
+
+    def call_batch(self, calls, raise_errors=True):
+        """
+        Send calls as one JSON-RPC batch request.
+
+        Args:
+            calls: List of (method, params) tuples, e.g. ('condenser_api.get_content', [author, permlink])
+            raise_errors: If True, raise RpcError for the first failed call; otherwise failed
+                          calls are returned as RpcError instances in their result slot
+
+        Returns:
+            list: The results in the order of calls
+
+        Raises:
+            requests.RequestException, ValueError: If the request as a whole failed
+        """
+        if not calls:
+            return []
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": list(params), "id": request_id}
+            for request_id, (method, params) in enumerate(calls)
+        ]
+
+        node = self.node
+        self.rate_limiter.acquire(node, [method for method, _ in calls])
+        response = self._session.post(node, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        if not isinstance(data, list):
+            raise ValueError(f"Unexpected batch response shape from {self.node}")
+
+        results = [RpcError(f"No response for {method}") for method, _ in calls]
+        for entry in data:
+            request_id = entry.get('id') if isinstance(entry, dict) else None
+            if not isinstance(request_id, int) or not 0 <= request_id < len(calls):
+                continue
+            if 'error' in entry:
+                results[request_id] = RpcError(f"RPC error in batch response: {entry['error']}")
+            else:
+                results[request_id] = entry.get('result')
+
+        if raise_errors:
+            for result in results:
+                if isinstance(result, RpcError):
+                    raise result
+        return results
+
+class RpcBatcher:
+    """Coalesces JSON-RPC calls from concurrent callers into batch requests."""
+
+    def __init__(self, client, window_seconds=0.01, max_batch_size=50):
+        """
+        Initialize the batcher.
+
+        Args:
+            client: RpcBatchClient that sends the batches
+            window_seconds: How long the first call of a batch waits for more calls
+            max_batch_size: Maximum number of calls per batch (a batch is sent as soon as it is full)
+        """
+        self.client = client
+        self.window_seconds = window_seconds
+        self.max_batch_size = max(1, int(max_batch_size))
+        self._pending = []
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+        self.batches = 0
+        self.calls = 0
+
+    def submit(self, method, params):
+        """Queue one call and return a Future for its result."""
+        return self.submit_many([(method, params)])[0]
+
+    def submit_many(self, calls):
+        """
+        Queue calls that must be sent in the same batch.
+
+        Args:
+            calls: List of (method, params) tuples (at most max_batch_size)
+
+        Returns:
+            list: One Future per call; a failed call's Future raises RpcError or the
+                  transport error
+        """
+        futures = [Future() for _ in calls]
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("RpcBatcher is closed")
+            self._pending.append(list(zip(calls, futures)))
+            self._ensure_thread()
+            self._condition.notify()
+        return futures
+
+    def call(self, method, *params):
+        """Send one call through the batcher and wait for its result."""
+        return self.submit(method, list(params)).result()
+
+    def close(self):
+        """Send the queued calls and stop the dispatcher thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="rpc-batcher", daemon=True)
+            self._thread.start()
+
+    def _pending_count(self):
+        return sum(len(group) for group in self._pending)
+
+    def _next_batch(self):
+        """Wait for calls, give later callers the window to join, and take one batch."""
+        with self._condition:
+            while not self._pending and not self._closed:
+                self._condition.wait()
+            if not self._pending:
+                return None
+            deadline = time.monotonic() + self.window_seconds
+            while not self._closed and self._pending_count() < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = []
+            while self._pending and (not batch or len(batch) + len(self._pending[0]) <= self.max_batch_size):
+                batch.extend(self._pending.pop(0))
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            calls = [call for call, _ in batch]
+            node = self.client.node
+            try:
+                results = self.client.call_batch(calls, raise_errors=False)
+            except Exception as e:
+                logger.warning(f"Batched RPC request with {len(calls)} calls failed: {e}")
+                self.client.next_node(node)
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.calls += len(calls)
+            for (_, future), result in zip(batch, results):
+                if isinstance(result, RpcError):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
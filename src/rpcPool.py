@@ -0,0 +1,291 @@
+"""
+Pooled Steem RPC Clients for Thoth
+
+`initialize_steem_with_retry` used to build a new Steem instance on every call (for each
+reply, inside every vote retry, at import time of several modules), and every new
+instance issues `get_dynamic_global_properties` before it can be used. Calls also always
+went to the first node of STEEM_API until that node failed.
+
+SteemPool keeps one Steem instance per node list and key set for the whole process. For
+node lists with more than one node, a NodeSelector health-checks the nodes once, keeps
+an exponentially weighted moving average (EWMA) of each node's latency from real calls,
+and routes every call to the fastest healthy node. Each node gets its own steemd client,
+so concurrent calls never switch the node under each other. A node whose call fails is
+put in a cooldown (doubled on every consecutive failure) and the next call goes to the
+next node, while the Steem client's own retry handles the failed call itself.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+MAX_COOLDOWN_SECONDS = 600
+
+class NodeSelector:
+    """Latency and health bookkeeping for the nodes of one node list."""
+
+    def __init__(self, nodes, alpha=0.3, cooldown_seconds=60, clock=time.monotonic):
+        """
+        Initialize the selector.
+
+        Args:
+            nodes: Node URLs in their configured order (used to break ties)
+            alpha: Weight of the newest sample in the latency EWMA
+            cooldown_seconds: Seconds a node is skipped after its first failure
+            clock: Time source (for tests)
+        """
+        self.nodes = list(nodes)
+        self.alpha = alpha
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._latency = {}
+        self._failures = {node: 0 for node in self.nodes}
+        self._unhealthy_until = {node: 0.0 for node in self.nodes}
+        self._lock = threading.Lock()
+
+    def record_success(self, node, seconds):
+        """Record a successful call and update the node's latency average."""
+        with self._lock:
+            previous = self._latency.get(node)
+            self._latency[node] = seconds if previous is None else self.alpha * seconds + (1 - self.alpha) * previous
+            self._failures[node] = 0
+            self._unhealthy_until[node] = 0.0
+
+    def record_failure(self, node):
+        """Record a failed call and put the node in a cooldown."""
+        with self._lock:
+            self._failures[node] = self._failures.get(node, 0) + 1
+            cooldown = min(self.cooldown_seconds * 2 ** (self._failures[node] - 1), MAX_COOLDOWN_SECONDS)
+            self._unhealthy_until[node] = self._clock() + cooldown
+        logger.warning(f"RPC node {node} failed; skipping it for {cooldown:.0f}s")
+
+    def is_healthy(self, node):
+        """Return True if the node is not in a cooldown."""
+        return self._unhealthy_until.get(node, 0.0) <= self._clock()
+
+    def ranked(self):
+        """
+        Return the nodes in the order they should be used.
+
+        Healthy nodes come first: unmeasured ones in configured order (so each gets tried),
+        then by latency average. Nodes in cooldown follow, soonest available first.
+        """
+        with self._lock:
+            now = self._clock()
+            position = {node: index for index, node in enumerate(self.nodes)}
+            healthy = [node for node in self.nodes if self._unhealthy_until[node] <= now]
+            unhealthy = [node for node in self.nodes if self._unhealthy_until[node] > now]
+            healthy.sort(key=lambda node: (node in self._latency, self._latency.get(node, 0.0), position[node]))
+            unhealthy.sort(key=lambda node: (self._unhealthy_until[node], position[node]))
+            return healthy + unhealthy
+
+    def best(self):
+        """Return the node the next call should go to."""
+        return self.ranked()[0]
+
+    def latencies(self):
+        """Return a copy of the latency averages in seconds."""
+        with self._lock:
+            return dict(self._latency)
+
+    def probe(self, timeout=5.0, post=None):
+        """
+        Health-check all nodes concurrently with `get_dynamic_global_properties`.
+
+        Args:
+            timeout: HTTP timeout in seconds per node
+            post: Function used to send the request (defaults to requests.post)
+        """
+        post = post or requests.post
+        payload = {"jsonrpc": "2.0", "method": "condenser_api.get_dynamic_global_properties", "params": [], "id": 1}
+
+        def check(node):
+            start = time.perf_counter()
+            try:
+                response = post(node, json=payload, timeout=timeout)
+                response.raise_for_status()
+                if 'result' not in response.json():
+                    raise ValueError("no result in response")
+            except Exception as e:
+                logger.warning(f"Health check of RPC node {node} failed: {e}")
+                self.record_failure(node)
+                return
+            self.record_success(node, time.perf_counter() - start)
+
+        with ThreadPoolExecutor(max_workers=len(self.nodes)) as executor:
+            list(executor.map(check, self.nodes))
+        ranking = ', '.join(f"{node} ({self._latency[node] * 1000:.0f} ms)" for node in self.ranked() if node in self._latency)
+        logger.info(f"RPC node ranking: {ranking or 'no node answered'}")
+
+class SteemPool:
+    """Process-wide Steem instances, one per node list and key set, with node routing."""
+
+    def __init__(self, factory, cooldown_seconds=60, probe_timeout=5.0, alpha=0.3, application_errors=()):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Callable (nodes, keys) -> Steem instance or None; nodes are ordered
+                     fastest first
+            cooldown_seconds: Seconds a failed node is skipped (doubled per consecutive failure)
+            probe_timeout: HTTP timeout of the initial health check (0 = no health check)
+            alpha: Weight of the newest sample in the latency EWMA
+            application_errors: Exception types raised for errors reported by a healthy node
+                                (e.g. an invalid transaction); they don't mark the node as failed
+        """
+        self.factory = factory
+        self.cooldown_seconds = cooldown_seconds
+        self.probe_timeout = probe_timeout
+        self.alpha = alpha
+        self.application_errors = tuple(application_errors)
+        self._instances = {}
+        self._selectors = {}
+        self._lock = threading.Lock()
+
+    def get(self, nodes=None, keys=None, unlocked=False):
+        """
+        Return the shared Steem instance for a node list and key set, creating it on first use.
+
+        Args:
+            nodes: Node URLs, or None for the library's default node
+            keys: Optional private keys
+            unlocked: True if the instance is created without keys because the wallet is unlocked
+
+        Returns:
+            The Steem instance, or None if it could not be created (not cached, so the next
+            call tries again)
+        """
+        node_key = tuple(nodes) if nodes else None
+        key = (node_key, tuple(keys) if keys else None, unlocked)
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is not None:
+                return instance
+
+            selector = self.selector(node_key) if node_key else None
+            ordered = selector.ranked() if selector else nodes
+            instance = self.factory(ordered, keys)
+            if instance is None:
+                return None
+            if selector and len(selector.nodes) > 1:
+                self._route(instance, selector, keys)
+            self._instances[key] = instance
+            return instance
+
+    def selector(self, nodes):
+        """Return the NodeSelector of a node list (health-checked when it is created)."""
+        nodes = tuple(nodes)
+        selector = self._selectors.get(nodes)
+        if selector is None:
+            selector = NodeSelector(nodes, alpha=self.alpha, cooldown_seconds=self.cooldown_seconds)
+            if len(nodes) > 1 and self.probe_timeout > 0:
+                selector.probe(timeout=self.probe_timeout)
+            self._selectors[nodes] = selector
+        return selector
+
+    def discard(self, instance, error=None):
+        """
+        Drop an instance from the pool after a failed call, so the next get() connects a new one.
+
+        Args:
+            instance: The Steem instance whose call failed
+            error: The exception of the failed call; application errors (reported by a
+                   healthy node) keep the instance
+
+        Returns:
+            bool: True if the instance was dropped
+        """
+        if isinstance(error, self.application_errors):
+            return False
+        discarded = False
+        with self._lock:
+            for key, pooled in list(self._instances.items()):
+                if pooled is instance:
+                    del self._instances[key]
+                    discarded = True
+        return discarded
+
+    def _route(self, instance, selector, keys=None):
+        """
+        Send every call of the instance's steemd client to the best node and measure it.
+
+        The calls are made by per-node steemd clients (connected with the pool's factory on
+        first use), so the shared client's node is never switched while another thread's
+        call is in flight, and each call is charged to the node it actually went to.
+        """
+        client = getattr(instance, 'steemd', None)
+        if client is None:
+            return
+        application_errors = self.application_errors
+        node_clients = {}
+        node_clients_lock = threading.Lock()
+
+        def client_for(node):
+            with node_clients_lock:
+                node_client = node_clients.get(node)
+                if node_client is None:
+                    node_client = getattr(self.factory([node], keys), 'steemd', None)
+                    if node_client is not None:
+                        node_clients[node] = node_client
+                return node_client
+
+        def routed(attribute, fallback):
+            def method(name, *args, **kwargs):
+                for node in selector.ranked():
+                    node_client = client_for(node)
+                    if node_client is not None:
+                        break
+                    selector.record_failure(node)
+                else:
+                    # No node could be connected; let the instance's own client try
+                    return fallback(name, *args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    result = getattr(node_client, attribute)(name, *args, **kwargs)
+                except application_errors:
+                    raise
+                except Exception:
+                    selector.record_failure(node)
+                    raise
+                selector.record_success(node, time.perf_counter() - start)
+                return result
+            return method
+
+        for attribute in ('call', 'exec'):
+            fallback = getattr(client, attribute, None)
+            if callable(fallback):
+                setattr(client, attribute, routed(attribute, fallback))
+
+def wrap_client_calls(client, around):
+    """
+    Run every RPC call of a steemd client through `around(name, invoke)`.
+
+    Wraps the client's `call` and `exec` methods. `call` may be implemented on top of
+    `exec`, so only the outermost wrapper of each chain sees a call; `invoke()` performs it.
+
+    Args:
+        client: The steemd client (Steem().steemd)
+        around: Callable (method name, invoke) -> result
+    """
+    active = threading.local()
+
+    def wrap(method):
+        def wrapper(name, *args, **kwargs):
+            if getattr(active, 'depth', 0):
+                return method(name, *args, **kwargs)
+            active.depth = 1
+            try:
+                return around(name, lambda: method(name, *args, **kwargs))
+            finally:
+                active.depth = 0
+        return wrapper
+
+    for attribute in ('call', 'exec'):
+        method = getattr(client, attribute, None)
+        if callable(method):
+            setattr(client, attribute, wrap(method))
@@ -0,0 +1,151 @@
+"""
+Adaptive Rule Ordering for Thoth
+
+Rule-based screening stops at the first rule that rejects a post. For rules whose
+outcome does not depend on each other, the order only decides how much work is spent
+before that first rejection, so the cheapest order runs rules with a high rejection
+probability and a low cost first: sorting by rejection probability / mean cost
+minimizes the expected cost per post for independent filters.
+
+RuleScheduler records each rule's latency and rejection rate, reorders each group of
+order-independent rules by that ratio, and persists the statistics (by default in
+data/rule_stats.json) so the next run starts with the learned order. Groups themselves
+keep their fixed sequence, which is how ordering constraints such as "blacklist before
+whitelist, whitelist before network checks" are preserved.
+"""
+
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+class RuleScheduler:
+    """Orders groups of independent rules by observed rejection rate per unit of cost."""
+
+    def __init__(self, groups, stats_file="data/rule_stats.json", adaptive=True,
+                 min_samples=50, reorder_interval=100, max_samples=10000):
+        """
+        Initialize the scheduler and load persisted statistics.
+
+        Args:
+            groups: Mapping of group name -> rule names in their default order
+            stats_file: JSON file the statistics are persisted in, or None
+            adaptive: If False, every group always runs in its default order
+            min_samples: Evaluations each rule of a group needs before the group is reordered
+            reorder_interval: Number of recorded evaluations between two reorderings
+            max_samples: Evaluations after which a rule's statistics are halved, so the
+                         order keeps following changes in the stream
+        """
+        self.default_order = {group: list(rules) for group, rules in groups.items()}
+        self.stats_file = stats_file
+        self.adaptive = adaptive
+        self.min_samples = min_samples
+        self.reorder_interval = max(1, reorder_interval)
+        self.max_samples = max_samples
+
+        self._stats = {rule: {'evaluations': 0, 'rejections': 0, 'seconds': 0.0}
+                       for rules in self.default_order.values() for rule in rules}
+        self._order = {group: list(rules) for group, rules in self.default_order.items()}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+        self._load()
+        self._reorder()
+
+    def order(self, group):
+        """Return the rules of a group in the order they should run."""
+        return self._order[group]
+
+    def record(self, rule, seconds, rejected):
+        """
+        Record one evaluation of a rule.
+
+        Args:
+            rule: The rule name
+            seconds: How long the rule took
+            rejected: True if the rule rejected the post
+        """
+        with self._lock:
+            stats = self._stats[rule]
+            stats['evaluations'] += 1
+            stats['rejections'] += 1 if rejected else 0
+            stats['seconds'] += seconds
+            if stats['evaluations'] >= self.max_samples:
+                for key in stats:
+                    stats[key] /= 2
+            self._pending += 1
+            if self._pending < self.reorder_interval:
+                return
+            self._pending = 0
+
+        self._reorder()
+        self.save()
+
+    def priority(self, rule):
+        """Rejection probability per second of cost (higher runs earlier)."""
+        stats = self._stats[rule]
+        evaluations = stats['evaluations']
+        if evaluations <= 0:
+            return 0.0
+        # Laplace smoothing keeps rarely rejecting rules from getting a zero probability
+        rejection_rate = (stats['rejections'] + 1) / (evaluations + 2)
+        mean_seconds = max(stats['seconds'] / evaluations, 1e-6)
+        return rejection_rate / mean_seconds
+
+    def statistics(self):
+        """Return a copy of the per-rule statistics."""
+        with self._lock:
+            return {rule: dict(stats) for rule, stats in self._stats.items()}
+
+    def save(self):
+        """
+        Persist the statistics (written to a temporary file, then renamed).
+
+        record() saves from the screening worker threads, so writers are serialized to
+        keep them from interleaving in the shared temporary file.
+        """
+        if not self.stats_file:
+            return
+        with self._save_lock:
+            data = {'rules': self.statistics()}
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.stats_file)), exist_ok=True)
+                tmp_file = f"{self.stats_file}.tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_file, self.stats_file)
+            except OSError as e:
+                logger.warning(f"Could not save rule statistics to {self.stats_file}: {e}")
+
+    def _reorder(self):
+        if not self.adaptive:
+            return
+        with self._lock:
+            for group, rules in self.default_order.items():
+                if any(self._stats[rule]['evaluations'] < self.min_samples for rule in rules):
+                    continue
+                # sorted() is stable: rules with equal priority keep their default order
+                order = sorted(rules, key=self.priority, reverse=True)
+                if order != self._order[group]:
+                    logger.info(f"Rule order for {group}: {', '.join(order)}")
+                    self._order[group] = order
+
+    def _load(self):
+        if not self.stats_file or not os.path.exists(self.stats_file):
+            return
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for rule, stats in data.get('rules', {}).items():
+                # Rules that no longer exist are dropped, new rules start empty
+                if rule in self._stats:
+                    self._stats[rule] = {
+                        'evaluations': float(stats['evaluations']),
+                        'rejections': float(stats['rejections']),
+                        'seconds': float(stats['seconds'])
+                    }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Discarding unreadable rule statistics in {self.stats_file}: {e}")
@@ -0,0 +1,117 @@
+"""
+Concurrent Screening Pipeline for Thoth
+
+Screening a post is dominated by RPC latency (blacklist, inactivity, Hive/Blurt,
+wallet and feed reach checks), not CPU. This module feeds candidate posts from the
+block stream into a bounded look-ahead queue that is screened by a worker pool, then
+hands the results back in block order.
+
+Results are merged strictly in stream order, the per-author post limit is re-applied
+against the current list of included posts at merge time, and statistics are recorded
+only for results that are actually consumed. This keeps MAX_INCLUDED_POSTS_PER_AUTHOR
+and NUMBER_OF_REVIEWED_POSTS semantics identical to serial screening.
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+def is_screening_candidate(operation):
+    """Return True if a streamed operation is a top-level post that should be screened."""
+    return operation.get('type') == 'comment' and operation.get('parent_author', None) == ''
+
+class ScreeningPipeline:
+    """Screens candidate posts with a bounded worker pool and yields results in block order."""
+
+    def __init__(self, hybrid_screening, worker_count=1, queue_depth=32):
+        """
+        Initialize the screening pipeline.
+
+        Args:
+            hybrid_screening: HybridScreening instance used to screen each post
+            worker_count: Number of concurrent screenings; 1 screens serially in the caller's thread
+            queue_depth: Maximum number of streamed operations buffered ahead of the consumer
+        """
+        self.hybrid_screening = hybrid_screening
+        self.worker_count = max(1, int(worker_count))
+        self.queue_depth = max(self.worker_count, int(queue_depth))
+
+    def run(self, operations, included_posts):
+        """
+        Screen a stream of operations.
+
+        Args:
+            operations: Iterable of streamed operations (consumed lazily)
+            included_posts: The live list of posts already accepted for curation
+
+        Yields:
+            (operation, screening_result) tuples in stream order. screening_result is None
+            for operations that are not top-level posts.
+        """
+        if self.worker_count == 1:
+            yield from self._run_serial(operations, included_posts)
+        else:
+            yield from self._run_concurrent(operations, included_posts)
+
+    def _run_serial(self, operations, included_posts):
+        for operation in operations:
+            if not is_screening_candidate(operation):
+                yield operation, None
+                continue
+            try:
+                screening_result = self.hybrid_screening.screen_content(operation, included_posts=included_posts)
+            except Exception as e:
+                logger.error(f"Error in hybrid screening for {operation['author']}/{operation['permlink']}: {e}")
+                screening_result = self.hybrid_screening.error_result(e)
+                self.hybrid_screening.track_result(screening_result)
+            yield operation, screening_result
+
+    def _run_concurrent(self, operations, included_posts):
+        executor = ThreadPoolExecutor(max_workers=self.worker_count, thread_name_prefix='screening')
+        pending = deque()
+        operations = iter(operations)
+        exhausted = False
+
+        try:
+            while True:
+                # Fill the bounded look-ahead queue
+                while not exhausted and len(pending) < self.queue_depth:
+                    try:
+                        operation = next(operations)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if is_screening_candidate(operation):
+                        future = executor.submit(
+                            self.hybrid_screening.screen_content,
+                            operation,
+                            included_posts=list(included_posts),
+                            track_stats=False
+                        )
+                    else:
+                        future = None
+                    pending.append((operation, future))
+
+                if not pending:
+                    return
+
+                # Merge back strictly in stream order
+                operation, future = pending.popleft()
+                if future is None:
+                    yield operation, None
+                    continue
+
+                try:
+                    screening_result = future.result()
+                except Exception as e:
+                    logger.error(f"Error in hybrid screening for {operation['author']}/{operation['permlink']}: {e}")
+                    screening_result = self.hybrid_screening.error_result(e)
+
+                screening_result = self.hybrid_screening.enforce_post_limit(operation, screening_result, included_posts)
+                self.hybrid_screening.track_result(screening_result)
+                yield operation, screening_result
+        finally:
+            # The consumer may stop early (e.g. NUMBER_OF_REVIEWED_POSTS reached); drop speculative work.
+            executor.shutdown(wait=False, cancel_futures=True)
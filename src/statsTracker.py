@@ -1,6 +1,13 @@
-import numpy as np
 from collections import defaultdict
+from contextlib import contextmanager
+import json
 import logging
+import os
+import threading
+import time
+
+from latencyHistogram import LatencyHistogram
+from streamingStats import StreamingSummary
 
 logger = logging.getLogger(__name__)
 
@@ -10,9 +17,14 @@ class StatsTracker:
     def __init__(self):
         self.total_evaluated = 0
         self.rejection_counts = defaultdict(int)
-        self.rejected_scores = []
-        self.accepted_scores = []
+        # Constant-memory summaries (count/min/max/mean plus P² median and tails), so long
+        # HISTORY scans don't keep every score
+        self.rejected_scores = StreamingSummary()
+        self.accepted_scores = StreamingSummary()
         self.accepted_by_tier = defaultdict(int)
+        # Stage name -> LatencyHistogram. Stages are recorded from screening worker threads.
+        self.timings = defaultdict(LatencyHistogram)
+        self._timing_lock = threading.Lock()
         logger.info("StatsTracker initialized.")
 
     def track_evaluation(self):
@@ -29,7 +41,7 @@ class StatsTracker:
         """
         self.rejection_counts[rule_type] += 1
         if rule_type == 'score_rejected' and score is not None:
-            self.rejected_scores.append(score)
+            self.rejected_scores.add(score)
 
     def track_acceptance(self, score, quality_tier):
         """
@@ -39,23 +51,59 @@ class StatsTracker:
             score (float): The final score of the accepted post.
             quality_tier (str): The quality tier of the accepted post.
         """
-        self.accepted_scores.append(score)
+        self.accepted_scores.add(score)
         self.accepted_by_tier[quality_tier] += 1
 
-    def _calculate_stats(self, scores):
-        """Helper function to calculate min, max, mean, and median for a list of scores."""
-        if not scores:
-            return {'min': 0, 'max': 0, 'mean': 0, 'median': 0, 'count': 0}
-        
-        scores_np = np.array(scores)
+    def track_timing(self, stage, seconds):
+        """
+        Track the duration of one call of a stage.
+
+        Args:
+            stage (str): Name of the stage (e.g. 'language_detection', 'rule.dmca',
+                         'score.author', 'rpc.get_accounts', 'llm.curate').
+            seconds (float): Duration of the call in seconds.
+        """
+        with self._timing_lock:
+            self.timings[stage].record(seconds * 1000.0)
+
+    @contextmanager
+    def timed(self, stage):
+        """Context manager that tracks the wall-clock duration of its block as a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.track_timing(stage, time.perf_counter() - start)
+
+    def to_dict(self):
+        """Return the run statistics, including the latency histograms, as a JSON-serializable dict."""
+        with self._timing_lock:
+            timings = {stage: histogram.to_dict() for stage, histogram in sorted(self.timings.items())}
         return {
-            'min': round(np.min(scores_np), 2),
-            'max': round(np.max(scores_np), 2),
-            'mean': round(np.mean(scores_np), 2),
-            'median': round(np.median(scores_np), 2),
-            'count': len(scores)
+            'total_evaluated': self.total_evaluated,
+            'rejection_counts': dict(self.rejection_counts),
+            'accepted_by_tier': dict(self.accepted_by_tier),
+            'accepted_scores': self.accepted_scores.summary(),
+            'rejected_scores': self.rejected_scores.summary(),
+            'timings': timings
         }
 
+    def save_json(self, path):
+        """
+        Write the run statistics as JSON (to a temporary file, then renamed).
+
+        Args:
+            path (str): Output file, e.g. 'data/run_stats.json'.
+        """
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write run statistics to {path}: {e}")
+
     def generate_report(self):
         """Generate and return a formatted string of the run statistics."""
         report = []
@@ -83,18 +131,27 @@ class StatsTracker:
                     report.append(f"  - {rule}: {count}")
         
         report.append(f"\nRejected by Score Threshold: {total_rejected_by_score}")
-        rejected_score_stats = self._calculate_stats(self.rejected_scores)
+        rejected_score_stats = self.rejected_scores.summary()
         if rejected_score_stats['count'] > 0:
-            report.append(f"  - Score Stats (Rejected): Min: {rejected_score_stats['min']}, Max: {rejected_score_stats['max']}, Mean: {rejected_score_stats['mean']}, Median: {rejected_score_stats['median']}")
+            report.append(f"  - Score Stats (Rejected): Min: {rejected_score_stats['min']}, Max: {rejected_score_stats['max']}, Mean: {rejected_score_stats['mean']}, Median: {rejected_score_stats['median']}, P10: {rejected_score_stats['p10']}, P90: {rejected_score_stats['p90']}")
 
         report.append("\n--- Acceptance Details ---")
         report.append(f"Accepted by Tier:")
         for tier, count in sorted(self.accepted_by_tier.items(), key=lambda item: item[1], reverse=True):
             report.append(f"  - {tier.capitalize()}: {count}")
 
-        accepted_score_stats = self._calculate_stats(self.accepted_scores)
+        accepted_score_stats = self.accepted_scores.summary()
         if accepted_score_stats['count'] > 0:
-            report.append(f"\n  - Score Stats (Accepted): Min: {accepted_score_stats['min']}, Max: {accepted_score_stats['max']}, Mean: {accepted_score_stats['mean']}, Median: {accepted_score_stats['median']}")
+            report.append(f"\n  - Score Stats (Accepted): Min: {accepted_score_stats['min']}, Max: {accepted_score_stats['max']}, Mean: {accepted_score_stats['mean']}, Median: {accepted_score_stats['median']}, P10: {accepted_score_stats['p10']}, P90: {accepted_score_stats['p90']}")
+
+        if self.timings:
+            report.append("\n--- Stage Latency (ms) ---")
+            with self._timing_lock:
+                timings = sorted(self.timings.items())
+            for stage, histogram in timings:
+                report.append(f"  - {stage}: Calls: {histogram.count}, Total: {histogram.total / 1000.0:.1f}s, "
+                              f"Mean: {histogram.mean:.2f}, p50: {histogram.quantile(0.50):.2f}, "
+                              f"p95: {histogram.quantile(0.95):.2f}, p99: {histogram.quantile(0.99):.2f}, Max: {histogram.max:.2f}")
 
         report.append("\n" + "="*50)
         
@@ -2,27 +2,99 @@ import time
 import requests
 import configparser
 import os
+import threading
 
 from steem import Steem
 from steem.blockchain import Blockchain
 
+from rpcPool import SteemPool, wrap_client_calls
+from rateLimiter import get_rate_limiter
+
 # Read the config.ini file
 config = configparser.ConfigParser()
 config.read('config/config.ini')
 
+DEFAULT_STEEM_NODE = 'https://api.steemit.com'
+
+def parse_node_list(node_api):
+    """
+    Splits a (potentially comma-separated) STEEM_API setting into a list of node URLs.
+
+    Returns:
+        list: The configured node URLs, or None if no node is configured.
+    """
+    if isinstance(node_api, (list, tuple)):
+        return [n.strip() for n in node_api if n and n.strip()] or None
+    if isinstance(node_api, str) and ',' in node_api:
+        return [n.strip() for n in node_api.split(',') if n.strip()]
+    elif node_api and node_api.strip():
+        return [node_api.strip()]
+    return None
+
+def _read_pool_settings():
+    try:
+        enabled = config.getboolean('STEEM', 'RPC_POOL', fallback=True)
+        cooldown = config.getfloat('STEEM', 'RPC_NODE_COOLDOWN_SECONDS', fallback=60.0)
+        probe_timeout = config.getfloat('STEEM', 'RPC_HEALTH_CHECK_TIMEOUT', fallback=5.0)
+    except ValueError:
+        enabled, cooldown, probe_timeout = True, 60.0, 5.0
+    return enabled, cooldown, probe_timeout
+
+RPC_POOL_ENABLED, RPC_NODE_COOLDOWN_SECONDS, RPC_HEALTH_CHECK_TIMEOUT = _read_pool_settings()
+
+_rpc_pool = None
+_rpc_pool_lock = threading.Lock()
+
+def get_rpc_pool():
+    """Return the process-wide SteemPool, configured from [STEEM] in config.ini."""
+    global _rpc_pool
+    if _rpc_pool is None:
+        with _rpc_pool_lock:
+            if _rpc_pool is None:
+                from steembase.exceptions import RPCError
+                _rpc_pool = SteemPool(
+                    connect_steem_with_retry,
+                    cooldown_seconds=RPC_NODE_COOLDOWN_SECONDS,
+                    probe_timeout=RPC_HEALTH_CHECK_TIMEOUT,
+                    application_errors=(RPCError,)
+                )
+    return _rpc_pool
+
 def initialize_steem_with_retry(node_api=None, keys=None, max_retries=5, initial_delay=2.0):
     """
-    Initializes the Steem instance with a retry mechanism for connection errors.
+    Returns a Steem instance for the given nodes and keys.
+
+    With RPC_POOL enabled (the default), instances are shared process-wide: the first call
+    for a node list and key set connects (with retries), later calls reuse that instance,
+    and its calls are routed to the fastest healthy node. Otherwise a new instance is
+    created on every call.
+    """
+    if RPC_POOL_ENABLED:
+        return get_rpc_pool().get(parse_node_list(node_api), keys, unlocked="UNLOCK" in os.environ)
+    return connect_steem_with_retry(node_api, keys, max_retries, initial_delay)
+
+def discard_steem_instance(steem_instance, error=None):
+    """
+    Drop a pooled Steem instance after a failed call, so the next initialize_steem_with_retry
+    call connects a new one (as retry loops did before instances were pooled).
+
+    Errors reported by a healthy node (RPCError, e.g. the vote interval) keep the instance.
+
+    Returns:
+        bool: True if the instance was dropped and the caller should get a new one
+    """
+    if RPC_POOL_ENABLED and steem_instance is not None:
+        return get_rpc_pool().discard(steem_instance, error)
+    return False
+
+def connect_steem_with_retry(node_api=None, keys=None, max_retries=5, initial_delay=2.0):
+    """
+    Initializes a new Steem instance with a retry mechanism for connection errors.
     """
     for attempt in range(max_retries):
         try:
             # Handle potentially comma-separated node lists for resilience
-            if isinstance(node_api, str) and ',' in node_api:
-                nodes = [n.strip() for n in node_api.split(',') if n.strip()]
-            elif node_api:
-                nodes = [node_api]
-            else:
-                nodes = None
+            nodes = parse_node_list(node_api)
 
             # Initialize Steem. 
             if "UNLOCK" in os.environ:
@@ -39,6 +111,7 @@ def initialize_steem_with_retry(node_api=None, keys=None, max_retries=5, initial
                 print(f"Successfully connected to Steem node: {node_api}")
             else:
                 print("Successfully connected to default Steem node.")
+            rate_limit_rpc(s)
             return s
         except UnboundLocalError as e:
             # This specific error from the traceback indicates a probable transient issue in steem-python http_client
@@ -58,6 +131,52 @@ def initialize_steem_with_retry(node_api=None, keys=None, max_retries=5, initial
     print(f"FATAL: Could not initialize Steem after {max_retries} attempts.")
     return None
 
+def instrument_rpc(steem_instance, stats_tracker):
+    """
+    Record the latency of every RPC call of a Steem instance in a StatsTracker.
+
+    Wraps the `call` and `exec` methods of the instance's steemd client, so each call is
+    tracked as the stage 'rpc.<method name>' (e.g. 'rpc.get_accounts'), including retries.
+
+    Args:
+        steem_instance: Steem instance whose calls are timed
+        stats_tracker: StatsTracker that receives the durations
+    """
+    client = getattr(steem_instance, 'steemd', None)
+    if client is None or stats_tracker is None:
+        return
+
+    def timed(name, invoke):
+        start = time.perf_counter()
+        try:
+            return invoke()
+        finally:
+            stats_tracker.track_timing(f'rpc.{name}', time.perf_counter() - start)
+
+    wrap_client_calls(client, timed)
+
+def rate_limit_rpc(steem_instance, rate_limiter=None):
+    """
+    Send every RPC call of a Steem instance through the shared rate limiter.
+
+    The pool connects a separate instance for every node it routes calls to, so each
+    wrapper charges the one node its client is connected to.
+
+    Args:
+        steem_instance: Steem instance whose calls are limited
+        rate_limiter: RateLimiter to use (defaults to the process-wide one)
+    """
+    client = getattr(steem_instance, 'steemd', None)
+    limiter = rate_limiter or get_rate_limiter()
+    if client is None or not limiter.enabled:
+        return
+
+    def limited(name, invoke):
+        limiter.acquire(getattr(client, 'url', None) or DEFAULT_STEEM_NODE, (name,))
+        return invoke()
+
+    wrap_client_calls(client, limited)
+
 try:
     SDS_API = config.get('STEEM', 'SDS_API')
 except (configparser.NoSectionError, configparser.NoOptionError):
@@ -0,0 +1,176 @@
+"""
+Streaming Statistics for Thoth
+
+Score statistics used to be computed from lists that kept every score of a run, which
+grows without bound on long HISTORY scans. The classes here summarize a stream in
+constant memory and answer in O(1):
+
+- RunningStats: count, min, max, mean and variance with Welford's algorithm, which
+  stays numerically stable where a naive sum of squares does not.
+- P2Quantile: the P² algorithm (Jain & Chlamtac, 1985) estimates one quantile from
+  five markers that are moved towards their ideal positions with a piecewise-parabolic
+  interpolation. Up to five observations the quantile is exact.
+- StreamingSummary: RunningStats plus P² estimators for the median and the tails.
+"""
+
+import math
+
+class RunningStats:
+    """Count, min, max, mean and variance of a stream (Welford's algorithm)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """Add one observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def variance(self):
+        """Population variance (0.0 for fewer than two observations)."""
+        return self._m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        """Population standard deviation."""
+        return math.sqrt(self.variance)
+
+class P2Quantile:
+    """Streaming estimate of one quantile with the P² algorithm (five markers)."""
+
+    def __init__(self, q):
+        """
+        Args:
+            q (float): The quantile to estimate, between 0 and 1 (0.5 = median)
+        """
+        self.q = q
+        self.count = 0
+        self._heights = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * q, 4 * q, 2 + 2 * q, 4.0]
+        self._increments = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    def add(self, value):
+        """Add one observation."""
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        # Find the cell the value falls into, extending the extreme markers if needed
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the three middle markers towards their desired positions
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+               (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i, step):
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i, step):
+        h, n = self._heights, self._positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+    @property
+    def value(self):
+        """The current estimate (exact, linearly interpolated, up to five observations)."""
+        if not self.count:
+            return 0.0
+        if self.count <= 5:
+            heights = self._heights
+            rank = self.q * (len(heights) - 1)
+            lower = math.floor(rank)
+            upper = min(lower + 1, len(heights) - 1)
+            return heights[lower] + (heights[upper] - heights[lower]) * (rank - lower)
+        return self._heights[2]
+
+class StreamingSummary:
+    """Constant-memory summary of a stream of values: RunningStats plus P² quantiles."""
+
+    def __init__(self, quantiles=(0.1, 0.5, 0.9)):
+        """
+        Args:
+            quantiles: The quantiles to estimate (the median is always included)
+        """
+        self.stats = RunningStats()
+        self.quantiles = {q: P2Quantile(q) for q in sorted(set(quantiles) | {0.5})}
+
+    def add(self, value):
+        """Add one observation."""
+        self.stats.add(value)
+        for estimator in self.quantiles.values():
+            estimator.add(value)
+
+    def __len__(self):
+        return self.stats.count
+
+    @property
+    def count(self):
+        """Number of observations."""
+        return self.stats.count
+
+    def quantile(self, q):
+        """Return the estimate of a tracked quantile."""
+        return self.quantiles[q].value
+
+    def summary(self, digits=2):
+        """
+        Return the summary as a dict.
+
+        Args:
+            digits (int): Number of decimals values are rounded to
+
+        Returns:
+            dict: count, min, max, mean, std, median and one 'pNN' entry per tracked quantile
+                  (all values 0 if nothing was recorded)
+        """
+        stats = self.stats
+        result = {
+            'min': round(stats.min, digits) if stats.count else 0,
+            'max': round(stats.max, digits) if stats.count else 0,
+            'mean': round(stats.mean, digits),
+            'std': round(stats.std, digits),
+            'median': round(self.quantile(0.5), digits),
+            'count': stats.count
+        }
+        for q in self.quantiles:
+            result[f'p{round(q * 100):02d}'] = round(self.quantile(q), digits)
+        return result
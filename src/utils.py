@@ -1,6 +1,4 @@
-import langdetect
 import configparser
-import re
 import authorValidation
 import contentValidation
 import walletValidation
@@ -10,7 +8,10 @@ import numpy as np
 import os
 import time
 from steem import Steem
+import languageId
 from localization import Localization
+from markupStripper import remove_formatting
+from postView import PostView
 
 # Create a ConfigParser object
 config = configparser.ConfigParser()
@@ -25,10 +26,8 @@ def get_rng():
     return np.random.default_rng(seed)
 
 def detect_language(text):
-    try:
-        return langdetect.detect(text)
-    except langdetect.lang_detect_exception.LangDetectException:
-        return "Unable to detect language"
+    # Sampled, seeded and cached (see languageId.py)
+    return languageId.detect_language(text)
 
 def screenPost(comment, included_posts=None, steem_instance=None):
     s = steem_instance or Steem()
@@ -38,7 +37,8 @@ def screenPost(comment, included_posts=None, steem_instance=None):
     ### comment = comment from the streamed blockchain operation
     ### latestComment = the full post content (get_content)
     ### 
-    latestComment = s.get_content(comment['author'], comment['permlink'])
+    comment = PostView.of(comment)
+    latestComment = PostView(s.get_content(comment['author'], comment['permlink']))
 
     if ( contentValidation.isEdit(comment, latest_content=latestComment) ):
         return "Post edit"
@@ -53,9 +53,9 @@ def screenPost(comment, included_posts=None, steem_instance=None):
         return "Required tag missing"
     
     targetLanguage = [lang.strip() for lang in config.get('CONTENT', 'LANGUAGE').split(',') if lang]
-    tmpBody=remove_formatting(latestComment['body'])
+    tmpBody=latestComment.clean_body
 
-    wordCount = contentValidation.word_count(tmpBody)
+    wordCount = latestComment.word_count
     if contentValidation.isTooShortHard(wordCount):
         return "Too short (hard limit)"
 
@@ -95,21 +95,6 @@ def screenPost(comment, included_posts=None, steem_instance=None):
            
     return "Accept"
 
-def remove_formatting(text):
-    # Remove markdown and HTML formatting
-    # Regex by AI (Brave Leo --> Llama )
-    text = re.sub(r'^#{1,6} (.*)$', r'\1', text, flags=re.MULTILINE)
-    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
-    text = re.sub(r'\*(.*?)\*', r'\1', text)
-    text = re.sub(r'\[(.*?)\]\((.*?)\)', r'\1', text)
-    text = re.sub(r'\!\[\]\(.*?\)', '', text)
-    text = re.sub(r'!\w+\.\w+', '', text)  # Remove image labels
-    text = re.sub(r'<.*?>', '', text)
-    text = re.sub(r'<!--.*?-->', '', text)  # Remove HTML comments
-    text = re.sub(r'<script>.*?</script>', '', text)  # Remove HTML scripts
-    text = re.sub(r'<style>.*?</style>', '', text)  # Remove HTML styles
-    return text
-
 def generate_beneficiary_display_html(beneficiary_list, author_accounts, delegator_accounts, thoth_account, columns=2):
     """
     Generates an HTML block to display beneficiaries, categorized by role.
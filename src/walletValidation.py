@@ -3,6 +3,8 @@ from decimal import Decimal
 import configparser
 import logging
 
+from authorSnapshot import fetch_snapshot
+from fileSets import file_sets, normalize_account
 from steemHelpers import initialize_steem_with_retry
 import utils
 
@@ -19,59 +21,131 @@ steemApi = config.get('STEEM', 'STEEM_API')
 screenedDelegateeFile = config.get('WALLET', 'SCREENED_DELEGATEE_FILE')
 uncountedDelegateeFile = config.get('WALLET', 'UNCOUNTED_DELEGATEE_FILE')
 
-def _get_authors_delegation_to_thoth(author: str, steem_instance=None) -> Decimal:
-    """
-    Fetches the amount of an author's outgoing delegation to the Thoth account.
+class DelegationSummary:
+    """An account's outgoing vesting delegations, classified in a single paginated scan."""
 
-    Args:
-        author: The Steem account name of the author.
+    def __init__(self):
+        self.thoth_vests = Decimal('0')
+        self.uncounted_vests = Decimal('0')
+        self.screened_vests = Decimal('0')
+        self.total_vests = Decimal('0')
+        self.delegation_count = 0
 
-    Returns:
-        The amount of vesting shares delegated to Thoth by the author as a Decimal.
-        If the author makes no delegations to Thoth, returns Decimal('0').
+def _iter_vesting_delegations(s, delegator, batch_size=100):
+    """
+    Page through an account's outgoing vesting delegations.
+
+    Yields:
+        (delegatee, vests) tuples, with vests as a Decimal.
     """
-    steemApi = config.get('STEEM', 'STEEM_API')
-    s = steem_instance or initialize_steem_with_retry(node_api=steemApi)
-    if not s:
-        return Decimal('0')
-        
-    thothAccount = config.get('STEEM', 'POSTING_ACCOUNT', fallback='').strip().lower().replace('@', '')
-                              
     last_delegatee = ''
-    batch_size = 100
     is_first_batch = True
-                              
+
     while True:
-        data = s.get_vesting_delegations(author, last_delegatee, batch_size)
+        data = s.get_vesting_delegations(delegator, last_delegatee, batch_size)
         if not data:
             break
 
+        # For batches after the first, skip the first record (already seen)
         start_idx = 0 if is_first_batch else 1
         is_first_batch = False
 
         for delegation in data[start_idx:]:
             delegatee = delegation['delegatee']
-            if delegatee.lower() == thothAccount:
-                vests_str = delegation['vesting_shares'].split(' ')[0]
-                return Decimal(vests_str)
+            yield delegatee, Decimal(delegation['vesting_shares'].split(' ')[0])
             last_delegatee = delegatee
 
         if len(data) < batch_size:
             break
 
+def _load_delegatee_file(delegateeFile):
+    """Return a delegatee file as a set of normalized account names, or an empty set if it is missing."""
+    # Account names are normalized (no '@' prefix, lower case) for robust matching.
+    # The file is only re-read when it changes on disk.
+    return file_sets.get(delegateeFile, normalize_account)
+
+def get_delegation_summary(delegator, steem_instance=None, snapshot=None) -> DelegationSummary:
+    """
+    Scan an account's outgoing delegations once and classify each one as a delegation
+    to Thoth, to an uncounted delegatee, and/or to a screened delegatee.
+
+    Args:
+        delegator: The Steem account name.
+        snapshot: Optional AuthorSnapshot used to skip the scan for accounts without delegations.
+
+    Returns:
+        A DelegationSummary. All totals are zero if the account has no outgoing delegations.
+    """
+    summary = DelegationSummary()
+
+    # Optimization: If the user has no delegated shares at all, we can exit early.
+    _, delegated_vests_total, _ = _get_account_vesting_info(delegator, steem_instance=steem_instance, snapshot=snapshot)
+    if delegated_vests_total is None or delegated_vests_total == 0.0:
+        return summary
+
+    steemApi = config.get('STEEM', 'STEEM_API')
+    s = steem_instance or initialize_steem_with_retry(node_api=steemApi)
+    if not s:
+        return summary
+
+    thothAccount = config.get('STEEM', 'POSTING_ACCOUNT', fallback='').strip().lower().replace('@', '')
+    uncountedDelegatees = _load_delegatee_file(uncountedDelegateeFile)
+    screenedDelegatees = _load_delegatee_file(screenedDelegateeFile)
+
+    for delegatee, vests in _iter_vesting_delegations(s, delegator):
+        # Ensure case-insensitive matching against normalized lists
+        delegatee = delegatee.lower()
+        if delegatee == thothAccount:
+            summary.thoth_vests += vests
+        if delegatee in uncountedDelegatees:
+            summary.uncounted_vests += vests
+        if delegatee in screenedDelegatees:
+            summary.screened_vests += vests
+        summary.total_vests += vests
+        summary.delegation_count += 1
+
+    logger.info(f"Delegator: {delegator}, delegations: {summary.delegation_count}, thoth: {summary.thoth_vests}, uncounted: {summary.uncounted_vests}, screened: {summary.screened_vests}")
+    return summary
+
+def _get_authors_delegation_to_thoth(author: str, steem_instance=None) -> Decimal:
+    """
+    Fetches the amount of an author's outgoing delegation to the Thoth account.
+
+    Args:
+        author: The Steem account name of the author.
+
+    Returns:
+        The amount of vesting shares delegated to Thoth by the author as a Decimal.
+        If the author makes no delegations to Thoth, returns Decimal('0').
+    """
+    steemApi = config.get('STEEM', 'STEEM_API')
+    s = steem_instance or initialize_steem_with_retry(node_api=steemApi)
+    if not s:
+        return Decimal('0')
+        
+    thothAccount = config.get('STEEM', 'POSTING_ACCOUNT', fallback='').strip().lower().replace('@', '')
+
+    for delegatee, vests in _iter_vesting_delegations(s, author):
+        if delegatee.lower() == thothAccount:
+            return vests
+
     return Decimal('0')
 
-def _get_account_vesting_info(author: str, steem_instance=None) -> tuple[float | None, float | None, float | None]:
+def _get_account_vesting_info(author: str, steem_instance=None, snapshot=None) -> tuple[float | None, float | None, float | None]:
     """
     Fetches and parses an account's total, delegated, and received vesting shares.
 
     Args:
         author: The Steem account name.
+        snapshot: Optional AuthorSnapshot to read the vesting data from instead of fetching the account.
 
     Returns:
         A tuple of (vesting_shares, delegated_vesting_shares, received_vesting_shares) as floats,
         or (None, None, None) if the account is not found or data is missing.
     """
+    if snapshot is not None:
+        return snapshot.vesting_shares, snapshot.delegated_vesting_shares, snapshot.received_vesting_shares
+
     steemApi = config.get('STEEM', 'STEEM_API')
     s = steem_instance or initialize_steem_with_retry(node_api=steemApi)
     if not s:
@@ -93,22 +167,39 @@ def _get_account_vesting_info(author: str, steem_instance=None) -> tuple[float |
         logger.error(f"Error fetching vesting info for {author}: {e}")
         return None, None, None
 
-def walletScreened(account, steem_instance=None):
-    if not check_author_wallet(account, steem_instance=steem_instance):
+def walletScreened(account, steem_instance=None, snapshot=None):
+    if snapshot is None:
+        # Fetch the account once for all of the wallet checks below
+        s = steem_instance or initialize_steem_with_retry(node_api=config.get('STEEM', 'STEEM_API'))
+        if s:
+            snapshot = fetch_snapshot(s, account)
+            if snapshot is None:
+                # Account not found, cannot be screened.
+                return True
+
+    # Scan the outgoing delegations once for the Thoth, uncounted and screened totals
+    try:
+        delegations = get_delegation_summary(account, steem_instance=steem_instance, snapshot=snapshot)
+    except Exception as e:
+        # Same outcome as an error inside check_author_wallet: the wallet cannot be verified.
+        logger.error(f"Error reading delegations for {account}: {e}")
+        return True
+
+    if not check_author_wallet(account, steem_instance=steem_instance, snapshot=snapshot, delegations=delegations):
         return True
     
-    if _isPowerDownTooHigh(account, steemInstance=steem_instance):
+    if _isPowerDownTooHigh(account, steemInstance=steem_instance, snapshot=snapshot):
         return True
     
     maxScreenedDelegationPct = config.getfloat('WALLET', 'MAX_SCREENED_DELEGATION_PCT')
-    vesting_shares, _, _ = _get_account_vesting_info(account, steem_instance=steem_instance)
+    vesting_shares, _, _ = _get_account_vesting_info(account, steem_instance=steem_instance, snapshot=snapshot)
     if vesting_shares is None:
         # Account not found, cannot be screened.
         return True
 
     # The config value is a percentage (e.g., 15.0 for 15%).
     # The logic is to check if the percentage of screened delegations to total SP exceeds the threshold.
-    screenedVests = totalScreenedOrIgnoredDelegations(account, delegateeFile=screenedDelegateeFile, steem_instance=steem_instance)
+    screenedVests = float(delegations.screened_vests)
     
     # Avoid ZeroDivisionError if account has 0 SP.
     if vesting_shares == 0.0:  # Minimum vesting_shares was already checked by check_author_wallet.  At this point, 0 is ok.
@@ -121,9 +212,9 @@ def walletScreened(account, steem_instance=None):
     logger.info(f"Percentage screened: {screened_percentage:.2f}%")
     return screened_percentage > maxScreenedDelegationPct
 
-def totalScreenedOrIgnoredDelegations (delegator, delegateeFile=screenedDelegateeFile, steem_instance=None) -> float:
+def totalScreenedOrIgnoredDelegations (delegator, delegateeFile=screenedDelegateeFile, steem_instance=None, snapshot=None) -> float:
     # Optimization: If the user has no delegated shares at all, we can exit early.
-    _, delegated_vests_total, _ = _get_account_vesting_info(delegator, steem_instance=steem_instance)
+    _, delegated_vests_total, _ = _get_account_vesting_info(delegator, steem_instance=steem_instance, snapshot=snapshot)
     if delegated_vests_total is None or delegated_vests_total == 0.0:
         return 0.0
     
@@ -132,48 +223,26 @@ def totalScreenedOrIgnoredDelegations (delegator, delegateeFile=screenedDelegate
     if not s:
         return 0.0
 
-    try:
-        with open(delegateeFile, 'r') as f:
-            # Normalize account names: remove '@' prefix and convert to lowercase for robust matching
-            screenedDelegatees = {line.strip().lower().replace('@', '') for line in f if line.strip()}
-    except FileNotFoundError:
-        logger.warning(f"Screened delegatee file not found at '{delegateeFile}'. Returning 0.")
+    screenedDelegatees = _load_delegatee_file(delegateeFile)
+    if not screenedDelegatees:
         return 0.0
 
     total_vests = Decimal('0')
-    last_delegatee = ''
-    batch_size = 100
-    is_first_batch = True
-
-    while True:
-        data = s.get_vesting_delegations(delegator, last_delegatee, batch_size)
-        if not data:
-            break
-
-        # For batches after the first, skip the first record (already seen)
-        start_idx = 0 if is_first_batch else 1
-        is_first_batch = False
-
-        for delegation in data[start_idx:]:
-            delegatee = delegation['delegatee']
-            vests_str = delegation['vesting_shares'].split(' ')[0]
-            # Ensure case-insensitive matching against normalized list
-            if delegatee.lower() in screenedDelegatees:
-                total_vests += Decimal(vests_str)
-            last_delegatee = delegatee
-
-        if len(data) < batch_size:
-            break
+    for delegatee, vests in _iter_vesting_delegations(s, delegator):
+        # Ensure case-insensitive matching against normalized list
+        if delegatee.lower() in screenedDelegatees:
+            total_vests += vests
 
     logger.info(f"Delegator: {delegator}, total_vests: {total_vests}")
     return float(total_vests)
 
-def _isPowerDownTooHigh(author: str, steemInstance=None) -> bool:
+def _isPowerDownTooHigh(author: str, steemInstance=None, snapshot=None) -> bool:
     """
     Checks if the author's yearly powerdown percentage exceeds the configured maximum.
 
     Args: 
         author: The Steem account name of the author
+        snapshot: Optional AuthorSnapshot to read the account from instead of fetching it
 
     Returns:
         True if the author's yearly powerdown percentage is above the limit, False otherwise.
@@ -181,17 +250,18 @@ def _isPowerDownTooHigh(author: str, steemInstance=None) -> bool:
 
     maxPowerdownYearlyPct = config.getfloat('WALLET', 'MAX_POWERDOWN_YEARLY_PCT')
 
-    if ( not steemInstance ):
+    if snapshot is not None:
+        s = None
+    elif ( not steemInstance ):
         steemApi = config.get('STEEM', 'STEEM_API')
         s = initialize_steem_with_retry(node_api=steemApi)
+        if not s:
+            return False
     else:
         s = steemInstance
-    
-    if not s:
-        return False
 
     try:
-        authorAccountJson = s.get_account(author)
+        authorAccountJson = snapshot.account if snapshot is not None else s.get_account(author)
         if not authorAccountJson:
             logger.warning(f"Account '{author}' not found.")
             return False
@@ -213,12 +283,14 @@ def _isPowerDownTooHigh(author: str, steemInstance=None) -> bool:
 
     return False
 
-def check_author_wallet(author: str, steem_instance=None) -> bool:
+def check_author_wallet(author: str, steem_instance=None, snapshot=None, delegations=None) -> bool:
     """
     Checks an author's holdings against delegation and undelegated SP thresholds.
 
     Args:
         author: The Steem account name of the author.
+        snapshot: Optional AuthorSnapshot to read the vesting data from instead of fetching the account.
+        delegations: Optional DelegationSummary; the delegations are scanned if it is not given.
 
     Returns:
         True if the author passes the screening, False otherwise.
@@ -228,14 +300,16 @@ def check_author_wallet(author: str, steem_instance=None) -> bool:
         min_undelegated_sp = config.getfloat('WALLET', 'MIN_UNDELEGATED_SP')
                 
         # 1. Get account details using the new helper function
-        vesting_shares, delegated_vesting_shares, _ = _get_account_vesting_info(author, steem_instance=steem_instance)
+        vesting_shares, delegated_vesting_shares, _ = _get_account_vesting_info(author, steem_instance=steem_instance, snapshot=snapshot)
         if vesting_shares is None:
             # Error already printed in helper function
             return False
 
         # Calculate penalty only for this check, using raw delegated vests
-        thoth_delegation = _get_authors_delegation_to_thoth(author, steem_instance=steem_instance)
-        unCountedVests = totalScreenedOrIgnoredDelegations(delegator=author, delegateeFile=uncountedDelegateeFile, steem_instance=steem_instance)
+        if delegations is None:
+            delegations = get_delegation_summary(author, steem_instance=steem_instance, snapshot=snapshot)
+        thoth_delegation = delegations.thoth_vests
+        unCountedVests = float(delegations.uncounted_vests)
         
         # The penalty is the total outgoing delegations, minus any "free passes"
         delegationPenalty = max(0.0, delegated_vesting_shares - float(thoth_delegation) - unCountedVests)
@@ -0,0 +1,88 @@
+"""
+bench_markup_stripper.py
+
+Micro-benchmark of the markup stripper used for post bodies (src/markupStripper.py)
+against the previous ten-pass implementation of utils.remove_formatting, which is kept
+below as the reference. Before timing, both implementations are run on every input
+and the outputs must be identical.
+
+Run examples:
+    python tools/bench_markup_stripper.py
+    python tools/bench_markup_stripper.py --size-kb 64 --repeat 50
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from markupStripper import remove_formatting
+
+CORPUS_FILE = os.path.join(os.path.dirname(__file__), 'data', 'markup_corpus.json')
+
+def reference_remove_formatting(text):
+    """The previous utils.remove_formatting, kept verbatim as the reference."""
+    text = re.sub(r'^#{1,6} (.*)$', r'\1', text, flags=re.MULTILINE)
+    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
+    text = re.sub(r'\*(.*?)\*', r'\1', text)
+    text = re.sub(r'\[(.*?)\]\((.*?)\)', r'\1', text)
+    text = re.sub(r'\!\[\]\(.*?\)', '', text)
+    text = re.sub(r'!\w+\.\w+', '', text)  # Remove image labels
+    text = re.sub(r'<.*?>', '', text)
+    text = re.sub(r'<!--.*?-->', '', text)  # Remove HTML comments
+    text = re.sub(r'<script>.*?</script>', '', text)  # Remove HTML scripts
+    text = re.sub(r'<style>.*?</style>', '', text)  # Remove HTML styles
+    return text
+
+def load_corpus():
+    with open(CORPUS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def build_body(cases, size_kb):
+    """Concatenate corpus inputs into one body of roughly size_kb kilobytes."""
+    pieces = [case['input'] for case in cases]
+    body = []
+    length = 0
+    while length < size_kb * 1024:
+        for piece in pieces:
+            body.append(piece)
+            length += len(piece) + 2
+    return '\n\n'.join(body)
+
+def throughput(func, text, repeat):
+    """Return the best observed throughput in MB/s over `repeat` runs."""
+    size_mb = len(text.encode('utf-8')) / (1024 * 1024)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return size_mb / best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the markup stripper against the previous implementation.")
+    parser.add_argument("--size-kb", type=int, default=32, help="Size of each benchmark body in KB (default: 32).")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per body (default: 20).")
+    args = parser.parse_args()
+
+    cases = load_corpus()
+    plain = [case for case in cases if case.get('kind') == 'plain']
+    bodies = {
+        'mixed markup': build_body(cases, args.size_kb),
+        'plain text': build_body(plain, args.size_kb),
+    }
+
+    for name, body in bodies.items():
+        assert remove_formatting(body) == reference_remove_formatting(body), f"Output differs on {name} body"
+
+    print(f"{'body':<14}{'size':>10}{'reference MB/s':>17}{'new MB/s':>11}{'speedup':>10}")
+    for name, body in bodies.items():
+        old = throughput(reference_remove_formatting, body, args.repeat)
+        new = throughput(remove_formatting, body, args.repeat)
+        print(f"{name:<14}{len(body) // 1024:>8}KB{old:>17.1f}{new:>11.1f}{new / old:>9.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for account-name interning.
+Verifies that IDs are dense, stable within an interner and usable for vectorized set operations.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from accountIds import AccountInterner, union, intersection
+
+def test_ids_are_dense_and_stable():
+    """IDs are assigned densely and a name keeps its ID."""
+    print("Testing interning...")
+    interner = AccountInterner()
+    ids = interner.ids_of(['carol', 'alice', 'bob', 'alice'])
+    assert ids.dtype == np.uint32
+    assert list(ids) == [0, 1, 2], f"Expected dense sorted IDs, got {list(ids)}"
+    assert len(interner) == 3
+
+    alice = interner.id_of('alice')
+    assert interner.ids_of(['alice', 'dave'])[0] == alice
+    assert interner.id_of('dave') == 3, "New names continue after the assigned IDs"
+    print("✓ Interning test passed")
+
+def test_set_operations():
+    """Union and intersection of ID arrays match Python set semantics."""
+    print("Testing vectorized set operations...")
+    interner = AccountInterner()
+    a_names = {f'user{i}' for i in range(0, 30000)}
+    b_names = {f'user{i}' for i in range(20000, 50000)}
+    c_names = {'user1', 'member'}
+    a, b, c = interner.ids_of(a_names), interner.ids_of(b_names), interner.ids_of(c_names)
+
+    assert len(union(a, b, c)) == len(a_names | b_names | c_names)
+    assert len(intersection(a, b)) == len(a_names & b_names)
+    assert len(union()) == 0
+    print("✓ Vectorized set operations test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_ids_are_dense_and_stable()
+        test_set_operations()
+        print("All account ID tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test script for bulk author prefetching.
+Verifies that upcoming authors are resolved with one batched get_accounts call, that
+screening then finds them in the author snapshot cache, and that partly filled groups
+are passed on after the time or block limit.
+"""
+
+import sys
+import os
+import types
+
+# create fake steem package and submodules so tests don't require the real dependency
+fake_steem = types.ModuleType('steem')
+fake_steem.Steem = lambda *args, **kwargs: None
+fake_blockchain = types.ModuleType('steem.blockchain')
+fake_blockchain.Blockchain = None
+sys.modules.setdefault('steem', fake_steem)
+sys.modules.setdefault('steem.blockchain', fake_blockchain)
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from authorPrefetch import AuthorPrefetcher
+from authorSnapshot import AuthorSnapshotCache
+
+class CountingSteem:
+    """Fake Steem instance that counts single and batched account lookups."""
+
+    def __init__(self):
+        self.get_account_calls = 0
+        self.get_accounts_calls = []
+
+    def get_account(self, name):
+        self.get_account_calls += 1
+        return {'name': name, 'reputation': 0}
+
+    def get_accounts(self, names):
+        self.get_accounts_calls.append(list(names))
+        return [{'name': name, 'reputation': 0} for name in names if name != 'ghost']
+
+    def get_follow_count(self, name):
+        return {'account': name, 'follower_count': 1, 'following_count': 1}
+
+def make_operations(count):
+    operations = []
+    for i in range(count):
+        operations.append({'type': 'comment', 'parent_author': '', 'author': f'author{i % 30}', 'permlink': f'p{i}', 'block_num': i})
+        operations.append({'type': 'comment', 'parent_author': 'x', 'author': 'replier', 'permlink': f'r{i}', 'block_num': i})
+    return operations
+
+def test_prefetch_warms_cache():
+    """Authors are resolved in batches before their posts are yielded."""
+    print("Testing batched author prefetch...")
+    steem = CountingSteem()
+    cache = AuthorSnapshotCache(steem, ttl_seconds=600, max_entries=100)
+    prefetcher = AuthorPrefetcher(cache, lookahead=20)
+    prefetcher._get_follow_counts = lambda names: {name: {'follower_count': 7, 'following_count': 3} for name in names}
+
+    operations = make_operations(60)
+    passed = []
+    for operation in prefetcher.wrap(operations):
+        passed.append(operation)
+        if operation['parent_author'] == '':
+            assert cache.contains(operation['author']), f"{operation['author']} should be prefetched before screening"
+            assert cache.get(operation['author']).follower_count == 7
+
+    assert passed == operations, "Operations must pass through unchanged and in order"
+    assert steem.get_account_calls == 0, "No single-account lookups should be needed"
+    assert len(steem.get_accounts_calls) == 2, f"Expected 2 batched calls, got {len(steem.get_accounts_calls)}"
+    assert sorted(steem.get_accounts_calls[0]) == sorted(f'author{i}' for i in range(20))
+    print("✓ Batched author prefetch test passed")
+
+def test_prefetch_skips_cached_and_missing():
+    """Cached authors are not refetched and missing accounts are skipped."""
+    print("Testing cached and missing authors...")
+    steem = CountingSteem()
+    cache = AuthorSnapshotCache(steem, ttl_seconds=600, max_entries=100)
+    prefetcher = AuthorPrefetcher(cache, lookahead=5)
+    prefetcher._get_follow_counts = lambda names: {}
+
+    cache.get('alice')
+    added = prefetcher.prefetch(['alice', 'bob', 'bob', 'ghost'])
+    assert added == 1
+    assert steem.get_accounts_calls == [['bob', 'ghost']]
+    assert not cache.contains('ghost')
+    print("✓ Cached and missing authors test passed")
+
+def test_partial_groups_are_not_held_back():
+    """At the head of the chain, a group smaller than the lookahead is resolved after max_wait or max_blocks."""
+    print("Testing time and block limits...")
+    now = [0.0]
+    steem = CountingSteem()
+    cache = AuthorSnapshotCache(steem, ttl_seconds=600, max_entries=100)
+    prefetcher = AuthorPrefetcher(cache, lookahead=50, max_wait=2.0, max_blocks=0, clock=lambda: now[0])
+    prefetcher._get_follow_counts = lambda names: {}
+
+    def head_of_chain():
+        # One post every 3 seconds, as if each arrived in a new block
+        for i in range(5):
+            yield {'type': 'comment', 'parent_author': '', 'author': f'head{i}', 'permlink': f'p{i}', 'block_num': i}
+            now[0] += 3.0
+
+    passed = []
+    for operation in prefetcher.wrap(head_of_chain()):
+        passed.append((operation['permlink'], now[0]))
+    # A waiting post is passed on (together with the one that arrived) when the next post
+    # arrives after max_wait, not after 50 posts
+    assert passed == [('p0', 3.0), ('p1', 3.0), ('p2', 9.0), ('p3', 9.0), ('p4', 15.0)], passed
+    assert [len(names) for names in steem.get_accounts_calls] == [2, 2, 1]
+
+    steem = CountingSteem()
+    cache = AuthorSnapshotCache(steem, ttl_seconds=600, max_entries=100)
+    prefetcher = AuthorPrefetcher(cache, lookahead=50, max_wait=0, max_blocks=5, clock=lambda: 0.0)
+    prefetcher._get_follow_counts = lambda names: {}
+    operations = [{'type': 'comment', 'parent_author': '', 'author': f'a{i}', 'permlink': f'p{i}', 'block_num': i} for i in range(12)]
+    assert list(prefetcher.wrap(operations)) == operations
+    assert [len(names) for names in steem.get_accounts_calls] == [6, 6]
+
+    # Replies are passed through at once when no post is waiting
+    reply = {'type': 'comment', 'parent_author': 'x', 'author': 'replier', 'permlink': 'r', 'block_num': 1}
+    stream = prefetcher.wrap(iter([reply]))
+    assert next(stream) is reply
+    print("✓ Time and block limit test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_prefetch_warms_cache()
+        test_prefetch_skips_cached_and_missing()
+        test_partial_groups_are_not_held_back()
+        print("All author prefetch tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-run author snapshot cache.
+Verifies that account records and follow counts are fetched once, and that the
+cache honours its TTL and LRU bounds.
+"""
+
+import sys
+import os
+import time
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from authorSnapshot import AuthorSnapshot, AuthorSnapshotCache
+
+class CountingSteem:
+    """Fake Steem instance that counts account and follow-count lookups."""
+
+    def __init__(self):
+        self.account_calls = 0
+        self.follow_calls = 0
+
+    def get_account(self, name):
+        self.account_calls += 1
+        if name == 'ghost':
+            return None
+        return {
+            'name': name,
+            'reputation': '95832978796820',
+            'vesting_shares': '20000.000000 VESTS',
+            'delegated_vesting_shares': '5000.000000 VESTS',
+            'received_vesting_shares': '0.000000 VESTS',
+            'vesting_withdraw_rate': '100.000000 VESTS',
+            'created': '2018-01-01T00:00:00',
+        }
+
+    def get_follow_count(self, name):
+        self.follow_calls += 1
+        return {'account': name, 'follower_count': 420, 'following_count': 69}
+
+def test_fetched_once():
+    """Repeated lookups and attribute reads reuse a single set of RPC calls."""
+    print("Testing single fetch per author...")
+    steem = CountingSteem()
+    cache = AuthorSnapshotCache(steem, ttl_seconds=600, max_entries=10)
+
+    snapshot = cache.get('alice')
+    for _ in range(5):
+        again = cache.get('alice')
+        assert again is snapshot
+        assert again.follower_count == 420
+        assert again.following_count == 69
+
+    assert steem.account_calls == 1, f"Expected 1 get_account call, got {steem.account_calls}"
+    assert steem.follow_calls == 1, f"Expected 1 get_follow_count call, got {steem.follow_calls}"
+    assert snapshot.vesting_shares == 20000.0
+    assert snapshot.delegated_vesting_shares == 5000.0
+    assert snapshot.vesting_withdraw_rate == 100.0
+    assert snapshot['created'] == '2018-01-01T00:00:00'
+    assert cache.get('ghost') is None
+    print("✓ Single fetch test passed")
+
+def test_rep_matches_steem_account():
+    """The reputation score matches steem.account.Account.rep."""
+    print("Testing reputation formula...")
+    assert AuthorSnapshot('a', {'reputation': 0}).rep == 25
+    assert AuthorSnapshot('a', {'reputation': '95832978796820'}).rep == 69.83
+    assert AuthorSnapshot('a', {'reputation': -1000000000}).rep == 25.0
+    print("✓ Reputation formula test passed")
+
+def test_ttl_and_lru():
+    """Expired and least recently used entries are refetched."""
+    print("Testing TTL and LRU eviction...")
+    steem = CountingSteem()
+    cache = AuthorSnapshotCache(steem, ttl_seconds=0.05, max_entries=2)
+    cache.get('alice')
+    time.sleep(0.06)
+    cache.get('alice')
+    assert steem.account_calls == 2, "Expired snapshot should be refetched"
+
+    cache.ttl_seconds = 600
+    cache.get('bob')
+    cache.get('carol')  # evicts alice
+    cache.get('alice')
+    assert steem.account_calls == 5, f"Evicted snapshot should be refetched, got {steem.account_calls} calls"
+    print("✓ TTL and LRU test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_fetched_once()
+        test_rep_matches_steem_account()
+        test_ttl_and_lru()
+        print("All author snapshot tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test script for batched block ingestion.
+Verifies that block windows are fetched in batches and yielded in block order even when
+they complete out of order, that failed windows rotate nodes and fall back to per-block
+calls, that closing the stream does not wait for windows in flight, and that concurrent
+failures rotate the node only once.
+"""
+
+import sys
+import os
+import random
+import threading
+import time
+import types
+
+# create fake steem package and submodules so tests don't require the real dependency
+fake_steem = types.ModuleType('steem')
+fake_steem.Steem = lambda *args, **kwargs: None
+fake_blockchain = types.ModuleType('steem.blockchain')
+fake_blockchain.Blockchain = None
+sys.modules.setdefault('steem', fake_steem)
+sys.modules.setdefault('steem.blockchain', fake_blockchain)
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from blockIngestion import BlockIngestor
+from rpcBatch import RpcBatchClient
+
+def block_ops(block_num):
+    """One top-level post, one reply and one vote per block."""
+    def event(op_type, op):
+        return {'op': [op_type, op], 'timestamp': '2024-01-01T00:00:00', 'block': block_num, 'trx_id': f'trx{block_num}'}
+    return [
+        event('comment', {'parent_author': '', 'author': f'author{block_num}', 'permlink': f'post{block_num}'}),
+        event('comment', {'parent_author': 'someone', 'author': 'replier', 'permlink': f'reply{block_num}'}),
+        event('vote', {'voter': 'voter', 'author': 'someone', 'permlink': 'x'}),
+    ]
+
+class FakeSteem:
+    """Chain properties and per-block get_ops_in_block for the fallback path."""
+
+    def __init__(self, head):
+        self.head = head
+        self.single_calls = []
+
+    def get_dynamic_global_properties(self):
+        return {'last_irreversible_block_num': self.head}
+
+    def get_ops_in_block(self, block_num, only_virtual):
+        self.single_calls.append(block_num)
+        return block_ops(block_num)
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+class FakeSession:
+    """Answers get_ops_in_block batches after a random delay, or fails, or blocks until released."""
+
+    def __init__(self, fail=False, max_delay=0.0):
+        self.fail = fail
+        self.max_delay = max_delay
+        self.release = None
+        self.urls = []
+        self.batches = []
+        self._lock = threading.Lock()
+
+    def post(self, url, json=None, timeout=None):
+        with self._lock:
+            self.urls.append(url)
+            self.batches.append([call['params'][0] for call in json])
+            first_batch = len(self.batches) == 1
+        if self.fail:
+            raise ConnectionError("node unreachable")
+        if self.release is not None and not first_batch:
+            self.release.wait()
+        time.sleep(random.uniform(0, self.max_delay))
+        return FakeResponse([{'jsonrpc': '2.0', 'id': call['id'], 'result': block_ops(call['params'][0])} for call in json])
+
+def make_ingestor(head, session, **kwargs):
+    steem = FakeSteem(head)
+    ingestor = BlockIngestor(steem, nodes=['https://a', 'https://b'], retry_delay=0, **kwargs)
+    ingestor._rpc._session = session
+    return ingestor, steem
+
+def take(stream, count):
+    posts = [next(stream) for _ in range(count)]
+    stream.close()
+    return posts
+
+def test_windows_in_block_order():
+    """Windows complete out of order but posts are yielded in block order; replies and votes are dropped."""
+    print("Testing window fetching and ordering...")
+    session = FakeSession(max_delay=0.02)
+    ingestor, steem = make_ingestor(head=139, session=session, batch_size=10, prefetch_depth=4)
+    posts = take(ingestor.stream_posts(100), 40)
+
+    assert [post['block_num'] for post in posts] == list(range(100, 140))
+    assert all(post['type'] == 'comment' and post['parent_author'] == '' for post in posts)
+    assert posts[0]['permlink'] == 'post100' and posts[0]['trx_id'] == 'trx100'
+    assert sorted(tuple(batch) for batch in session.batches) == [tuple(range(start, start + 10)) for start in range(100, 140, 10)]
+    assert steem.single_calls == []
+    assert ingestor.last_scanned_block in (138, 139)  # the last post is yielded before its block is marked scanned
+    print("✓ Window ordering test passed")
+
+def test_fallback_and_rotation():
+    """A window that fails on every node is fetched with per-block calls; each failure rotates the node."""
+    print("Testing node rotation and per-block fallback...")
+    session = FakeSession(fail=True)
+    ingestor, steem = make_ingestor(head=104, session=session, batch_size=5, prefetch_depth=1)
+    posts = take(ingestor.stream_posts(100), 5)
+
+    assert [post['block_num'] for post in posts] == list(range(100, 105))
+    assert session.urls == ['https://a', 'https://b', 'https://a'], session.urls
+    assert steem.single_calls == list(range(100, 105))
+    print("✓ Node rotation and fallback test passed")
+
+def test_close_does_not_wait():
+    """Closing the stream cancels queued windows and returns while windows are still in flight."""
+    print("Testing generator shutdown...")
+    session = FakeSession()
+    session.release = threading.Event()
+    ingestor, _ = make_ingestor(head=10000, session=session, batch_size=10, prefetch_depth=3)
+    stream = ingestor.stream_posts(100)
+    assert next(stream)['block_num'] == 100  # the first window is answered, the others hang
+
+    start = time.perf_counter()
+    stream.close()
+    elapsed = time.perf_counter() - start
+    session.release.set()
+    assert elapsed < 0.5, f"close() waited {elapsed:.2f}s for windows in flight"
+    print("✓ Generator shutdown test passed")
+
+def test_concurrent_failures_rotate_once():
+    """Workers that fail on the same node at the same time move to the next node, not past it."""
+    print("Testing concurrent node rotation...")
+    client = RpcBatchClient(['https://a', 'https://b', 'https://c'])
+    barrier = threading.Barrier(8)
+
+    def fail_on(node):
+        barrier.wait()
+        client.next_node(node)
+
+    threads = [threading.Thread(target=fail_on, args=('https://a',)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert client.node == 'https://b', client.node
+
+    client.next_node()  # without a failed node, always rotate
+    assert client.node == 'https://c'
+    print("✓ Concurrent node rotation test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_windows_in_block_order()
+        test_fallback_and_rotation()
+        test_close_does_not_wait()
+        test_concurrent_failures_rotate_once()
+        print("All block ingestion tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
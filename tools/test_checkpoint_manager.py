@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for the coalesced checkpoint manager.
+Verifies interval-based flushing, atomic writes and interrupted-run resume metadata.
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from checkpointManager import CheckpointManager
+
+def read_block(path):
+    with open(path, 'r') as f:
+        return int(f.read().strip())
+
+def test_block_interval_flush():
+    """Checkpoints are only written once the block interval is reached."""
+    print("Testing block-count flush interval...")
+    with tempfile.TemporaryDirectory() as tmp:
+        block_file = os.path.join(tmp, 'last_block.txt')
+        checkpoint = CheckpointManager(block_file, flush_interval_seconds=3600, flush_interval_blocks=100)
+        checkpoint.begin_run('HISTORY', 1000)
+        assert read_block(block_file) == 1000
+
+        checkpoint.update(1050)
+        assert read_block(block_file) == 1000, "Checkpoint should not flush before the block interval"
+
+        checkpoint.update(1100)
+        assert read_block(block_file) == 1100, "Checkpoint should flush once the block interval is reached"
+        print("✓ Block-count flush interval test passed")
+
+def test_close_marks_completed():
+    """A clean close flushes the final block and marks the run as completed."""
+    print("Testing clean shutdown...")
+    with tempfile.TemporaryDirectory() as tmp:
+        block_file = os.path.join(tmp, 'last_block.txt')
+        checkpoint = CheckpointManager(block_file, flush_interval_seconds=3600, flush_interval_blocks=10000)
+        checkpoint.begin_run('RANDOM', 5000)
+        checkpoint.update(5007)
+        checkpoint.close(completed=True)
+
+        assert read_block(block_file) == 5007
+        with open(checkpoint.metadata_file, 'r') as f:
+            metadata = json.load(f)
+        assert metadata['status'] == 'completed'
+        assert metadata['last_block'] == 5007
+
+        reloaded = CheckpointManager(block_file)
+        assert reloaded.last_block == 5007
+        assert reloaded.interrupted_run('RANDOM') is None, "Completed runs must not be resumed"
+        # No leftover temp files from the atomic writes
+        assert sorted(os.listdir(tmp)) == ['last_block.json', 'last_block.txt']
+        print("✓ Clean shutdown test passed")
+
+def test_interrupted_run_resume():
+    """An interrupted run is reported for the same stream type only."""
+    print("Testing interrupted run resume...")
+    with tempfile.TemporaryDirectory() as tmp:
+        block_file = os.path.join(tmp, 'last_block.txt')
+        checkpoint = CheckpointManager(block_file, flush_interval_seconds=3600, flush_interval_blocks=10000)
+        run_id = checkpoint.begin_run('TIME_WEIGHTED_RANDOM', 7000)
+        checkpoint.update(7042)
+        checkpoint.flush()  # Simulates the flush performed on an exception, without a clean close
+
+        reloaded = CheckpointManager(block_file)
+        previous = reloaded.interrupted_run('TIME_WEIGHTED_RANDOM')
+        assert previous is not None
+        assert previous['run_id'] == run_id
+        assert previous['start_block'] == 7000
+        assert previous['last_block'] == 7042
+        assert reloaded.interrupted_run('HISTORY') is None
+
+        resumed_id = reloaded.begin_run('TIME_WEIGHTED_RANDOM', previous['start_block'], run_id=previous['run_id'], resume_block=previous['last_block'])
+        assert resumed_id == run_id
+        assert read_block(block_file) == 7042
+        print("✓ Interrupted run resume test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_block_interval_flush()
+        test_close_marks_completed()
+        test_interrupted_run_resume()
+        print("All checkpoint manager tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
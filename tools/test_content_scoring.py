@@ -12,6 +12,11 @@ fake_steem = types.ModuleType('steem')
 def fake_Steem(*args, **kwargs):
     return None
 fake_steem.Steem = fake_Steem
+# steemHelpers imports steem.blockchain, so the stub must be a package
+fake_steem.__path__ = []
+
+fake_blockchain = types.ModuleType('steem.blockchain')
+fake_blockchain.Blockchain = None
 
 fake_account = types.ModuleType('steem.account')
 def fake_Account(*args, **kwargs):
@@ -27,6 +32,7 @@ fake_post.Post = None
 sys.modules['steem'] = fake_steem
 sys.modules['steem.account'] = fake_account
 sys.modules['steem.post'] = fake_post
+sys.modules['steem.blockchain'] = fake_blockchain
 
 # also stub utils to avoid langdetect etc.
 fake_utils = types.ModuleType('utils')
@@ -64,6 +70,8 @@ class DummyAccount:
         self.last_vote_time = '2026-02-01T00:00:00'
         self.last_post = None
         self.last_root_post = None
+        self.follower_count = 0
+        self.following_count = 0
     def get_followers(self):
         return self._followers
     def get_following(self):
@@ -71,29 +79,35 @@ class DummyAccount:
     def __getitem__(self, key):
         # allow both dictionary-style and attribute-style access
         return getattr(self, key)
+    def get(self, key, default=None):
+        return getattr(self, key, default)
 
 class UnparsableAccount(DummyAccount):
     def __init__(self, author, steemd_instance=None):
         super().__init__(author, steemd_instance)
         self.created = 'not-a-date'
 
+class DummySnapshots:
+    """Stand-in for AuthorSnapshotCache that builds snapshots from a dummy account class."""
+    def __init__(self, account_class):
+        self.account_class = account_class
+    def get(self, author):
+        return self.account_class(author)
+
 
 def run_tests():
     logging.basicConfig(level=logging.DEBUG)
     print("Running content scoring author tests")
 
-    # monkeypatch Account class in module
-    import contentScoring
-    contentScoring.Account = DummyAccount
-
-    scorer = ContentScorer(None, DummyConfig())
+    # inject dummy author snapshots
+    scorer = ContentScorer(None, DummyConfig(), author_snapshots=DummySnapshots(DummyAccount))
 
     print("Test 1: created_date as ISO string with Z should not crash")
     score = scorer._score_author('anyone')
     print(f"  Score returned: {score}")
 
     # now test an unparsable created_date
-    contentScoring.Account = UnparsableAccount
+    scorer.author_snapshots = DummySnapshots(UnparsableAccount)
     print("Test 2: unparsable created_date treated gracefully (should not raise)")
     score2 = scorer._score_author('anyone')
     print(f"  Score returned for unparsable date: {score2}")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for the cross-chain activity service.
+Verifies batched lookups on both chains, caching across instances and handling of failed requests.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from crossChainActivity import CrossChainActivity, last_activity_from_account
+
+class FakeChains:
+    """Answers get_accounts requests per chain and records the requested batches."""
+
+    def __init__(self, service, accounts_by_chain):
+        self.accounts_by_chain = accounts_by_chain
+        self.batches = []
+        self.failing = set()
+        service._get_accounts = self.get_accounts
+
+    def get_accounts(self, chain, names):
+        self.batches.append((chain, list(names)))
+        if chain in self.failing:
+            return None
+        accounts = self.accounts_by_chain.get(chain, {})
+        return [dict(accounts[name], name=name) for name in names if name in accounts]
+
+ACCOUNTS = {
+    'hive': {'alice': {'last_post': '2026-01-02T10:00:00', 'last_vote_time': '2026-01-05T08:30:00'}},
+    'blurt': {'bob': {'last_post': '2025-12-01T00:00:00', 'last_vote_time': '1970-01-01T00:00:00'}},
+}
+
+def test_last_activity_parsing():
+    """The later of last post and last vote time is returned."""
+    print("Testing activity parsing...")
+    assert last_activity_from_account(ACCOUNTS['hive']['alice']) == '2026-01-05 08:30:00'
+    assert last_activity_from_account({'last_post': None}) is None
+    print("✓ Activity parsing test passed")
+
+def test_batched_and_cached_lookups():
+    """Prefetching sends one request per chain; later checks are cache hits, also after a restart."""
+    print("Testing batched and cached lookups...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'remote_activity.db')
+        service = CrossChainActivity(db_path=db_path)
+        chains = FakeChains(service, ACCOUNTS)
+
+        service.prefetch(['alice', 'bob', 'carol', 'alice'])
+        assert sorted(chain for chain, _ in chains.batches) == ['blurt', 'hive']
+        assert all(names == ['alice', 'bob', 'carol'] for _, names in chains.batches)
+
+        assert service.get_last_activity('alice', 'hive') == '2026-01-05 08:30:00'
+        assert service.get_last_activity('alice', 'blurt') is None
+        assert service.get_last_activity('bob', 'Blurt') == '2025-12-01 00:00:00'
+        assert len(chains.batches) == 2, "Cached accounts must not be requested again"
+
+        restarted = CrossChainActivity(db_path=db_path)
+        restarted_chains = FakeChains(restarted, ACCOUNTS)
+        assert restarted.get_last_activity('bob', 'blurt') == '2025-12-01 00:00:00'
+        assert restarted_chains.batches == []
+        print("✓ Batched and cached lookup test passed")
+
+def test_failed_requests_are_not_cached():
+    """A failed chain request returns None and is retried on the next lookup."""
+    print("Testing failed requests...")
+    service = CrossChainActivity(db_path=None)
+    chains = FakeChains(service, ACCOUNTS)
+    chains.failing.add('hive')
+
+    assert service.get_last_activity('alice', 'hive') is None
+    chains.failing.clear()
+    assert service.get_last_activity('alice', 'hive') == '2026-01-05 08:30:00'
+    assert ('blurt', ['alice']) in chains.batches
+    assert chains.batches.count(('blurt', ['alice'])) == 1, "The successful Blurt lookup should be cached"
+    print("✓ Failed request test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_last_activity_parsing()
+        test_batched_and_cached_lookups()
+        test_failed_requests_are_not_cached()
+        print("All cross-chain activity tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script for parallel LLM curation.
+Verifies that curations run concurrently within the per-model limits, that results are
+resolved in submission order, and that the acceptance rate is learned and persisted.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from curationPool import CurationPool, parse_model_concurrency
+
+class SlowCurator:
+    """Fake LLM call that records how many calls run at the same time."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, name, seconds):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(seconds)
+        with self._lock:
+            self.active -= 1
+        if name == 'broken':
+            raise RuntimeError("LLM exploded")
+        return f"review of {name}"
+
+def test_results_resolve_in_order():
+    """Later submissions may finish first, but are resolved in submission order."""
+    print("Testing ordered resolution...")
+    curator = SlowCurator()
+    pool = CurationPool(concurrency=3, stats_file=None)
+    for index, seconds in enumerate([0.3, 0.05, 0.1]):
+        pool.submit(f"post{index}", curator, f"post{index}", seconds)
+    assert pool.pending == 3
+
+    time.sleep(0.15)
+    assert list(pool.ready()) == []  # post0 is still running, so nothing is resolved yet
+    results = []
+    while pool.pending:
+        job, future = pool.next_result()
+        results.append((job, future.result()))
+    assert results == [(f"post{i}", f"review of post{i}") for i in range(3)]
+    assert curator.max_active == 3
+    assert pool.next_result() is None
+
+    pool.submit("broken", curator, "broken", 0)
+    job, future = pool.next_result()
+    try:
+        future.result()
+        assert False, "Expected the curation error"
+    except RuntimeError:
+        pass
+    pool.close()
+    print("✓ Ordered resolution test passed")
+
+def test_per_model_concurrency():
+    """Each model has its own concurrency limit."""
+    print("Testing per-model concurrency...")
+    curator = SlowCurator()
+    model = {'name': 'pro'}
+    pool = CurationPool(concurrency=3, model_concurrency={'pro': 1}, current_model=lambda: model['name'], stats_file=None)
+    assert pool.max_pending == 6
+
+    for index in range(3):
+        pool.submit(index, curator, f"post{index}", 0.05)
+    while pool.pending:
+        pool.next_result()
+    assert curator.max_active == 1
+
+    model['name'] = 'flash'
+    for index in range(3):
+        pool.submit(index, curator, f"post{index}", 0.05)
+    while pool.pending:
+        pool.next_result()
+    assert curator.max_active == 3
+    pool.close()
+
+    assert parse_model_concurrency('gemini-2.5-pro:1, gemini-2.5-flash : 4, bad, x:y') == {'gemini-2.5-pro': 1, 'gemini-2.5-flash': 4}
+    print("✓ Per-model concurrency test passed")
+
+def test_acceptance_rate_is_persisted():
+    """The acceptance rate drives the expected yield of pending curations and survives restarts."""
+    print("Testing acceptance rate...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stats_file = os.path.join(tmp_dir, 'curation_stats.json')
+        pool = CurationPool(concurrency=2, stats_file=stats_file)
+        assert pool.acceptance_rate() == 0.5  # no history yet
+        for accepted in [True, False, False, False, False, False, False, False]:
+            pool.record_outcome(accepted)
+        assert abs(pool.acceptance_rate() - 0.2) < 1e-9  # (1 + 1) / (8 + 2)
+
+        event = threading.Event()
+        for index in range(4):
+            pool.submit(index, event.wait, 5)
+        assert pool.full
+        assert abs(pool.expected_accepted() - 0.8) < 1e-9
+        event.set()
+        pool.close()
+        assert pool.pending == 0
+
+        reloaded = CurationPool(stats_file=stats_file)
+        assert reloaded.statistics() == {'evaluations': 8.0, 'accepted': 1.0}
+        reloaded.close()
+
+        with open(stats_file, 'w', encoding='utf-8') as f:
+            f.write("not json")
+        assert CurationPool(stats_file=stats_file).acceptance_rate() == 0.5
+    print("✓ Acceptance rate test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_results_resolve_in_order()
+        test_per_model_concurrency()
+        test_acceptance_rate_is_persisted()
+        print("All curation pool tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the file-backed account set registry.
+Verifies that list files are parsed once, reloaded when they change and that missing files are empty.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import fileSets
+from fileSets import FileSetRegistry, normalize_account
+
+def test_load_once_and_reload_on_change():
+    """A file is read once and read again only after it changes."""
+    print("Testing load and reload...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'whitelist.txt')
+        with open(path, 'w') as f:
+            f.write("alice\n\n  bob  \n")
+
+        registry = FileSetRegistry(check_interval=0)
+        reads = []
+        original_read = FileSetRegistry._read
+        registry._read = lambda p, normalize: reads.append(p) or original_read(p, normalize)
+
+        assert registry.get(path) == {'alice', 'bob'}
+        assert registry.contains(path, 'bob')
+        assert len(reads) == 1, "An unchanged file should not be read again"
+
+        with open(path, 'a') as f:
+            f.write("carol\n")
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+        assert registry.contains(path, 'carol')
+        assert len(reads) == 2
+        print("✓ Load and reload test passed")
+
+def test_normalization_and_missing_files():
+    """Delegatee lists are normalized, and missing files behave like empty lists."""
+    print("Testing normalization and missing files...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'delegatees.txt')
+        with open(path, 'w') as f:
+            f.write("@Alice\nbob\n")
+
+        registry = FileSetRegistry()
+        assert registry.get(path, normalize_account) == {'alice', 'bob'}
+        assert registry.get(path) == {'@Alice', 'bob'}, "Each normalization is cached separately"
+        assert registry.get(os.path.join(tmp, 'missing.txt')) == frozenset()
+        assert isinstance(fileSets.file_sets, FileSetRegistry)
+        print("✓ Normalization and missing file test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_load_once_and_reload_on_change()
+        test_normalization_and_missing_files()
+        print("All file set tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
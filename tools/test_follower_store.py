@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent follower list store.
+Verifies TTL handling, count-based revalidation, persistence across instances and cleanup.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from followerStore import FollowerStore
+
+class FakeFollowerApi:
+    """Counts full downloads and follower count lookups."""
+
+    def __init__(self, followers):
+        self.followers = followers
+        self.downloads = 0
+        self.count_calls = 0
+
+    def fetch_all(self):
+        self.downloads += 1
+        return [{'follower': name, 'following': 'alice', 'what': ['blog']} for name in self.followers]
+
+    def fetch_count(self):
+        self.count_calls += 1
+        return len(self.followers)
+
+def test_reuse_within_ttl():
+    """A stored list is reused without any API call while it is fresh, also from a new instance."""
+    print("Testing reuse within TTL...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'followers.db')
+        api = FakeFollowerApi(['bob', 'carol'])
+        store = FollowerStore(db_path=db_path, ttl_hours=24)
+        first = store.get_followers('alice', 'blog', api.fetch_all, api.fetch_count)
+        again = FollowerStore(db_path=db_path, ttl_hours=24).get_followers('alice', 'blog', api.fetch_all, api.fetch_count)
+        assert first == again
+        assert api.downloads == 1
+        assert api.count_calls == 1
+        print("✓ Reuse within TTL test passed")
+
+def test_revalidation_by_follower_count():
+    """After the TTL, the list is only downloaded again if the follower count changed."""
+    print("Testing follower count revalidation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        api = FakeFollowerApi(['bob', 'carol'])
+        store = FollowerStore(db_path=os.path.join(tmp, 'followers.db'), ttl_hours=0)
+        store.get_followers('alice', 'blog', api.fetch_all, api.fetch_count)
+
+        store.get_followers('alice', 'blog', api.fetch_all, api.fetch_count)
+        assert api.downloads == 1, "Unchanged follower count should not trigger a download"
+
+        api.followers.append('dave')
+        followers = store.get_followers('alice', 'blog', api.fetch_all, api.fetch_count)
+        assert api.downloads == 2, "Changed follower count should trigger a download"
+        assert [f['follower'] for f in followers] == ['bob', 'carol', 'dave']
+        print("✓ Follower count revalidation test passed")
+
+def test_cleanup_old_records():
+    """Lists that were not refreshed within the retention period are deleted."""
+    print("Testing cleanup...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'followers.db')
+        api = FakeFollowerApi(['bob', 'carol'])
+        store = FollowerStore(db_path=db_path, ttl_hours=24)
+        store.get_followers('alice', 'blog', api.fetch_all, api.fetch_count)
+
+        store.cleanup_old_records(retain_days=1)
+        FollowerStore(db_path=db_path, ttl_hours=24).get_followers('alice', 'blog', api.fetch_all, api.fetch_count)
+        assert api.downloads == 1, "A fresh list should survive the cleanup"
+
+        # A negative retention period puts the cutoff in the future, so every list is old
+        store.cleanup_old_records(retain_days=-1)
+        store.get_followers('alice', 'blog', api.fetch_all, api.fetch_count)
+        assert api.downloads == 2, "A deleted list should be downloaded again"
+        print("✓ Cleanup test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_reuse_within_ttl()
+        test_revalidation_by_follower_count()
+        test_cleanup_old_records()
+        print("All follower store tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
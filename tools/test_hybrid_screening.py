@@ -96,6 +96,7 @@ def create_mock_config():
     mock_config.get = Mock(side_effect=lambda section, key, fallback='': {
         ('CONTENT', 'LANGUAGE'): 'en',
         ('BLOG', 'MIN_CURATION_TIER'): 'fair',
+        ('SCREENING', 'RULE_STATS_FILE'): '',
     }.get((section, key), fallback))
     return mock_config
 
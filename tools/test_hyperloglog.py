@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the HyperLogLog-based feed reach estimator.
+Verifies exact counting for small audiences and the accuracy of merged sketches.
+"""
+
+import sys
+import os
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from accountIds import AccountInterner
+from hyperLogLog import HyperLogLog, ReachSketch
+
+# A private interning table keeps these tests independent of the shared one
+interner = AccountInterner()
+
+def test_exact_mode_for_small_inputs():
+    """Small audiences are counted exactly, like the previous set union."""
+    print("Testing exact mode...")
+    reach = ReachSketch(exact_limit=1000, interner=interner)
+    author_followers = {f'user{i}' for i in range(300)}
+    resteem_followers = ReachSketch(exact_limit=1000, interner=interner)
+    resteem_followers.update({f'user{i}' for i in range(200, 600)})
+    community = {'user5', 'member1', 'member2'}
+
+    reach.update(author_followers)
+    reach.update(resteem_followers)
+    reach.update(community)
+    assert reach.is_exact
+    assert reach.count() == len(author_followers | {f'user{i}' for i in range(200, 600)} | community) == 602
+    print("✓ Exact mode test passed")
+
+def test_sketch_accuracy():
+    """Large, overlapping audiences are estimated within a few percent."""
+    print("Testing sketch accuracy...")
+    reach = ReachSketch(exact_limit=1000, interner=interner)
+    reach.update(f'user{i}' for i in range(0, 60000))
+    resteemer = ReachSketch(exact_limit=1000, interner=interner)
+    resteemer.update(f'user{i}' for i in range(40000, 100000))
+    reach.update(resteemer)
+    reach.update({'user1', 'newmember'})
+
+    assert not reach.is_exact
+    estimate = reach.count()
+    error = abs(estimate - 100001) / 100001
+    assert error < 0.05, f"Estimate {estimate} is {error:.1%} off"
+    assert len(reach.hll.to_bytes()) == 4096
+    print(f"✓ Sketch accuracy test passed (estimate {estimate}, error {error:.2%})")
+
+def test_serialization_and_merge():
+    """Sketches survive a round trip through bytes and merge like a set union."""
+    print("Testing serialization and merge...")
+    a = HyperLogLog()
+    a.update(f'a{i}' for i in range(5000))
+    b = HyperLogLog.from_bytes(a.to_bytes())
+    assert b.count() == a.count()
+
+    c = HyperLogLog()
+    c.update(f'a{i}' for i in range(2500, 7500))
+    b.merge(c)
+    assert abs(b.count() - 7500) / 7500 < 0.05
+    print("✓ Serialization and merge test passed")
+
+def test_id_sketch_accuracy():
+    """Sketches built from interned IDs (vectorized) are as accurate as name sketches."""
+    print("Testing ID sketch accuracy...")
+    ids = interner.ids_of(f'idacct{i}' for i in range(50000))
+    sketch = HyperLogLog()
+    sketch.update_ids(ids)
+    sketch.update_ids(ids[:1000])  # duplicates do not change the estimate
+    error = abs(sketch.count() - 50000) / 50000
+    assert error < 0.05, f"Estimate {sketch.count()} is {error:.1%} off"
+    print("✓ ID sketch accuracy test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_exact_mode_for_small_inputs()
+        test_sketch_accuracy()
+        test_serialization_and_merge()
+        test_id_sketch_accuracy()
+        print("All HyperLogLog tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -186,6 +186,26 @@ def test_whitespace_handling():
     print("  PASSED")
 
 
+def test_concurrent_rate_limits():
+    """Test that callers rate limited on the same model switch only once."""
+    print("\n=== Test: Concurrent rate limits ===")
+    
+    mm = ModelManager("model-1,model-2,model-3")
+    
+    # Two concurrent calls on model-1 are both rate limited
+    assert mm.mark_rate_limited(model="model-1") == True
+    assert mm.current_model == "model-2"
+    # The second caller retries with model-2 instead of skipping it
+    assert mm.mark_rate_limited(model="model-1") == True
+    assert mm.current_model == "model-2"
+    assert mm.rate_limited_models == ["model-1"]
+    
+    assert mm.mark_rate_limited(dry_run=True, model="model-1") == False
+    
+    print(f"  + Switched once to {mm.current_model}")
+    print("  PASSED")
+
+
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("Integration Tests: Model Switching")
@@ -199,6 +219,7 @@ if __name__ == "__main__":
         test_single_model()
         test_get_models_used()
         test_whitespace_handling()
+        test_concurrent_rate_limits()
         
         print("\n" + "="*60)
         print("+ ALL INTEGRATION TESTS PASSED")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test script for latency instrumentation.
+Verifies histogram percentiles, the stage report and JSON dump of StatsTracker, and
+that RPC calls of a Steem instance are recorded per method.
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+import types
+
+# create fake steem package and submodules so tests don't require the real dependency
+fake_steem = types.ModuleType('steem')
+fake_steem.Steem = lambda *args, **kwargs: None
+fake_blockchain = types.ModuleType('steem.blockchain')
+fake_blockchain.Blockchain = None
+sys.modules.setdefault('steem', fake_steem)
+sys.modules.setdefault('steem.blockchain', fake_blockchain)
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from latencyHistogram import LatencyHistogram
+from statsTracker import StatsTracker
+from steemHelpers import instrument_rpc
+
+def test_histogram_percentiles():
+    """Percentiles are within one bucket width of the exact values."""
+    print("Testing histogram percentiles...")
+    rng = random.Random(7)
+    values = [rng.lognormvariate(3, 1.5) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    for q in (0.50, 0.95, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        estimate = histogram.quantile(q)
+        assert abs(estimate - exact) / exact < 0.13, f"p{int(q * 100)}: {estimate} vs {exact}"
+    assert histogram.count == len(values)
+    assert histogram.min == values[0] and histogram.max == values[-1]
+    assert len(histogram.buckets) == len(LatencyHistogram().buckets)
+
+    # Extreme values land in the underflow/overflow buckets
+    edge = LatencyHistogram()
+    edge.record(0.0)
+    edge.record(1e9)
+    assert edge.buckets[0] == 1 and edge.buckets[-1] == 1
+    assert edge.quantile(1.0) == 1e9
+    print("✓ Histogram percentile test passed")
+
+def test_stats_tracker_report_and_json():
+    """Stages appear in the report with percentiles and in the JSON dump."""
+    print("Testing stats tracker report...")
+    tracker = StatsTracker()
+    for ms in range(1, 101):
+        tracker.track_timing('rule.dmca', ms / 1000.0)
+    with tracker.timed('llm.curate'):
+        pass
+
+    report = tracker.generate_report()
+    assert "rule.dmca: Calls: 100" in report
+    assert "p95:" in report and "p99:" in report
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'run_stats.json')
+        tracker.save_json(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    dmca = data['timings']['rule.dmca']
+    assert dmca['count'] == 100
+    assert 45 <= dmca['p50_ms'] <= 56, dmca['p50_ms']
+    assert sum(dmca['buckets'].values()) == 100
+    assert data['timings']['llm.curate']['count'] == 1
+    print("✓ Stats tracker report test passed")
+
+def test_rpc_instrumentation():
+    """Each RPC call is recorded once under its method name, also if call() uses exec()."""
+    print("Testing RPC instrumentation...")
+
+    class FakeSteemd:
+        def exec(self, name, *args, api=None):
+            return [name, list(args)]
+
+        def call(self, name, *args, **kwargs):
+            return self.exec(name, *args, **kwargs)
+
+    steem = types.SimpleNamespace(steemd=FakeSteemd())
+    tracker = StatsTracker()
+    instrument_rpc(steem, tracker)
+
+    assert steem.steemd.call('get_accounts', ['alice'], api='condenser_api') == ['get_accounts', [['alice']]]
+    steem.steemd.exec('get_block', 1)
+    assert tracker.timings['rpc.get_accounts'].count == 1
+    assert tracker.timings['rpc.get_block'].count == 1
+    print("✓ RPC instrumentation test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_histogram_percentiles()
+        test_stats_tracker_report_and_json()
+        test_rpc_instrumentation()
+        print("All latency instrumentation tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test script for the LLM response cache.
+Verifies the cache key components, TTL expiry, least-recently-used eviction, that
+the cache survives a restart, and that aicurate fills a new cache and reuses it.
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+
+import requests
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import llmCache
+import llmTransport
+from llmCache import LlmResponseCache, cache_key
+
+def test_cache_key():
+    """Whitespace changes hit the same entry; model, prompt, language and content changes don't."""
+    print("Testing cache keys...")
+    base = cache_key('gemini-2.5-pro', 'system', 'user', 'English', 'A post\n\nabout  bees.')
+    assert cache_key('gemini-2.5-pro', 'system', 'user', 'English', '  A post about bees. ') == base
+    assert cache_key('gemini-2.5-flash', 'system', 'user', 'English', 'A post about bees.') != base
+    assert cache_key('gemini-2.5-pro', 'system v2', 'user', 'English', 'A post about bees.') != base
+    assert cache_key('gemini-2.5-pro', 'system', 'user v2', 'English', 'A post about bees.') != base
+    assert cache_key('gemini-2.5-pro', 'system', 'user', 'German', 'A post about bees.') != base
+    assert cache_key('gemini-2.5-pro', 'system', 'user', 'English', 'A post about wasps.') != base
+    # Composed and decomposed Unicode forms are the same text
+    assert cache_key('m', 's', 'u', 'English', 'caf\u00e9') == cache_key('m', 's', 'u', 'English', 'cafe\u0301')
+    print("✓ Cache key test passed")
+
+def test_store_expire_and_reload():
+    """Responses are persisted, counted as hits and misses, and expire after the TTL."""
+    print("Testing storage and expiry...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'llm_cache.db')
+        cache = LlmResponseCache(db_path, ttl_days=1)
+        assert cache.get('a') is None
+        cache.put('a', 'model', 'DO NOT CURATE')
+        assert cache.get('a') == 'DO NOT CURATE'
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        reloaded = LlmResponseCache(db_path, ttl_days=1)
+        assert reloaded.get('a') == 'DO NOT CURATE'
+
+        expiring = LlmResponseCache(db_path, ttl_days=0.1 / 86400)
+        time.sleep(0.15)
+        assert expiring.get('a') is None
+        assert len(expiring) == 0
+    print("✓ Storage and expiry test passed")
+
+def test_lru_eviction():
+    """Above max_entries, the least recently used responses are evicted."""
+    print("Testing eviction...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = LlmResponseCache(os.path.join(tmp_dir, 'llm_cache.db'), max_entries=3)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, 'model', f'response {key}')
+            time.sleep(0.01)
+        assert cache.get('a') == 'response a'  # 'a' is now the most recently used
+        time.sleep(0.01)
+        cache.put('d', 'model', 'response d')
+        assert len(cache) == 3
+        assert cache.get('b') is None
+        assert cache.get('a') == 'response a'
+        assert cache.get('d') == 'response d'
+    print("✓ Eviction test passed")
+
+def test_unavailable_database():
+    """An unusable database disables the cache instead of failing curation."""
+    print("Testing unavailable database...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = LlmResponseCache(tmp_dir)  # a directory is not a database file
+        cache.put('a', 'model', 'response')
+        assert cache.get('a') is None
+        assert len(cache) == 0
+    print("✓ Unavailable database test passed")
+
+class CountingTransport:
+    """Stands in for LlmTransport and answers every POST with the same completion."""
+
+    def __init__(self, content):
+        self.content = content
+        self.requests = 0
+
+    def post(self, url, headers=None, data=None):
+        self.requests += 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({'choices': [{'message': {'content': self.content}}]}).encode('utf-8')
+        return response
+
+def test_aicurate_fills_empty_cache():
+    """Starting from an empty cache, the second identical aicurate call makes no request."""
+    print("Testing aicurate with an empty cache...")
+    report = "## Report\n" + "A well written post about bees and their habits. " * 4
+    transport = CountingTransport(report)
+    old_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.makedirs(os.path.join(tmp_dir, 'config'))
+        for name, text in (('system.txt', 'You are a curator. Answer in {language}.'), ('user.txt', 'Evaluate the article.')):
+            with open(os.path.join(tmp_dir, name), 'w', encoding='utf-8') as f:
+                f.write(text)
+        config_path = os.path.join(tmp_dir, 'config', 'config.ini')
+        with open(config_path, 'w', encoding='utf-8') as f:
+            f.write("[LLM]\n"
+                    f"SYSTEM_PROMPT_FILE = {os.path.join(tmp_dir, 'system.txt')}\n"
+                    f"USER_PROMPT_FILE = {os.path.join(tmp_dir, 'user.txt')}\n"
+                    f"LLM_CACHE_FILE = {os.path.join(tmp_dir, 'llm_cache.db')}\n"
+                    "LLM_STREAMING = False\n")
+        saved = (llmCache._llm_cache, llmTransport._llm_transport)
+        try:
+            os.chdir(tmp_dir)  # aiCurator reads config/config.ini on import
+            llmCache.config.read(config_path)
+            llmCache._llm_cache = None
+            llmTransport._llm_transport = transport
+            import aiCurator
+
+            assert llmCache.get_llm_cache() is not None, "An empty cache must not count as disabled"
+            for _ in range(2):
+                response = aiCurator.aicurate('key', 'test-model', 'http://llm.invalid/v1', 'A post about bees.', stream=False)
+                assert response == report.strip()
+            assert transport.requests == 1, f"Expected one LLM request, got {transport.requests}"
+            assert (llmCache.get_llm_cache().hits, llmCache.get_llm_cache().misses) == (1, 1)
+        finally:
+            os.chdir(old_cwd)
+            llmCache._llm_cache, llmTransport._llm_transport = saved
+    print("✓ aicurate cache test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_cache_key()
+        test_store_expire_and_reload()
+        test_lru_eviction()
+        test_unavailable_database()
+        test_aicurate_fills_empty_cache()
+        print("All LLM cache tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
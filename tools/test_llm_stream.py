@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test script for streamed LLM completions.
+Verifies incremental think-block stripping with tags split across chunks, SSE parsing,
+early termination on the rejection verdict and the stop marker, and that the
+connection is closed early against a local slow-streaming server.
+"""
+
+import sys
+import os
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from llmStream import ThinkStripper, iter_sse_data, read_streamed_completion
+from llmTransport import LlmTransport
+
+def sse_lines(pieces):
+    """OpenAI-style SSE lines for a list of content pieces."""
+    lines = []
+    for piece in pieces:
+        lines.append('data: ' + json.dumps({'choices': [{'delta': {'content': piece}}]}))
+        lines.append('')
+    lines += ['data: [DONE]', '']
+    return lines
+
+def test_think_stripper():
+    """Think blocks are removed even when tags are split across chunks."""
+    print("Testing incremental think stripping...")
+    text = "Intro <think>secret DO NOT CURATE</think>visible <thought>more</thought>end <b>bold</b> a<th"
+    for size in (1, 2, 3, 7, len(text)):
+        stripper = ThinkStripper()
+        output = ''.join(stripper.feed(text[i:i + size]) for i in range(0, len(text), size)) + stripper.flush()
+        assert output == "Intro visible end <b>bold</b> a<th", f"chunk size {size}: {output!r}"
+
+    stripper = ThinkStripper()
+    assert stripper.feed("answer <think>never closed") == "answer "
+    assert stripper.flush() == ""
+    print("✓ Think stripping test passed")
+
+def test_sse_parsing():
+    """Data lines are joined per event, comments are skipped and [DONE] ends the stream."""
+    print("Testing SSE parsing...")
+    lines = [': keep-alive', 'data: first', '', 'event: message', 'data: multi', 'data: line', '', 'data: [DONE]', '', 'data: after']
+    assert list(iter_sse_data(lines)) == ['first', 'multi\nline']
+    assert list(iter_sse_data(['data:{"a": 1}'])) == ['{"a": 1}']
+    print("✓ SSE parsing test passed")
+
+def test_early_termination():
+    """Reading stops at the verdict or the stop marker; verdicts inside think blocks don't count."""
+    print("Testing early termination...")
+    consumed = []
+
+    def tracked(lines):
+        for line in lines:
+            consumed.append(line)
+            yield line
+
+    pieces = ["<think>Could I say DO NOT ", "CURATE here?</think>", "The verdict: DO NOT", " CURATE", ". Reasons follow", " and follow"]
+    lines = tracked(sse_lines(pieces))
+    raw, text, stopped_by = read_streamed_completion(lines, stop_markers=['END_OF_CURATION_REPORT'], verdicts=['DO NOT CURATE'])
+    assert stopped_by == 'DO NOT CURATE'
+    assert text == "The verdict: DO NOT CURATE"
+    assert raw.startswith("<think>Could I")
+    assert len(consumed) < len(sse_lines(pieces)) - 4, "Expected the stream to be closed early"
+    assert lines.gi_frame is None  # the generator was closed
+
+    raw, text, stopped_by = read_streamed_completion(sse_lines(["## Report\nGreat post.\nEND_OF_CUR", "ATION_REPORT trailing"]),
+                                                     stop_markers=['END_OF_CURATION_REPORT'], verdicts=['DO NOT CURATE'])
+    assert (text, stopped_by) == ("## Report\nGreat post.", 'END_OF_CURATION_REPORT')
+
+    raw, text, stopped_by = read_streamed_completion(sse_lines(["Complete ", "report."]), verdicts=['DO NOT CURATE'])
+    assert (text, stopped_by) == ("Complete report.", None)
+
+    try:
+        read_streamed_completion(['data: {"error": {"message": "quota"}}', ''])
+        assert False, "Expected a stream error"
+    except ValueError:
+        pass
+    print("✓ Early termination test passed")
+
+class SlowStreamHandler(BaseHTTPRequestHandler):
+    """Streams a verdict first, then keeps generating slowly (chunked transfer encoding)."""
+
+    protocol_version = 'HTTP/1.1'
+    finished = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path == '/error':
+            body = b'{"error": "rate limited"}'
+            self.send_response(429)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            for line in sse_lines(["DO NOT CURATE", " because"] + [" filler"] * 20):
+                data = (line + '\n').encode('utf-8')
+                self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+                self.wfile.flush()
+                if line:
+                    time.sleep(0.05)
+            self.wfile.write(b"0\r\n\r\n")
+            SlowStreamHandler.finished.append(True)
+        except (BrokenPipeError, ConnectionResetError):
+            SlowStreamHandler.finished.append(False)
+
+def test_connection_closed_early():
+    """Against a real server, the verdict ends the request long before the completion would."""
+    print("Testing early close against a streaming server...")
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowStreamHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    transport = LlmTransport(connect_timeout=2, read_timeout=2)
+
+    start = time.perf_counter()
+    _, text, stopped_by = read_streamed_completion(transport.stream_lines(f"{url}/stream", data='{}'), verdicts=['DO NOT CURATE'])
+    elapsed = time.perf_counter() - start
+    assert (text, stopped_by) == ("DO NOT CURATE", 'DO NOT CURATE')
+    assert elapsed < 0.5, f"Expected an early close, took {elapsed:.2f}s (full stream takes over 1s)"
+    assert transport.metrics()['total']['count'] == 1
+
+    try:
+        read_streamed_completion(transport.stream_lines(f"{url}/error", data='{}'))
+        assert False, "Expected an HTTPError"
+    except requests.exceptions.HTTPError as e:
+        assert e.response.status_code == 429 and e.response.json() == {'error': 'rate limited'}
+    transport.close()
+    server.shutdown()
+    print("✓ Early close test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_think_stripper()
+        test_sse_parsing()
+        test_early_termination()
+        test_connection_closed_early()
+        print("All LLM stream tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
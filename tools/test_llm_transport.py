@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared LLM transport.
+Runs a local HTTP server and verifies that connections are kept alive across requests,
+that time to first byte and total time are recorded, that HTTP errors surface as
+requests.HTTPError and that a hung server fails with a timeout.
+"""
+
+import sys
+import os
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from llmTransport import LlmTransport
+
+class Handler(BaseHTTPRequestHandler):
+    """Answers /ok after a delay, /slow-body with a pause mid-body, /error with 429, /hang never."""
+
+    protocol_version = 'HTTP/1.1'
+    connections = set()
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        Handler.connections.add(self.client_address)
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        if self.path == '/hang':
+            time.sleep(2)
+            return
+        if self.path == '/error':
+            self._send(429, b'{"error": "rate limited"}')
+            return
+        body = json.dumps({'choices': [{'message': {'content': request.get('prompt', '')}}]}).encode('utf-8')
+        time.sleep(0.05)
+        if self.path == '/slow-body':
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body[:5])
+            self.wfile.flush()
+            time.sleep(0.2)
+            self.wfile.write(body[5:])
+            return
+        self._send(200, body)
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def test_keep_alive_and_timing():
+    """Sequential requests reuse one connection; TTFB and total time are recorded."""
+    print("Testing keep-alive and timing...")
+    server, base_url = start_server()
+    transport = LlmTransport(connect_timeout=2, read_timeout=2)
+    Handler.connections = set()
+    for prompt in ('one', 'two', 'three'):
+        response = transport.post(f"{base_url}/ok", headers={'Content-Type': 'application/json'}, data=json.dumps({'prompt': prompt}))
+        response.raise_for_status()
+        assert response.json()['choices'][0]['message']['content'] == prompt
+    assert len(Handler.connections) == 1, f"Expected one kept-alive connection, got {len(Handler.connections)}"
+
+    response = transport.post(f"{base_url}/slow-body", data=json.dumps({'prompt': 'slow'}))
+    assert response.json()['choices'][0]['message']['content'] == 'slow'
+
+    metrics = transport.metrics()
+    assert metrics['ttfb']['count'] == 4 and metrics['total']['count'] == 4
+    # The slow body arrives ~200 ms after the headers
+    assert metrics['total']['max_ms'] - metrics['ttfb']['max_ms'] > 150
+    assert metrics['ttfb']['min_ms'] >= 40
+
+    class Tracker:
+        def __init__(self):
+            self.stages = []
+
+        def track_timing(self, stage, seconds):
+            self.stages.append(stage)
+
+    transport.stats_tracker = Tracker()
+    transport.post(f"{base_url}/ok", data='{}')
+    assert transport.stats_tracker.stages == ['llm.ttfb', 'llm.request']
+    transport.close()
+    server.shutdown()
+    print("✓ Keep-alive and timing test passed")
+
+def test_errors_and_timeouts():
+    """HTTP errors raise requests.HTTPError on raise_for_status; a hung server times out."""
+    print("Testing errors and timeouts...")
+    server, base_url = start_server()
+    transport = LlmTransport(connect_timeout=1, read_timeout=0.3)
+    response = transport.post(f"{base_url}/error", data='{}')
+    try:
+        response.raise_for_status()
+        assert False, "Expected an HTTPError"
+    except requests.exceptions.HTTPError as e:
+        assert e.response.status_code == 429
+        assert e.response.json() == {'error': 'rate limited'}
+
+    start = time.perf_counter()
+    try:
+        transport.post(f"{base_url}/hang", data='{}')
+        assert False, "Expected a timeout"
+    except requests.exceptions.RequestException:
+        pass
+    assert time.perf_counter() - start < 1.5
+
+    # Without httpx, HTTP/2 falls back to HTTP/1.1
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        assert not LlmTransport(http2=True).http2
+    transport.close()
+    server.shutdown()
+    print("✓ Errors and timeouts test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_keep_alive_and_timing()
+        test_errors_and_timeouts()
+        print("All LLM transport tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
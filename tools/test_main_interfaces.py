@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test script for the calls main.py makes into HybridScreening.
+Parses main.py and hybridScreening.py (without importing them, so it runs without the
+steem package or a config file) and verifies that every attribute main.py uses on the
+hybrid_screening instance is a method or instance attribute of HybridScreening.
+"""
+
+import sys
+import os
+import ast
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+def parse(filename):
+    with open(os.path.join(SRC_DIR, filename), 'r', encoding='utf-8') as f:
+        return ast.parse(f.read(), filename=filename)
+
+def attributes_used(tree, variable):
+    """Names of all attributes accessed as `<variable>.<name>` in the module."""
+    return {
+        node.attr for node in ast.walk(tree)
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == variable
+    }
+
+def class_members(tree, class_name):
+    """Methods, class attributes and `self.<name> = ...` attributes of a class."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            members = set()
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    members.add(item.name)
+                elif isinstance(item, ast.Assign):
+                    members.update(target.id for target in item.targets if isinstance(target, ast.Name))
+            for sub in ast.walk(node):
+                targets = sub.targets if isinstance(sub, ast.Assign) else [sub.target] if isinstance(sub, (ast.AnnAssign, ast.AugAssign)) else []
+                for target in targets:
+                    if isinstance(target, ast.Attribute) and isinstance(target.value, ast.Name) and target.value.id == 'self':
+                        members.add(target.attr)
+            return members
+    raise AssertionError(f"Class {class_name} not found")
+
+def test_hybrid_screening_calls_resolve():
+    """Every hybrid_screening.<name> in main.py exists on HybridScreening."""
+    print("Testing main.py calls into HybridScreening...")
+    used = attributes_used(parse('main.py'), 'hybrid_screening')
+    members = class_members(parse('hybridScreening.py'), 'HybridScreening')
+    assert {'should_curate', 'get_ai_analysis_intensity'} <= used, f"Unexpected main.py usage: {sorted(used)}"
+    missing = sorted(used - members)
+    assert not missing, f"main.py uses missing HybridScreening attributes: {missing}"
+    print(f"✓ All {len(used)} HybridScreening attributes used by main.py resolve")
+
+def main():
+    """Run all tests."""
+    try:
+        test_hybrid_screening_calls_resolve()
+        print("All main.py interface tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script for the compiled markup stripper.
+Verifies the golden-output corpus and compares randomly generated markup against the
+previous remove_formatting implementation.
+"""
+
+import sys
+import os
+import random
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from markupStripper import remove_formatting
+from bench_markup_stripper import load_corpus, reference_remove_formatting
+
+# Fragments that exercise every pass and their interactions
+FRAGMENTS = ['#', '# ', '## ', '*', '**', '[', ']', '(', ')', '](', '![](', '!', 'img.png',
+             '<', '>', '<b>', '</b>', '<!--', '-->', '<script>', '</script>', '<style>',
+             'word', ' ', '\n', '\r\n', 'é', '_', '.', 'x.y']
+
+def test_golden_corpus():
+    """Every corpus entry is stripped to its recorded output."""
+    print("Testing golden corpus...")
+    cases = load_corpus()
+    for case in cases:
+        actual = remove_formatting(case['input'])
+        assert actual == case['expected'], f"{case['name']}: expected {case['expected']!r}, got {actual!r}"
+    print(f"✓ Golden corpus test passed ({len(cases)} cases)")
+
+def test_matches_previous_implementation():
+    """Random markup soup produces exactly the output of the previous implementation."""
+    print("Testing against the previous implementation...")
+    rng = random.Random(1234)
+    for _ in range(5000):
+        text = ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 40)))
+        expected = reference_remove_formatting(text)
+        actual = remove_formatting(text)
+        assert actual == expected, f"Input {text!r}: expected {expected!r}, got {actual!r}"
+    print("✓ Previous implementation comparison passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_golden_corpus()
+        test_matches_previous_implementation()
+        print("All markup stripper tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for the PostView wrapper.
+Verifies that json_metadata is decoded once and that tag-based validators read the cached tags.
+"""
+
+import sys
+import os
+import json
+import types
+
+# create fake steem package and submodules so tests don't require the real dependency
+fake_steem = types.ModuleType('steem')
+fake_steem.Steem = lambda *args, **kwargs: None
+fake_blockchain = types.ModuleType('steem.blockchain')
+fake_blockchain.Blockchain = None
+sys.modules.setdefault('steem', fake_steem)
+sys.modules.setdefault('steem.blockchain', fake_blockchain)
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import postView
+from postView import PostView
+
+def test_metadata_parsed_once():
+    """Metadata and tags are decoded on first use and then cached."""
+    print("Testing cached metadata...")
+    calls = []
+    original_loads = json.loads
+    postView.json.loads = lambda raw: calls.append(raw) or original_loads(raw)
+    try:
+        post = PostView({'author': 'alice', 'permlink': 'p', 'category': 'life',
+                         'json_metadata': '{"tags": ["hive-1", "photo", 3]}'})
+        assert post.tags == ['hive-1', 'photo']
+        assert post.metadata['tags'][1] == 'photo'
+        assert post.tags is post.tags
+        assert len(calls) == 1, f"json_metadata decoded {len(calls)} times"
+    finally:
+        postView.json.loads = original_loads
+
+    assert PostView.of(post) is post
+    body_post = PostView({'body': '# Title\n**Bold** words and a [link](https://x.y).'})
+    assert body_post.clean_body == 'Title\nBold words and a link.'
+    assert body_post.word_count == 6
+    assert post['author'] == 'alice' and isinstance(post, dict)
+    print("✓ Cached metadata test passed")
+
+def test_invalid_and_dict_metadata():
+    """Invalid metadata yields no tags; already-decoded metadata is used as is."""
+    print("Testing invalid and pre-decoded metadata...")
+    assert PostView({'json_metadata': '{not json'}).tags == []
+    assert PostView({'json_metadata': '"just a string"'}).metadata == {}
+    assert PostView({}).tags == []
+    assert PostView({'json_metadata': {'tags': ['a', 'b']}}).tags == ['a', 'b']
+    print("✓ Invalid and pre-decoded metadata test passed")
+
+def test_validators_use_view():
+    """Tag validators and the community helpers accept plain dicts and PostViews alike."""
+    print("Testing validators...")
+    import contentValidation
+    from communityValidation import get_community_category, get_community_tags
+
+    post = PostView({'author': 'alice', 'permlink': 'p', 'category': 'life',
+                     'json_metadata': '{"tags": ["hive-12345", "hive-777", "photo"]}'})
+    contentValidation.getTagBlacklist = lambda: ['nsfw']
+    assert not contentValidation.hasBlacklistedTag(post)
+    assert contentValidation.hasBlacklistedTag({'category': 'nsfw', 'json_metadata': '{broken'})
+    assert contentValidation.getTags(post) == ['hive-12345', 'hive-777', 'life', 'photo']
+    assert get_community_category(dict(post, category='')) == 'hive-12345'
+    assert get_community_tags(post) == ['hive-12345', 'hive-777']
+    print("✓ Validator test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_metadata_parsed_once()
+        test_invalid_and_dict_metadata()
+        test_validators_use_view()
+        print("All PostView tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
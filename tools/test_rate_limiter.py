@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test script for the client-side RPC rate limiter.
+Verifies that token buckets space requests at the configured rate, that node and method
+buckets are independent, and that waits are recorded as queue-wait metrics.
+"""
+
+import sys
+import os
+import types
+
+# create fake steem package and submodules so tests don't require the real dependency
+fake_steem = types.ModuleType('steem')
+fake_steem.Steem = lambda *args, **kwargs: None
+fake_blockchain = types.ModuleType('steem.blockchain')
+fake_blockchain.Blockchain = None
+sys.modules.setdefault('steem', fake_steem)
+sys.modules.setdefault('steem.blockchain', fake_blockchain)
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from rateLimiter import TokenBucket, RateLimiter, parse_method_rates
+from steemHelpers import rate_limit_rpc
+
+class FakeClock:
+    """Clock that only moves when the limiter sleeps (or the test advances it)."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+def make_limiter(**kwargs):
+    clock = FakeClock()
+    return RateLimiter(clock=clock, sleep=clock.sleep, **kwargs), clock
+
+def test_token_bucket():
+    """A full bucket allows a burst, then requests are spaced at 1/rate."""
+    print("Testing token bucket...")
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=3, clock=clock)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert abs(bucket.reserve() - 0.1) < 1e-9
+    assert abs(bucket.reserve() - 0.2) < 1e-9  # reservations queue behind each other
+    clock.now += 10
+    assert bucket.reserve() == 0.0  # refilled, but never above the burst
+    assert bucket.reserve(2) == 0.0
+    assert abs(bucket.reserve() - 0.1) < 1e-9
+    print("✓ Token bucket test passed")
+
+def test_limiter_runs_at_rate():
+    """After a burst of 10, another 100 requests against one node take 10 seconds at 10 r/s."""
+    print("Testing steady-state rate...")
+    limiter, clock = make_limiter(node_rate=10, burst=10)
+    start = clock.now
+    for _ in range(110):
+        limiter.acquire('https://a', ('get_block',))
+    assert abs((clock.now - start) - 10.0) < 1e-6, f"Expected 10s, took {clock.now - start}"
+
+    # Another node has its own bucket
+    waited = limiter.acquire('https://b', ('get_block',))
+    assert waited == 0.0
+
+    metrics = limiter.metrics()
+    assert metrics['https://a']['count'] == 110
+    assert 9900 < metrics['https://a']['total_ms'] < 10100
+    assert metrics['https://b']['count'] == 1
+    print("✓ Steady-state rate test passed")
+
+def test_method_buckets():
+    """Method limits count calls (batches take one token per call) and use short names."""
+    print("Testing method buckets...")
+    limiter, clock = make_limiter(node_rate=0, method_rates={'get_follow_count': 5})
+    assert limiter.acquire('https://a', ['condenser_api.get_follow_count'] * 5) == 0.0
+    waited = limiter.acquire('https://a', ['condenser_api.get_follow_count', 'condenser_api.get_content'])
+    assert abs(waited - 0.2) < 1e-9
+    assert limiter.acquire('https://a', ['condenser_api.get_content'] * 50) == 0.0  # unlimited method
+    assert 'https://a get_follow_count' in limiter.metrics()
+
+    unlimited, _ = make_limiter(node_rate=0)
+    assert not unlimited.enabled
+    assert unlimited.acquire('https://a', ('get_block',)) == 0.0
+    assert unlimited.metrics() == {}
+
+    assert parse_method_rates('get_block:20, get_following : 5, bad, x:y') == {'get_block': 20.0, 'get_following': 5.0}
+    print("✓ Method bucket test passed")
+
+def test_stats_tracker_receives_waits():
+    """Waits are reported to the StatsTracker as rate_limit_wait.<bucket>."""
+    print("Testing stats tracker reporting...")
+
+    class Tracker:
+        def __init__(self):
+            self.timings = []
+
+        def track_timing(self, stage, seconds):
+            self.timings.append((stage, seconds))
+
+    limiter, _ = make_limiter(node_rate=1, burst=1)
+    limiter.stats_tracker = Tracker()
+    limiter.acquire('https://a')
+    limiter.acquire('https://a')
+    assert limiter.stats_tracker.timings == [('rate_limit_wait.https://a', 0.0), ('rate_limit_wait.https://a', 1.0)]
+    print("✓ Stats tracker reporting test passed")
+
+def test_client_calls_are_limited_once():
+    """A wrapped steemd client charges one token per call, even when call() uses exec()."""
+    print("Testing client wrapping...")
+
+    class FakeClient:
+        url = 'https://a'
+
+        def exec(self, name, *args):
+            return name
+
+        def call(self, name, *args):
+            return self.exec(name, *args)
+
+    limiter, clock = make_limiter(node_rate=2, burst=1)
+    client = FakeClient()
+    rate_limit_rpc(types.SimpleNamespace(steemd=client), rate_limiter=limiter)
+    assert client.call('get_block', 1) == 'get_block'
+    assert client.call('get_block', 2) == 'get_block'
+    assert clock.slept == [0.5]
+    print("✓ Client wrapping test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_token_bucket()
+        test_limiter_runs_at_rate()
+        test_method_buckets()
+        test_stats_tracker_receives_waits()
+        test_client_calls_are_limited_once()
+        print("All rate limiter tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for the cached registry ignore list.
+Verifies paged bulk loading, the disk cache and fallback behaviour on API errors.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from registryIgnoreList import RegistryIgnoreList
+
+class FakeSteem:
+    """Serves get_following pages of an ignore list like steemd (start entry included)."""
+
+    def __init__(self, ignored):
+        self.ignored = sorted(ignored)
+        self.calls = 0
+        self.fail = False
+
+    def get_following(self, account, start, follow_type, limit):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("node unavailable")
+        assert follow_type == 'ignore'
+        names = [name for name in self.ignored if name >= start][:limit]
+        return [{'follower': account, 'following': name, 'what': ['ignore']} for name in names]
+
+def test_paged_bulk_load():
+    """The whole list is loaded in pages once and then answered locally."""
+    print("Testing paged bulk load...")
+    steem = FakeSteem([f'spammer{i:03d}' for i in range(250)])
+    ignore_list = RegistryIgnoreList('registry', cache_file=None, page_size=100)
+    assert ignore_list.contains('spammer000', steem)
+    assert ignore_list.contains('spammer249', steem)
+    assert not ignore_list.contains('goodauthor', steem)
+    assert len(ignore_list.get(steem)) == 250
+    assert steem.calls == 3, f"Expected 3 page requests, got {steem.calls}"
+    print("✓ Paged bulk load test passed")
+
+def test_disk_cache_and_failures():
+    """A cached list is reused by a new instance and kept when a refresh fails."""
+    print("Testing disk cache and failure handling...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'registry_ignore.json')
+        steem = FakeSteem(['spammer'])
+        RegistryIgnoreList('registry', cache_file=cache_file).get(steem)
+
+        steem.fail = True
+        fresh = RegistryIgnoreList('registry', cache_file=cache_file)
+        assert fresh.contains('spammer', steem)
+        assert steem.calls == 1, "A fresh disk cache should not trigger a download"
+
+        stale = RegistryIgnoreList('registry', cache_file=cache_file, ttl_hours=0)
+        stale._fetch = lambda s: None
+        assert stale.contains('spammer', steem), "A stale list should be used when the refresh fails"
+
+        other = RegistryIgnoreList('otherregistry', cache_file=cache_file)
+        other._fetch = lambda s: None
+        assert other.contains('spammer', steem) is None, "The cache of another registry must not be used"
+        print("✓ Disk cache and failure handling test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_paged_bulk_load()
+        test_disk_cache_and_failures()
+        print("All registry ignore list tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
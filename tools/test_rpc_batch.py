@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test script for batched JSON-RPC reads.
+Verifies that batch responses are demultiplexed by id, that per-call errors stay with
+their call, and that concurrent calls are coalesced into few batch requests.
+"""
+
+import sys
+import os
+import threading
+import types
+
+# create fake steem package and submodules so tests don't require the real dependency
+fake_steem = types.ModuleType('steem')
+fake_steem.Steem = lambda *args, **kwargs: None
+fake_blockchain = types.ModuleType('steem.blockchain')
+fake_blockchain.Blockchain = None
+sys.modules.setdefault('steem', fake_steem)
+sys.modules.setdefault('steem.blockchain', fake_blockchain)
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from rpcBatch import RpcBatchClient, RpcBatcher, RpcError
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+class FakeSession:
+    """Answers get_content calls in reverse order; 'ghost' posts return an error entry."""
+
+    def __init__(self, fail=False):
+        self.requests = []
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def post(self, url, json=None, timeout=None):
+        with self._lock:
+            self.requests.append(json)
+        if self.fail:
+            raise ConnectionError("node unreachable")
+        entries = []
+        for call in reversed(json):
+            author = call['params'][0]
+            if author == 'ghost':
+                entries.append({'jsonrpc': '2.0', 'id': call['id'], 'error': {'message': 'not found'}})
+            else:
+                entries.append({'jsonrpc': '2.0', 'id': call['id'], 'result': {'author': author, 'method': call['method']}})
+        return FakeResponse(entries)
+
+def make_client(fail=False):
+    client = RpcBatchClient(['https://a', 'https://b'])
+    client._session = FakeSession(fail=fail)
+    return client
+
+def test_call_batch_demultiplexes():
+    """Results come back in call order, errors are raised or returned per call."""
+    print("Testing batch demultiplexing...")
+    client = make_client()
+    calls = [('condenser_api.get_content', [name, 'post']) for name in ('alice', 'bob', 'carol')]
+    results = client.call_batch(calls)
+    assert [result['author'] for result in results] == ['alice', 'bob', 'carol']
+    assert len(client._session.requests) == 1
+
+    mixed = client.call_batch([('condenser_api.get_content', ['ghost', 'x']), ('condenser_api.get_content', ['bob', 'y'])], raise_errors=False)
+    assert isinstance(mixed[0], RpcError) and mixed[1]['author'] == 'bob'
+    try:
+        client.call_batch([('condenser_api.get_content', ['ghost', 'x'])])
+        assert False, "Expected RpcError"
+    except RpcError:
+        pass
+
+    client.next_node()
+    assert client.node == 'https://b'
+    print("✓ Batch demultiplexing test passed")
+
+def test_batcher_coalesces_concurrent_calls():
+    """Calls from many threads share a few batch requests; groups stay together."""
+    print("Testing call coalescing...")
+    client = make_client()
+    batcher = RpcBatcher(client, window_seconds=0.05, max_batch_size=100)
+    results = {}
+    barrier = threading.Barrier(20)
+
+    def worker(index):
+        barrier.wait()
+        futures = batcher.submit_many([
+            ('condenser_api.get_content', [f'user{index}', 'post']),
+            ('condenser_api.get_follow_count', [f'user{index}']),
+        ])
+        results[index] = [future.result(timeout=5) for future in futures]
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(results[i][0]['author'] == f'user{i}' for i in range(20))
+    assert all(results[i][1]['method'] == 'condenser_api.get_follow_count' for i in range(20))
+    requests_sent = client._session.requests
+    assert len(requests_sent) <= 3, f"Expected the calls to be coalesced, got {len(requests_sent)} requests"
+    for request in requests_sent:
+        authors = [call['params'][0] for call in request]
+        # Both calls of a group are always in the same request
+        assert all(authors.count(author) == 2 for author in authors)
+
+    assert batcher.call('condenser_api.get_content', 'dave', 'post')['author'] == 'dave'
+    try:
+        batcher.call('condenser_api.get_content', 'ghost', 'post')
+        assert False, "Expected RpcError"
+    except RpcError:
+        pass
+    batcher.close()
+    print("✓ Call coalescing test passed")
+
+def test_batcher_respects_max_batch_size():
+    """A batch never exceeds max_batch_size calls."""
+    print("Testing batch size limit...")
+    client = make_client()
+    batcher = RpcBatcher(client, window_seconds=0.05, max_batch_size=4)
+    futures = [batcher.submit('condenser_api.get_content', [f'user{i}', 'post']) for i in range(10)]
+    assert [future.result(timeout=5)['author'] for future in futures] == [f'user{i}' for i in range(10)]
+    assert all(len(request) <= 4 for request in client._session.requests)
+    batcher.close()
+    print("✓ Batch size limit test passed")
+
+def test_transport_failure_reaches_callers():
+    """A failed request fails every call in it and rotates the node."""
+    print("Testing transport failure...")
+    client = make_client(fail=True)
+    batcher = RpcBatcher(client, window_seconds=0.0)
+    future = batcher.submit('condenser_api.get_content', ['alice', 'post'])
+    try:
+        future.result(timeout=5)
+        assert False, "Expected the transport error"
+    except ConnectionError:
+        pass
+    assert client.node == 'https://b'
+    batcher.close()
+    print("✓ Transport failure test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_call_batch_demultiplexes()
+        test_batcher_coalesces_concurrent_calls()
+        test_batcher_respects_max_batch_size()
+        test_transport_failure_reaches_callers()
+        print("All RPC batch tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
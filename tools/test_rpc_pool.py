@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Test script for the pooled Steem RPC clients.
+Verifies that instances are shared per node list and key set, that a discarded instance
+is replaced, that calls are routed to the fastest healthy node, that failing nodes
+are skipped until their cooldown ends and that concurrent calls are charged to their node.
+"""
+
+import sys
+import os
+import threading
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from rpcPool import NodeSelector, SteemPool
+
+class ApplicationError(Exception):
+    """Stands in for steembase.exceptions.RPCError."""
+
+class FakeClient:
+    """Fake steemd client: `call` goes through `exec`, nodes can be made to fail."""
+
+    def __init__(self, nodes, network):
+        self.nodes = nodes
+        self.url = nodes[0]
+        self.network = network
+
+    def exec(self, name, *args, **kwargs):
+        return self.network.request(self.url, name)
+
+    def call(self, name, *args, **kwargs):
+        return self.exec(name, *args, **kwargs)
+
+class FakeNetwork:
+    """Records which node every request reached; nodes can be made to fail."""
+
+    def __init__(self):
+        self.failing = set()
+        self.calls = []
+        self.hooks = {}
+
+    def request(self, url, name):
+        self.calls.append((url, name))
+        hook = self.hooks.get(name)
+        if hook:
+            hook(url)
+        if name == 'broadcast_transaction':
+            raise ApplicationError("duplicate transaction")
+        if url in self.failing:
+            raise ConnectionError(f"{url} is down")
+        return {'method': name}
+
+class FakeSteem:
+    def __init__(self, nodes, keys, network):
+        self.steemd = FakeClient(nodes, network)
+        self.keys = keys
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def make_pool():
+    created = []
+    network = FakeNetwork()
+
+    def factory(nodes, keys):
+        created.append((list(nodes), keys))
+        return FakeSteem(list(nodes), keys, network)
+
+    pool = SteemPool(factory, cooldown_seconds=30, probe_timeout=0, application_errors=(ApplicationError,))
+    pool.network = network
+    return pool, created
+
+def test_instances_are_shared():
+    """One instance per node list and key set."""
+    print("Testing instance sharing...")
+    pool, created = make_pool()
+    nodes = ['https://a', 'https://b']
+    first = pool.get(nodes)
+    assert pool.get(list(nodes)) is first
+    assert pool.get(nodes, keys=['5Kkey']) is not first
+    assert len(created) == 2
+
+    failing = SteemPool(lambda nodes, keys: None, probe_timeout=0)
+    assert failing.get(nodes) is None
+    print("✓ Instance sharing test passed")
+
+def test_discard_reconnects():
+    """A discarded instance is replaced on the next get(); application errors keep it."""
+    print("Testing discard...")
+    pool, created = make_pool()
+    nodes = ['https://a']
+    first = pool.get(nodes)
+    assert not pool.discard(first, ApplicationError("vote interval"))
+    assert pool.get(nodes) is first
+    assert pool.discard(first, ConnectionError("reset"))
+    second = pool.get(nodes)
+    assert second is not first and len(created) == 2
+    assert not pool.discard(first)  # already gone
+    assert pool.get(nodes) is second
+    print("✓ Discard test passed")
+
+def test_selector_ranking_and_cooldown():
+    """Nodes are ranked by EWMA latency; failed nodes wait for their cooldown."""
+    print("Testing node ranking...")
+    clock = FakeClock()
+    selector = NodeSelector(['https://a', 'https://b', 'https://c'], alpha=0.5, cooldown_seconds=30, clock=clock)
+    assert selector.best() == 'https://a'  # unmeasured nodes in configured order
+
+    selector.record_success('https://a', 0.40)
+    selector.record_success('https://b', 0.10)
+    selector.record_success('https://c', 0.20)
+    assert selector.ranked() == ['https://b', 'https://c', 'https://a']
+
+    selector.record_success('https://b', 0.50)  # EWMA: 0.5 * 0.5 + 0.5 * 0.1 = 0.3
+    assert abs(selector.latencies()['https://b'] - 0.30) < 1e-9
+    assert selector.best() == 'https://c'
+
+    selector.record_failure('https://c')
+    assert selector.best() == 'https://b'
+    clock.now += 31
+    assert selector.best() == 'https://c'
+
+    # Consecutive failures double the cooldown (30s, 60s, 120s)
+    selector.record_failure('https://c')
+    selector.record_failure('https://c')
+    clock.now += 61
+    assert not selector.is_healthy('https://c')
+    clock.now += 60
+    assert selector.is_healthy('https://c')
+    print("✓ Node ranking test passed")
+
+def test_calls_are_routed_with_failover():
+    """Calls go to the best node, move away from a failing one and ignore application errors."""
+    print("Testing call routing...")
+    pool, created = make_pool()
+    network = pool.network
+    steem = pool.get(['https://a', 'https://b'])
+    selector = pool.selector(['https://a', 'https://b'])
+    client = steem.steemd
+
+    selector.record_success('https://a', 0.5)
+    selector.record_success('https://b', 0.1)
+    assert client.call('get_block', 1) == {'method': 'get_block'}
+    assert network.calls[-1] == ('https://b', 'get_block')
+    assert len(network.calls) == 1  # call() -> exec() is routed once
+    assert created[-1] == (['https://b'], None), "The node gets its own client"
+    assert client.url == 'https://a', "The shared client's node is never switched"
+
+    network.failing.add('https://b')
+    try:
+        client.call('get_accounts', ['alice'])
+        assert False, "Expected the failing node to raise"
+    except ConnectionError:
+        pass
+    assert not selector.is_healthy('https://b')
+    client.call('get_accounts', ['alice'])
+    assert network.calls[-1] == ('https://a', 'get_accounts')
+
+    try:
+        client.call('broadcast_transaction', {})
+    except ApplicationError:
+        pass
+    assert selector.is_healthy('https://a')
+    assert len(created) == 3, "Per-node clients are reused"
+    print("✓ Call routing test passed")
+
+def test_concurrent_calls_keep_their_node():
+    """A call in flight is not moved to another node when a second thread picks a different one."""
+    print("Testing concurrent routing...")
+    pool, _ = make_pool()
+    network = pool.network
+    client = pool.get(['https://a', 'https://b']).steemd
+    selector = pool.selector(['https://a', 'https://b'])
+    selector.record_success('https://a', 0.1)
+    selector.record_success('https://b', 0.5)
+
+    in_flight, release = threading.Event(), threading.Event()
+
+    def slow(url):
+        in_flight.set()
+        release.wait(5)
+
+    network.hooks['get_block'] = slow
+    worker = threading.Thread(target=client.call, args=('get_block', 1))
+    worker.start()
+    assert in_flight.wait(5)
+
+    # While the slow call is in flight on a, the next call is routed to b
+    selector.record_success('https://a', 2.0)
+    latencies = selector.latencies()
+    client.call('get_accounts', ['alice'])
+    release.set()
+    worker.join(5)
+
+    assert ('https://a', 'get_block') in network.calls
+    assert ('https://b', 'get_accounts') in network.calls
+    after = selector.latencies()
+    assert after['https://a'] != latencies['https://a'], "The slow call was charged to a"
+    assert after['https://b'] != latencies['https://b'], "The second call was charged to b"
+    print("✓ Concurrent routing test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_instances_are_shared()
+        test_discard_reconnects()
+        test_selector_ranking_and_cooldown()
+        test_calls_are_routed_with_failover()
+        test_concurrent_calls_keep_their_node()
+        print("All RPC pool tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
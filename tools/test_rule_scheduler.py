@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for adaptive rule ordering.
+Verifies that groups keep their default order until enough samples exist, are then
+ordered by rejection rate per unit of cost, and that statistics survive a restart and
+concurrent saves.
+"""
+
+import sys
+import os
+import logging
+import tempfile
+import threading
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ruleScheduler import RuleScheduler
+
+GROUPS = {
+    'local': ['slow_rare', 'cheap_common', 'cheap_rare'],
+    'network': ['remote'],
+}
+
+def feed(scheduler, samples):
+    """Record `samples` evaluations with fixed costs and rejection rates per rule."""
+    profiles = {
+        'slow_rare': (0.050, 0.05),
+        'cheap_common': (0.001, 0.50),
+        'cheap_rare': (0.001, 0.05),
+        'remote': (0.200, 0.10),
+    }
+    for i in range(samples):
+        for rule, (seconds, rate) in profiles.items():
+            rejected = (i % 100) < rate * 100
+            scheduler.record(rule, seconds, rejected)
+
+def test_default_order_before_min_samples():
+    """Without enough samples the default order is kept."""
+    print("Testing default order...")
+    scheduler = RuleScheduler(GROUPS, stats_file=None, min_samples=50, reorder_interval=10)
+    feed(scheduler, 20)
+    assert scheduler.order('local') == GROUPS['local']
+    print("✓ Default order test passed")
+
+def test_reorders_by_rejection_per_cost():
+    """Cheap, frequently rejecting rules move to the front."""
+    print("Testing reordering...")
+    scheduler = RuleScheduler(GROUPS, stats_file=None, min_samples=50, reorder_interval=10)
+    feed(scheduler, 100)
+    assert scheduler.order('local') == ['cheap_common', 'cheap_rare', 'slow_rare'], scheduler.order('local')
+    assert scheduler.order('network') == ['remote']
+    print("✓ Reordering test passed")
+
+def test_statistics_are_persisted():
+    """A new scheduler starts with the order learned by the previous one."""
+    print("Testing persistence...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stats_file = os.path.join(tmp_dir, 'rule_stats.json')
+        scheduler = RuleScheduler(GROUPS, stats_file=stats_file, min_samples=50, reorder_interval=10)
+        feed(scheduler, 100)
+        scheduler.save()
+
+        restored = RuleScheduler(GROUPS, stats_file=stats_file, min_samples=50)
+        assert restored.order('local') == ['cheap_common', 'cheap_rare', 'slow_rare']
+        assert restored.statistics()['cheap_common']['evaluations'] == 100
+
+        # Statistics of rules that no longer exist are ignored
+        renamed = RuleScheduler({'local': ['new_rule']}, stats_file=stats_file)
+        assert renamed.statistics() == {'new_rule': {'evaluations': 0, 'rejections': 0, 'seconds': 0.0}}
+    print("✓ Persistence test passed")
+
+def test_concurrent_saves():
+    """Worker threads saving at the same time don't collide in the temporary file."""
+    print("Testing concurrent saves...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        stats_file = os.path.join(tmp_dir, 'rule_stats.json')
+        scheduler = RuleScheduler(GROUPS, stats_file=stats_file, min_samples=50, reorder_interval=10)
+        feed(scheduler, 10)
+        warnings = []
+        handler = logging.Handler(level=logging.WARNING)
+        handler.emit = warnings.append
+        logging.getLogger('ruleScheduler').addHandler(handler)
+        try:
+            def worker():
+                for _ in range(25):
+                    scheduler.save()
+
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            logging.getLogger('ruleScheduler').removeHandler(handler)
+
+        assert not warnings, f"Concurrent saves failed: {warnings[0].getMessage()}"
+        restored = RuleScheduler(GROUPS, stats_file=stats_file)
+        assert restored.statistics()['remote']['evaluations'] == 10
+    print("✓ Concurrent save test passed")
+
+def test_non_adaptive_keeps_default_order():
+    """With adaptive=False the default order is always used."""
+    print("Testing non-adaptive mode...")
+    scheduler = RuleScheduler(GROUPS, stats_file=None, adaptive=False, min_samples=50, reorder_interval=10)
+    feed(scheduler, 100)
+    assert scheduler.order('local') == GROUPS['local']
+    print("✓ Non-adaptive test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_default_order_before_min_samples()
+        test_reorders_by_rejection_per_cost()
+        test_statistics_are_persisted()
+        test_concurrent_saves()
+        test_non_adaptive_keeps_default_order()
+        print("All rule scheduler tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
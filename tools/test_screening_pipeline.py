@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for the concurrent screening pipeline.
+Verifies that results are yielded in block order, that the per-author post limit is
+re-applied at merge time and that statistics are only recorded for consumed results.
+"""
+
+import sys
+import os
+import time
+import random
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from screeningPipeline import ScreeningPipeline
+
+class FakeScreening:
+    """Minimal stand-in for HybridScreening with variable screening latency."""
+
+    def __init__(self):
+        self.tracked = []
+
+    def screen_content(self, post_data, latest_content=None, included_posts=None, track_stats=True):
+        time.sleep(random.uniform(0.0, 0.02))
+        if post_data['author'] == 'broken':
+            raise RuntimeError("node timeout")
+        result = {'status': 'accepted', 'reason': 'ok', 'rule_type': 'score', 'score_result': None}
+        if track_stats:
+            self.track_result(result)
+        return result
+
+    def error_result(self, error):
+        return {'status': 'error', 'reason': f'screening_error: {error}', 'rule_type': 'hybrid', 'score_result': None}
+
+    def track_result(self, screening_result):
+        self.tracked.append(screening_result['status'])
+
+    def enforce_post_limit(self, post_data, screening_result, included_posts):
+        if screening_result['status'] in ('rejected', 'error'):
+            return screening_result
+        if any(p['author'] == post_data['author'] for p in included_posts):
+            return {'status': 'rejected', 'reason': 'max_posts_per_author_reached', 'rule_type': 'author_post_limit', 'score_result': None}
+        return screening_result
+
+def make_operations():
+    operations = []
+    for block_num in range(100, 140):
+        operations.append({'type': 'comment', 'parent_author': '', 'author': f'author{block_num % 7}',
+                           'permlink': f'post-{block_num}', 'block_num': block_num})
+        operations.append({'type': 'comment', 'parent_author': 'someone', 'author': 'replier',
+                           'permlink': f're-{block_num}', 'block_num': block_num})
+    operations[10]['author'] = 'broken'
+    return operations
+
+def test_results_in_block_order():
+    """Concurrent results come back in stream order, with replies passed through unscreened."""
+    print("Testing ordered merge...")
+    operations = make_operations()
+    pipeline = ScreeningPipeline(FakeScreening(), worker_count=8, queue_depth=16)
+    results = list(pipeline.run(operations, []))
+
+    assert [op['permlink'] for op, _ in results] == [op['permlink'] for op in operations]
+    assert all(result is None for op, result in results if op['parent_author'] != '')
+    assert results[10][1]['status'] == 'error', "Worker exceptions should become error results"
+    print("✓ Ordered merge test passed")
+
+def test_post_limit_and_stats_match_serial():
+    """Concurrent and serial screening accept the same posts and record the same statistics."""
+    print("Testing parity with serial screening...")
+    outcomes = {}
+    for worker_count in (1, 8):
+        screening = FakeScreening()
+        pipeline = ScreeningPipeline(screening, worker_count=worker_count, queue_depth=16)
+        included_posts = []
+        statuses = []
+        for operation, result in pipeline.run(make_operations(), included_posts):
+            if result is None:
+                continue
+            if worker_count == 1:
+                # The serial path relies on screen_content checking the limit itself
+                result = screening.enforce_post_limit(operation, result, included_posts)
+            statuses.append(result['status'])
+            if result['status'] == 'accepted':
+                included_posts.append(operation)
+            if len(included_posts) >= 5:
+                break
+        outcomes[worker_count] = (statuses, [p['permlink'] for p in included_posts], len(screening.tracked))
+
+    assert outcomes[1][0] == outcomes[8][0]
+    assert outcomes[1][1] == outcomes[8][1]
+    assert outcomes[1][2] == outcomes[8][2], "Speculative screenings must not be counted in the statistics"
+    print("✓ Serial parity test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_results_in_block_order()
+        test_post_limit_and_stats_match_serial()
+        print("All screening pipeline tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming score statistics.
+Verifies Welford statistics and P² quantile estimates against exact NumPy results,
+and that StatsTracker reports scores without keeping them.
+"""
+
+import sys
+import os
+import random
+
+import numpy as np
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from streamingStats import P2Quantile, RunningStats, StreamingSummary
+from statsTracker import StatsTracker
+
+def test_running_stats():
+    """Welford statistics match NumPy, also for large offsets."""
+    print("Testing running statistics...")
+    rng = random.Random(1)
+    values = [1e9 + rng.gauss(0, 1) for _ in range(10000)]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    assert stats.count == len(values)
+    assert stats.min == min(values) and stats.max == max(values)
+    assert abs(stats.mean - np.mean(values)) < 1e-4
+    assert abs(stats.std - np.std(values)) < 1e-6, (stats.std, np.std(values))
+    print("✓ Running statistics test passed")
+
+def test_p2_quantiles():
+    """P² estimates are close to the exact quantiles on skewed and uniform data."""
+    print("Testing P² quantiles...")
+    rng = random.Random(2)
+    datasets = {
+        'uniform': [rng.uniform(0, 100) for _ in range(50000)],
+        'skewed': [rng.expovariate(0.05) for _ in range(50000)],
+    }
+    for name, values in datasets.items():
+        spread = np.percentile(values, 95) - np.percentile(values, 5)
+        for q in (0.1, 0.5, 0.9):
+            estimator = P2Quantile(q)
+            for value in values:
+                estimator.add(value)
+            exact = np.percentile(values, q * 100)
+            assert abs(estimator.value - exact) < 0.02 * spread, f"{name} q={q}: {estimator.value} vs {exact}"
+
+    # Up to five observations the result is exact
+    small = P2Quantile(0.5)
+    for value in (5, 1, 4):
+        small.add(value)
+    assert small.value == 4
+    small.add(2)
+    assert small.value == np.median([5, 1, 4, 2])
+    print("✓ P² quantile test passed")
+
+def test_stats_tracker_scores():
+    """The tracker reports score statistics from the streaming summaries."""
+    print("Testing stats tracker scores...")
+    tracker = StatsTracker()
+    for score in range(1, 101):
+        tracker.track_evaluation()
+        tracker.track_acceptance(float(score), 'good')
+    tracker.track_rejection('score_rejected', score=12.5)
+
+    assert isinstance(tracker.accepted_scores, StreamingSummary)
+    summary = tracker.accepted_scores.summary()
+    assert summary['count'] == 100 and summary['min'] == 1.0 and summary['max'] == 100.0
+    assert summary['mean'] == 50.5
+    assert abs(summary['median'] - 50.5) <= 1.0
+
+    report = tracker.generate_report()
+    assert "Total Posts Accepted for Curation: 100" in report
+    assert "Score Stats (Rejected): Min: 12.5, Max: 12.5" in report
+    assert "P90:" in report
+    print("✓ Stats tracker score test passed")
+
+def main():
+    """Run all tests."""
+    try:
+        test_running_stats()
+        test_p2_quantiles()
+        test_stats_tracker_scores()
+        print("All streaming statistics tests passed! ✓")
+        return True
+    except AssertionError as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)